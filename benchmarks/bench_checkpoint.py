@@ -0,0 +1,101 @@
+# Checkpoint Benchmark
+# What a checkpoint costs the story at each choice (the snapshot handed
+# to the writer thread), how big it is on disk, and how long a relaunch
+# with --resume takes to put the saved menu back on screen.
+#
+# Usage: python benchmarks/bench_checkpoint.py [--runs 20]
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import checkpoint
+from engine import Session, play
+from headless import ScriptedPlayer
+from scenegraph import load_story
+from story import game_state
+
+MENU = b"[PLAYER CHOICE"
+
+
+class Recorder:
+    """Stands in for a Checkpointer; keeps every snapshot it is given."""
+
+    def __init__(self):
+        self.snapshots = []
+
+    def save(self, snapshot):
+        self.snapshots.append(snapshot)
+
+
+def until_menu(command):
+    """Seconds from launch until the choice menu is on stdout."""
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)  # use the scene graph cache
+    started = time.perf_counter()
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, env=env)
+    seen = b""
+    while MENU not in seen:
+        chunk = process.stdout.read1(4096)
+        if not chunk:
+            break
+        seen += chunk
+    elapsed = time.perf_counter() - started
+    process.kill()
+    process.wait()
+    process.stdout.close()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Checkpoint save and resume benchmark")
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    graph = load_story()
+    recorder = Recorder()
+    with open(os.devnull, "w") as devnull:
+        session = Session(game_state, out=devnull, checkpoints=recorder,
+                          player=ScriptedPlayer(["A", "B", "1", "2"], [1, 0] * 10))
+        play(session, graph)
+    snapshots = recorder.snapshots
+
+    # On the render path: the snapshot itself; the writer thread does the rest
+    started = time.perf_counter()
+    for _ in range(args.runs):
+        for snapshot in snapshots:
+            session.snapshot(snapshot[0], snapshot[1])
+    save = (time.perf_counter() - started) / (args.runs * len(snapshots))
+    started = time.perf_counter()
+    for _ in range(args.runs):
+        for snapshot in snapshots:
+            checkpoint.dumps(snapshot)
+    encode = (time.perf_counter() - started) / (args.runs * len(snapshots))
+    size = statistics.mean(len(checkpoint.dumps(snapshot)) for snapshot in snapshots)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "checkpoint")
+        game = [sys.executable, os.path.join(ROOT, "1_koylynn.py"), "--headless",
+                "--checkpoint", path]
+        # The last menu of the story, as far from the start as it gets
+        with open(path, "wb") as f:
+            f.write(checkpoint.dumps(snapshots[-1]))
+        resumed = [until_menu(game + ["--resume"]) for _ in range(args.runs)]
+        fresh = until_menu(game)  # plays every scene before the first menu
+
+    print(f"{len(snapshots)} checkpoints per playthrough, {size:.0f} bytes each")
+    print(f"snapshot on the render path  {save * 1e6:8.1f} us")
+    print(f"encode (writer thread)       {encode * 1e6:8.1f} us")
+    print(f"launch to last menu, resumed {statistics.median(resumed) * 1e3:8.1f} ms")
+    print(f"launch to first menu, fresh  {fresh * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
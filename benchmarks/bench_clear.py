@@ -0,0 +1,47 @@
+# Clear Screen Benchmark
+# Compares forking `clear` through os.system with writing the escape
+# sequence from a Screen.
+#
+# Usage: python benchmarks/bench_clear.py [--calls 200]
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from screen import Screen
+
+
+def fork_clear():
+    os.system('cls' if os.name == 'nt' else 'clear >/dev/null 2>&1')
+
+
+def timed(fn, calls):
+    started = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - started) / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Clear screen benchmark")
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    os.environ.setdefault("TERM", "xterm")
+    with open(os.devnull, "w") as devnull:
+        screen = Screen(devnull)
+        results = [("os.system('clear')", timed(fork_clear, args.calls)),
+                   ("Screen.clear()", timed(screen.clear, args.calls * 100))]
+
+    print(f"{'method':<22}{'us/call':>12}{'calls/s':>12}")
+    for name, per_call in results:
+        print(f"{name:<22}{per_call * 1e6:>12.1f}{1 / per_call:>12.0f}")
+    print(f"\nescape sequence is {results[0][1] / results[1][1]:.0f}x cheaper")
+
+
+if __name__ == "__main__":
+    main()
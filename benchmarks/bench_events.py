@@ -0,0 +1,62 @@
+# Event Log Benchmark
+# What logging every state change costs on the story's hot path, with the
+# batched writes to a file counted in, and how fast a fold rebuilds the
+# state from a long log.
+#
+# Usage: python benchmarks/bench_events.py [--events 100000]
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from eventlog import EventLog, fold, read
+from story import game_state
+
+BUDGET = 1.0  # µs per event
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Event log benchmark")
+    parser.add_argument("--events", type=int, default=100000)
+    args = parser.parse_args()
+
+    keys = list(game_state.keys())
+    events = [(i // 4, keys[i % len(keys)], 1 - i % 3) for i in range(args.events)]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "events")
+        best = float("inf")
+        for _ in range(5):
+            log = EventLog(path)
+            record = log.record
+            started = time.perf_counter()
+            for choice, key, delta in events:
+                record(choice, key, delta)
+            log.close()
+            best = min(best, time.perf_counter() - started)
+        per_event = best / args.events * 1e6
+        size = os.path.getsize(path)
+
+        started = time.perf_counter()
+        loaded = read(path)
+        reading = time.perf_counter() - started
+    assert loaded == events
+
+    started = time.perf_counter()
+    fold(loaded)
+    folding = time.perf_counter() - started
+
+    print(f"record + batched write  {per_event:8.3f} µs/event  (budget {BUDGET} µs)")
+    print(f"log file                {size / args.events:8.1f} bytes/event")
+    print(f"read {args.events} events   {reading * 1e3:8.2f} ms")
+    print(f"fold {args.events} events   {folding * 1e3:8.2f} ms")
+    if per_event > BUDGET:
+        sys.exit("over budget")
+
+
+if __name__ == "__main__":
+    main()
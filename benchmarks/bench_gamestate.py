@@ -0,0 +1,63 @@
+# Game State Benchmark
+# Memory per session, snapshot, hash, compare and update costs of the
+# GameState value type against the plain dict game_state used to be.
+#
+# Usage: python benchmarks/bench_gamestate.py [--sessions 10000]
+
+import argparse
+import os
+import sys
+import timeit
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from story import game_state
+
+
+def per_object(make, n):
+    """Bytes each of n objects from make(i) holds."""
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    kept = [make(i) for i in range(n)]
+    size = (tracemalloc.get_traced_memory()[0] - base) / n
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+def cost(statement, namespace, number=200000):
+    """Nanoseconds per run of statement, best of 5."""
+    return min(timeit.repeat(statement, globals=namespace, number=number, repeat=5)) / number * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GameState against a dict")
+    parser.add_argument("--sessions", type=int, default=10000)
+    args = parser.parse_args()
+
+    as_dict = dict(game_state.items())
+    # Every session has played a little, so no two share one state object
+    dict_bytes = per_object(lambda i: dict(as_dict, Instinct=i), args.sessions)
+    state_bytes = per_object(lambda i: game_state.set("Instinct", i), args.sessions)
+
+    namespace = {"d": as_dict, "other": dict(as_dict), "s": game_state,
+                 "same": game_state.set("Late", False)}
+    rows = [
+        ("snapshot", cost("dict(d)", namespace), cost("s", namespace)),
+        ("hash", cost("hash(frozenset(d.items()))", namespace), cost("hash(s)", namespace)),
+        ("compare equal", cost("d == other", namespace), cost("s == same", namespace)),
+        ("read a key", cost("d['GrahamAnger']", namespace), cost("s['GrahamAnger']", namespace)),
+        ("update a key", cost("d['GrahamAnger'] += 1", namespace),
+         cost("s.add('GrahamAnger', 1)", namespace)),
+    ]
+
+    print(f"{'':<16}{'dict':>12}{'GameState':>12}")
+    print(f"{'bytes/session':<16}{dict_bytes:>12.0f}{state_bytes:>12.0f}")
+    for name, old, new in rows:
+        print(f"{name + ' (ns)':<16}{old:>12.1f}{new:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
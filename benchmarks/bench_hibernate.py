@@ -0,0 +1,108 @@
+# Hibernation Benchmark
+# Players who reach the first menu and walk away: what the server holds
+# for each of them with their sessions kept in memory (--idle 0) and
+# hibernated, and how long a hibernated session takes to answer the key
+# that wakes it, next to one that never slept.
+#
+# Usage: python benchmarks/bench_hibernate.py [--players 500] [--idle 0.5]
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from bench_server import MENU, PROMPTS, ROOT, connect, free_port, usage
+
+DOWN = b"\x1b[B"
+
+
+async def walk_away(port, number):
+    """Play up to the first menu and stay there; returns the connection."""
+    reader, writer = await connect(port)
+    characters = ["1", "2"]
+    tail = b""
+    while MENU not in tail:
+        data = await reader.read(65536)
+        if not data:
+            raise EOFError("server closed the connection")
+        tail = (tail + data)[-256:]
+        if tail.endswith(PROMPTS[0]):
+            writer.write(f"P{number}\r\n".encode())
+        elif tail.endswith(PROMPTS[1]):
+            writer.write(characters.pop(0).encode() + b"\r\n")
+    try:
+        while True:  # the rest of the menu
+            await asyncio.wait_for(reader.read(65536), 0.2)
+    except asyncio.TimeoutError:
+        return reader, writer
+
+
+async def key_latency(reader, writer):
+    """Seconds from a key to the first byte of the server's answer."""
+    started = time.perf_counter()
+    writer.write(DOWN)
+    await reader.read(65536)
+    return time.perf_counter() - started
+
+
+async def run(args, port, pid, idle, sleep_dir):
+    _, writer = await connect(port)  # wait until it is up
+    writer.close()
+    await asyncio.sleep(0.5)
+    base_rss, _ = usage(pid)
+
+    # A few players at a time, so those already waiting can hibernate
+    # while the next ones play
+    players = []
+    for start in range(0, args.players, args.batch):
+        batch = range(start, min(start + args.batch, args.players))
+        players += await asyncio.gather(*(walk_away(port, i) for i in batch))
+    await asyncio.sleep(idle + 0.5)
+    rss, _ = usage(pid)
+    on_disk = sum(os.path.getsize(os.path.join(sleep_dir, name)) for name in os.listdir(sleep_dir))
+
+    latencies = []
+    for reader, writer in players[:args.sample]:
+        latencies.append(await key_latency(reader, writer))
+        if idle:
+            await asyncio.sleep(idle + 0.1)  # asleep again before the next one
+    for _, writer in players:
+        writer.close()
+    latencies.sort()
+    return (rss - base_rss) / args.players, on_disk / args.players, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Hibernation benchmark")
+    parser.add_argument("--players", type=int, default=500)
+    parser.add_argument("--batch", type=int, default=25, help="players arriving at a time")
+    parser.add_argument("--idle", type=float, default=0.5, help="server.py --idle")
+    parser.add_argument("--sample", type=int, default=50, help="players whose wakeup is timed")
+    parser.add_argument("--speed", type=float, default=500)
+    args = parser.parse_args()
+
+    for name, idle in (("kept in memory", 0), ("hibernated", args.idle)):
+        port = free_port()
+        with tempfile.TemporaryDirectory() as sleep_dir:
+            server = subprocess.Popen([sys.executable, os.path.join(ROOT, "server.py"),
+                                       "--port", str(port), "--speed", str(args.speed),
+                                       "--idle", str(idle), "--sleep-dir", sleep_dir],
+                                      stdout=subprocess.DEVNULL)
+            try:
+                memory, on_disk, latencies = asyncio.run(run(args, port, server.pid, idle, sleep_dir))
+            finally:
+                server.terminate()
+                server.wait()
+        print(f"{args.players} players at a menu, {name}:")
+        print(f"  server memory   {memory / 1024:8.1f} KB per player")
+        if idle:
+            print(f"  on disk         {on_disk:8.0f} bytes per player")
+        print(f"  key to answer   median {latencies[len(latencies) // 2] * 1e3:.2f} ms, "
+              f"slowest {latencies[-1] * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+# Keypress Latency Benchmark
+# Measures keypress-to-redraw time for an arrow menu on a pseudo-terminal,
+# switching terminal modes around every key (the old get_key) vs holding
+# one TerminalSession for the whole menu.
+#
+# Usage: python benchmarks/bench_keys.py [--keys 2000]
+
+import argparse
+import os
+import pty
+import statistics
+import sys
+import termios
+import time
+import tty
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from terminal import TerminalSession
+
+OPTIONS = ["SARCASM", "CHALLENGE", "SERIOUS"]
+DOWN = b"\x1b[B"
+QUIT = b"q"
+REDRAWN = b"\x1b[3A"  # the menu's cursor-up always ends a redraw
+
+
+class CountingTermios:
+    """Counts the tcgetattr/tcsetattr ioctls, including the ones tty makes."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __enter__(self):
+        self.real = termios.tcgetattr, termios.tcsetattr
+
+        def tcgetattr(fd):
+            self.calls += 1
+            return self.real[0](fd)
+
+        def tcsetattr(fd, when, attrs):
+            self.calls += 1
+            return self.real[1](fd, when, attrs)
+
+        for module in (termios, tty):
+            module.tcgetattr, module.tcsetattr = tcgetattr, tcsetattr
+        return self
+
+    def __exit__(self, *exc):
+        for module in (termios, tty):
+            module.tcgetattr, module.tcsetattr = self.real
+
+
+def old_get_key(fd, ready):
+    """The original get_key: a full mode switch around every keypress."""
+    old_settings = termios.tcgetattr(fd)
+    try:
+        tty.setraw(fd)  # flushes typeahead, so the driver waits for ready
+        ready()
+        first_char = os.read(fd, 1)
+        if first_char == b"\x1b":
+            return first_char + os.read(fd, 2)
+        return first_char
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+
+def session_get_key(fd, ready):
+    ready()
+    first_char = os.read(fd, 1)
+    if first_char == b"\x1b":
+        return first_char + os.read(fd, 2)
+    return first_char
+
+
+def menu(fd, get_key, ready):
+    """A minimal arrow_menu writing its redraws back to the terminal."""
+    index = 0
+    while True:
+        lines = [("> " if i == index else "  ") + opt for i, opt in enumerate(OPTIONS)]
+        os.write(fd, ("\r\n".join(lines) + "\r\n").encode() + REDRAWN)
+        key = get_key(fd, ready)
+        if key == QUIT:
+            return
+        if key == DOWN:
+            index = (index + 1) % len(OPTIONS)
+
+
+def child(mode, slave, signal_fd):
+    """Run the menu in its own process, signalling each time it can read."""
+    ready = lambda: os.write(signal_fd, b"r")
+    with CountingTermios() as counter:
+        if mode == "session":
+            with TerminalSession(slave):
+                menu(slave, session_get_key, ready)
+        else:
+            menu(slave, old_get_key, ready)
+    os.write(signal_fd, b"%d" % counter.calls)
+
+
+def read_redraw(master):
+    buf = b""
+    while not buf.endswith(REDRAWN):
+        buf += os.read(master, 4096)
+
+
+def press(master, key, wait_fd):
+    os.read(wait_fd, 1)  # the menu is ready for the key
+    os.write(master, key)
+
+
+def run(mode, keys):
+    master, slave = pty.openpty()
+    wait_fd, signal_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(master)
+        child(mode, slave, signal_fd)
+        os._exit(0)
+    latencies = []
+    read_redraw(master)  # first paint
+    began = time.perf_counter()
+    for _ in range(keys):
+        press(master, DOWN, wait_fd)
+        started = time.perf_counter()
+        read_redraw(master)
+        latencies.append(time.perf_counter() - started)
+    elapsed = time.perf_counter() - began
+    press(master, QUIT, wait_fd)
+    os.waitpid(pid, 0)
+    os.close(signal_fd)
+    ioctls = int(os.read(wait_fd, 64))
+    for fd in (master, slave, wait_fd):
+        os.close(fd)
+    return latencies, elapsed, ioctls
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Keypress-to-redraw latency benchmark")
+    parser.add_argument("--keys", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'mode':<10}{'p50 us':>10}{'p99 us':>10}{'max us':>10}"
+          f"{'keys/s':>10}{'ioctls/key':>12}")
+    for mode in ("per-key", "session"):
+        latencies, elapsed, ioctls = run(mode, args.keys)
+        latencies.sort()
+        p50 = statistics.median(latencies) * 1e6
+        p99 = latencies[int(len(latencies) * 0.99)] * 1e6
+        print(f"{mode:<10}{p50:>10.1f}{p99:>10.1f}{latencies[-1] * 1e6:>10.1f}"
+              f"{args.keys / elapsed:>10.0f}{ioctls / args.keys:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
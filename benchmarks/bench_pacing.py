@@ -0,0 +1,115 @@
+# Pacing Benchmark
+# One player through the story against server.py, as a telnet client that
+# is sent every frame of the typing, and as client.py that asks for the
+# text whole with its pacing (PACING) and types it out itself. Counts the
+# packets that reach the player (the kernel's count, from TCP_INFO) and
+# how often the server wakes up and for how long it runs, and checks that
+# the two end up with the same screen.
+#
+# Both play at --speed (the server paces at it; the paced player just
+# reads). Linux only (TCP_INFO, /proc).
+#
+# Usage: python benchmarks/bench_pacing.py [--speed 10] [--menus 5]
+
+import argparse
+import asyncio
+import os
+import socket
+import struct
+import subprocess
+import sys
+import time
+
+from bench_server import MENU, PROMPTS, ROOT, connect, free_port, usage
+
+sys.path.insert(0, ROOT)
+
+from client import HELLO, Stream
+
+TCP_DATA_SEGS_IN = 152  # offset of tcpi_data_segs_in in struct tcp_info
+
+
+def packets(writer):
+    """Packets with data the socket has received."""
+    sock = writer.get_extra_info("socket")
+    info = sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_INFO, 256)
+    return struct.unpack_from("I", info, TCP_DATA_SEGS_IN)[0]
+
+
+def wakeups(pid):
+    """Times the process has slept and been woken up."""
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("voluntary_ctxt_switches"):
+                return int(line.split()[1])
+
+
+async def player(port, menus, paced):
+    """Play to the end (or --menus menus in), taking the first option of
+    every menu; returns the screen and the packets it took."""
+    reader, writer = await connect(port)
+    if paced:
+        writer.write(HELLO)
+    stream = Stream()
+    screen = bytearray()
+    characters = ["1", "2"]
+    tail = b""
+    while True:
+        data = await reader.read(65536)
+        if not data:
+            break
+        for item in stream.feed(data):
+            if isinstance(item, bytes):
+                screen += item
+            else:
+                screen += item[0].replace("\n", "\r\n").encode()
+        carried = tail[-(len(MENU) - 1):]
+        for _ in range((carried + data).count(MENU)):
+            menus -= 1
+            writer.write(b"\r")
+        tail = (tail + data)[-64:]
+        if menus < 0:
+            break
+        if tail.endswith(PROMPTS[0]):
+            writer.write(b"P\r\n")
+        elif tail.endswith(PROMPTS[1]):
+            writer.write(characters.pop(0).encode() + b"\r\n")
+    count = packets(writer)
+    writer.close()
+    return bytes(screen), count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pacing benchmark")
+    parser.add_argument("--speed", type=float, default=10)
+    parser.add_argument("--menus", type=int, default=5, help="how far to play (-1: to the end)")
+    args = parser.parse_args()
+    menus = args.menus if args.menus >= 0 else float("inf")
+
+    port = free_port()
+    server = subprocess.Popen([sys.executable, os.path.join(ROOT, "server.py"),
+                               "--port", str(port), "--speed", str(args.speed),
+                               "--idle", "0", "--seed", "1"],
+                              stdout=subprocess.DEVNULL)
+    try:
+        asyncio.run(connect(port))  # wait until it is up
+        time.sleep(0.5)
+        screens = []
+        for name, paced in (("telnet", False), ("paced", True)):
+            woken, (_, cpu) = wakeups(server.pid), usage(server.pid)
+            started = time.perf_counter()
+            screen, count = asyncio.run(player(port, menus, paced))
+            took = time.perf_counter() - started
+            woken, cpu = wakeups(server.pid) - woken, usage(server.pid)[1] - cpu
+            screens.append(screen)
+            print(f"{name:<7} {count:7d} packets  {woken:7d} server wakeups  "
+                  f"{cpu:6.2f} s server CPU  ({len(screen)} bytes on screen, {took:.1f} s)")
+    finally:
+        server.terminate()
+        server.wait()
+    same = screens[0] == screens[1]
+    print("screens", "identical" if same else "DIFFER")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# Rewind Benchmark
+# Memory each kept menu snapshot holds, how long going back a choice
+# takes, and the scripted time a restart would cost to reach the same menu
+# instead.
+#
+# Usage: python benchmarks/bench_rewind.py [--runs 10000]
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from engine import Session, play
+from headless import ScriptedPlayer
+from scenegraph import load_story
+from story import game_state
+
+
+class Recorder:
+    """Stands in for a Checkpointer; notes the virtual time at each menu."""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.times = []
+
+    def save(self, snapshot):
+        self.times.append(self.clock.t)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rewind benchmark")
+    parser.add_argument("--runs", type=int, default=10000)
+    args = parser.parse_args()
+
+    graph = load_story()
+    with open(os.devnull, "w") as devnull:
+        session = Session(game_state, out=devnull, rewinds=None,
+                          player=ScriptedPlayer(["A", "B", "1", "2"], [1, 0] * 10))
+        recorder = session.checkpoints = Recorder(session.clock)
+        play(session, graph)
+    kept = list(session.history)
+
+    # Every kept snapshot, with the live state they share left out
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    copies = [session.snapshot(snapshot[0], snapshot[1]) for snapshot in kept]
+    per_snapshot = (tracemalloc.get_traced_memory()[0] - base) / len(copies)
+    tracemalloc.stop()
+
+    started = time.perf_counter()
+    for _ in range(args.runs):
+        session.history.append(kept[-2])
+        session.rewind(graph, kept[-1])
+    rewind = (time.perf_counter() - started) / args.runs
+
+    print(f"{len(kept)} menus per playthrough, {per_snapshot:.0f} bytes per kept snapshot")
+    print(f"go back a choice          {rewind * 1e6:8.1f} us")
+    print(f"restart to the same menu  {sum(recorder.times) / len(recorder.times):8.1f} s "
+          "scripted, on average")
+
+
+if __name__ == "__main__":
+    main()
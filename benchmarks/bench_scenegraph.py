@@ -0,0 +1,74 @@
+# Scene Graph Benchmark
+# How long the story takes to compile, how much memory the graph holds,
+# how fast tools can walk it, and how long a headless playthrough takes.
+#
+# Usage: python benchmarks/bench_scenegraph.py [--runs 20]
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from engine import Session, play
+from headless import ScriptedPlayer
+from storycompiler import compile_story
+from story import game_state
+
+
+def best(runs, fn):
+    """Fastest of `runs` calls, in seconds."""
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - started)
+    return min(times)
+
+
+def walk(graph):
+    """Visit every node reachable from the start; no I/O."""
+    seen = {0}
+    stack = [0]
+    while stack:
+        for j in graph.successors(stack.pop()):
+            if j not in seen:
+                seen.add(j)
+                stack.append(j)
+    return len(seen)
+
+
+def playthrough(graph, out):
+    session = Session(game_state, out=out, player=ScriptedPlayer(["A", "B", "1", "2"]))
+    play(session, graph)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scene graph benchmark")
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    compile_time = best(args.runs, compile_story)
+    tracemalloc.start()
+    graph = compile_story()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    reachable = walk(graph)
+    walk_time = best(args.runs, lambda: walk(graph))
+
+    with open(os.devnull, "w") as devnull:
+        play_time = best(args.runs, lambda: playthrough(graph, devnull))
+
+    print(f"nodes              {len(graph):>10}  ({reachable} reachable)")
+    print(f"compile            {compile_time * 1e3:>10.2f} ms")
+    print(f"graph memory       {size / 1024:>10.1f} KB")
+    print(f"walk               {walk_time * 1e3:>10.3f} ms  "
+          f"({walk_time / reachable * 1e9:.0f} ns/node)")
+    print(f"playthrough        {play_time * 1e3:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+# Server Load Test
+# Starts server.py and connects many players to it: first a crowd that
+# sits at the name prompt (what hosting idle players costs), then players
+# that answer every prompt and menu and play the story to the end, with
+# the story sped up so a playthrough takes seconds. With --pairs, players
+# are paired up and each plays one character; with --workers, the server
+# spreads them over that many processes (the figures add all of them up).
+#
+# Usage: python benchmarks/bench_server.py [--idle 2000] [--players 200] [--speed 500]
+#                                          [--pairs] [--workers 1]
+
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+MENU = b"[PLAYER CHOICE"
+PROMPTS = (b"name: ", b"(1 or 2): ")
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def usage(pid):
+    """(resident bytes, CPU seconds) of a process and its workers, from /proc."""
+    rss = cpu = 0
+    for process in [pid] + children(pid):
+        with open(f"/proc/{process}/status") as f:
+            rss += next(int(line.split()[1]) * 1024 for line in f if line.startswith("VmRSS"))
+        with open(f"/proc/{process}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        cpu += (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    return rss, cpu
+
+
+def children(pid):
+    found = []
+    for entry in os.listdir("/proc"):
+        if entry.isdigit():
+            try:
+                with open(f"/proc/{entry}/stat") as f:
+                    if int(f.read().rsplit(")", 1)[1].split()[1]) == pid:
+                        found.append(int(entry))
+            except OSError:
+                pass  # gone already
+    return found
+
+
+async def connect(port):
+    while True:
+        try:
+            return await asyncio.open_connection("127.0.0.1", port)
+        except ConnectionRefusedError:
+            await asyncio.sleep(0.05)  # still starting up
+
+
+async def idle_player(port, ready, release):
+    """Connect and wait at the first name prompt until released."""
+    reader, writer = await connect(port)
+    seen = b""
+    while not seen.endswith(PROMPTS[0]):
+        data = await reader.read(65536)
+        if not data:
+            raise EOFError("server closed the connection")
+        seen = (seen + data)[-64:]
+    ready()
+    await release.wait()
+    writer.close()
+
+
+async def player(port, number, timings, latencies, pairs=False):
+    """Play the whole story, taking the first option of every menu. With
+    pairs, only the prompts meant for this player are answered. Notes how
+    long the server takes to answer each menu key."""
+    reader, writer = await connect(port)
+    started = time.perf_counter()
+    pressed = None
+    name = f"P{number}"
+    characters = ["1", "2"] if number % 2 == 0 or not pairs else ["2", "1"]
+    tail = b""
+    while True:
+        data = await reader.read(65536)
+        if not data:
+            break
+        if pressed is not None:
+            latencies.append(time.perf_counter() - pressed)
+            pressed = None
+        # A menu heading split across two reads still counts once
+        carried = tail[-(len(MENU) - 1):]
+        for _ in range((carried + data).count(MENU)):
+            writer.write(b"\r")
+            pressed = time.perf_counter()
+        tail = (tail + data)[-64:]
+        if tail.endswith(PROMPTS[0]):
+            writer.write(name.encode() + b"\r\n")
+        elif tail.endswith(PROMPTS[1]) and (not pairs or f"{name}, ".encode() in tail):
+            if b"already taken" in tail:
+                characters.pop(0)
+            writer.write(characters[0].encode() + b"\r\n")
+            if not pairs:
+                characters.pop(0)  # the next prompt is for this player's player 2
+    writer.close()
+    timings.append(time.perf_counter() - started)
+
+
+async def run(args, port, pid):
+    _, writer = await connect(port)  # wait until it is up
+    writer.close()
+    await asyncio.sleep(0.5)
+    base_rss, _ = usage(pid)
+
+    # A crowd that has connected and is sitting at the first prompt
+    ready = 0
+    release = asyncio.Event()
+
+    def arrived():
+        nonlocal ready
+        ready += 1
+
+    started = time.perf_counter()
+    crowd = [asyncio.ensure_future(idle_player(port, arrived, release)) for _ in range(args.idle)]
+    while ready < args.idle:
+        await asyncio.sleep(0.1)
+        if any(task.done() and task.exception() for task in crowd):
+            raise next(task.exception() for task in crowd if task.done() and task.exception())
+    connecting = time.perf_counter() - started
+    rss, cpu = usage(pid)
+    await asyncio.sleep(args.window)
+    _, cpu_after = usage(pid)
+    idle_cpu = (cpu_after - cpu) / args.window
+    release.set()
+    await asyncio.gather(*crowd)
+
+    print(f"{args.idle} players at the name prompt: connected in {connecting:.1f} s")
+    print(f"  server memory   {(rss - base_rss) / args.idle / 1024:8.1f} KB per player "
+          f"({rss / 2**20:.0f} MB in all)")
+    print(f"  server CPU      {idle_cpu:8.1%} while they sit there")
+
+    await asyncio.sleep(1)  # let the crowd's sessions finish
+    _, cpu = usage(pid)
+    timings = []
+    latencies = []
+    started = time.perf_counter()
+    await asyncio.gather(*(player(port, i, timings, latencies, args.pairs)
+                           for i in range(args.players)))
+    elapsed = time.perf_counter() - started
+    _, cpu_after = usage(pid)
+    timings.sort()
+    latencies.sort()
+    scripted = 2235 / args.speed  # the default choices' scripted length (timing.py)
+    games = args.players // 2 if args.pairs else args.players
+    print(f"{args.players} players in {games} full playthroughs at {args.speed:g}x: {elapsed:.1f} s "
+          f"(about {scripted:.1f} s scripted each)")
+    print(f"  per playthrough median {timings[len(timings) // 2]:.2f} s, "
+          f"slowest {timings[-1]:.2f} s")
+    print(f"  menu key to answer median {latencies[len(latencies) // 2] * 1e3:.1f} ms, "
+          f"p99 {latencies[len(latencies) * 99 // 100] * 1e3:.1f} ms")
+    print(f"  server CPU      {(cpu_after - cpu) / args.players * 1e3:8.1f} ms per player")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test for server.py")
+    parser.add_argument("--idle", type=int, default=2000, help="players left at the name prompt")
+    parser.add_argument("--players", type=int, default=200, help="players who play to the end")
+    parser.add_argument("--speed", type=float, default=500)
+    parser.add_argument("--window", type=float, default=5.0,
+                        help="seconds to watch the idle crowd for")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="server processes (server.py --workers)")
+    parser.add_argument("--pairs", action="store_true",
+                        help="start the server with --pairs: two players to a playthrough")
+    args = parser.parse_args()
+
+    if resource is not None:
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+    port = free_port()
+    server = subprocess.Popen([sys.executable, os.path.join(ROOT, "server.py"), "--port", str(port),
+                               "--speed", str(args.speed), "--workers", str(args.workers)]
+                              + ["--pairs"] * args.pairs, stdout=subprocess.DEVNULL)
+    try:
+        asyncio.run(run(args, port, server.pid))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
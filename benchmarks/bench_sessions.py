@@ -0,0 +1,66 @@
+# Session Benchmark
+# Runs many headless playthroughs side by side in one process (threads)
+# and compares their memory and throughput with one process per player.
+#
+# Usage: python benchmarks/bench_sessions.py [--sessions 200] [--threads 8]
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from engine import Session, play
+from headless import ScriptedPlayer
+from storycompiler import compile_story
+from story import game_state
+
+
+def new_session(i, out):
+    player = ScriptedPlayer([f"A{i}", f"B{i}", "1", "2"], [i % 2, (i // 2) % 2])
+    return Session(game_state, out=out, player=player, seed=i)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="In-process session benchmark")
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--processes", type=int, default=5,
+                        help="playthroughs to time as separate processes")
+    args = parser.parse_args()
+
+    with open(os.devnull, "w") as devnull:
+        # Memory held by each live session, before it starts playing
+        tracemalloc.start()
+        base = tracemalloc.get_traced_memory()[0]
+        sessions = [new_session(i, devnull) for i in range(args.sessions)]
+        per_session = (tracemalloc.get_traced_memory()[0] - base) / args.sessions
+        tracemalloc.stop()
+
+        graph = compile_story()  # shared by every session
+        started = time.perf_counter()
+        with ThreadPoolExecutor(args.threads) as pool:
+            list(pool.map(lambda s: play(s, graph), sessions))
+        in_process = (time.perf_counter() - started) / args.sessions
+
+        started = time.perf_counter()
+        for _ in range(args.processes):
+            subprocess.run([sys.executable, os.path.join(ROOT, "1_koylynn.py"), "--headless"],
+                           stdout=devnull, stderr=devnull, check=True)
+        per_process = (time.perf_counter() - started) / args.processes
+    child_rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * 1024
+
+    print(f"{'':<24}{'memory/player':>16}{'ms/playthrough':>16}")
+    print(f"{'session in-process':<24}{per_session / 1024:>13.1f} KB{in_process * 1e3:>16.2f}")
+    print(f"{'process per player':<24}{child_rss / 1024:>13.1f} KB{per_process * 1e3:>16.2f}")
+    print(f"\n{child_rss / per_session:.0f}x less memory per player in-process")
+
+
+if __name__ == "__main__":
+    main()
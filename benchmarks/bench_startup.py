@@ -0,0 +1,81 @@
+# Startup Benchmark
+# Time from launching the game to its first byte of output, with the scene
+# graph cache cold (compiled at startup) and warm (loaded from the cache).
+# The budget is for the game's own startup, on top of what the bare
+# interpreter takes to start on this machine; exits with status 1 if the
+# warm start is over it.
+#
+# Usage: python benchmarks/bench_startup.py [--runs 20] [--budget 30]
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import story
+from scenegraph import cache_path
+
+GAME = [sys.executable, os.path.join(ROOT, "1_koylynn.py"), "--headless"]
+BARE = [sys.executable, "-c", "print()"]  # the interpreter on its own
+
+
+def first_output(command, env):
+    """Seconds until the command writes its first byte to stdout."""
+    started = time.perf_counter()
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, env=env)
+    process.stdout.read(1)
+    elapsed = time.perf_counter() - started
+    process.kill()
+    process.wait()
+    process.stdout.close()
+    return elapsed
+
+
+def measure(runs, env):
+    """First-output times for the bare interpreter, a cold and a warm start.
+
+    Bare and warm starts are taken in turn, so a busy moment on the machine
+    hits both alike; the cold starts (each a full compile) go first.
+    """
+    cold = []
+    for _ in range(runs):
+        if os.path.exists(cache_path(story)):
+            os.remove(cache_path(story))
+        cold.append(first_output(GAME, env))
+    bare, warm = [], []
+    for _ in range(runs):
+        bare.append(first_output(BARE, env))
+        warm.append(first_output(GAME, env))
+    return bare, cold, warm
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time to first output")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--budget", type=float, default=30.0,
+                        help="warm start budget beyond interpreter startup, in milliseconds")
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)  # the cache lives beside the .pyc files
+    bare, cold, warm = measure(args.runs, env)
+    rows = [("python alone", bare), ("cold (compile)", cold), ("warm (cached)", warm)]
+
+    # Best of n, like timeit: anything slower was the machine, not the game
+    print(f"{'':<16}{'median':>10}{'best':>10}{'game only':>12}")
+    for name, times in rows:
+        print(f"{name:<16}{statistics.median(times) * 1e3:>7.1f} ms{min(times) * 1e3:>7.1f} ms"
+              f"{(min(times) - min(bare)) * 1e3:>9.1f} ms")
+    warm = (min(warm) - min(bare)) * 1e3
+    verdict = "within" if warm <= args.budget else "OVER"
+    print(f"\nwarm start {warm:.1f} ms past the interpreter: {verdict} the {args.budget:.0f} ms budget")
+    sys.exit(warm > args.budget)
+
+
+if __name__ == "__main__":
+    main()
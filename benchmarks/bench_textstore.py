@@ -0,0 +1,92 @@
+# Text Store Benchmark
+# How much memory of its own each forked worker ends up with once it has
+# shown every text in the story: with the text as str objects in the
+# scene graph, with it in a TextStore, and for comparison showing nothing. Private memory (the pages a
+# worker no longer shares with the others) is read from
+# /proc/<pid>/smaps_rollup, so this runs on Linux only.
+#
+# Usage: python benchmarks/bench_textstore.py [--workers 4]
+
+import argparse
+import gc
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from scenegraph import PRINT, TEXT, SceneGraph, load_story
+from server import write
+from textstore import share
+
+
+class Discard:
+    """A connection that sends nowhere."""
+
+    def write(self, text):
+        self.send(text.replace("\n", "\r\n").encode())
+
+    def send(self, data):
+        pass
+
+
+def private():
+    """Bytes of this process's memory that no other process shares."""
+    with open("/proc/self/smaps_rollup") as f:
+        return sum(int(line.split()[1]) * 1024 for line in f
+                   if line.startswith(("Private_Clean", "Private_Dirty")))
+
+
+def show_everything(graph):
+    conn = Discard()
+    for node in graph.nodes:
+        if node[0] == TEXT:
+            text = node[1]
+            for i in range(0, len(text), 4):  # a frame's worth at a time
+                write(conn, text[i:i + 4])
+        elif node[0] == PRINT:
+            write(conn, node[1])
+
+
+def worker_growth(graph, workers):
+    """Private bytes each of `workers` forked processes gains showing the story."""
+    gc.collect()
+    gc.freeze()  # as pool.supervise() does before forking
+    pipes = []
+    for _ in range(workers):
+        read, written = os.pipe()
+        if os.fork() == 0:
+            os.close(read)
+            before = private()
+            show_everything(graph)
+            gc.collect()  # as a long-running worker's collector would, sooner or later
+            os.write(written, str(private() - before).encode())
+            os._exit(0)
+        os.close(written)
+        pipes.append(read)
+    grown = []
+    for read in pipes:
+        grown.append(int(os.read(read, 64)))
+        os.close(read)
+        os.wait()
+    gc.unfreeze()
+    return grown
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Text store benchmark")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    graph = load_story()
+    texts = {node[1] for node in graph.nodes if node[0] == TEXT or node[0] == PRINT}
+    print(f"{len(texts)} texts, {sum(len(t.encode()) for t in texts) / 1024:.0f} KB as UTF-8")
+    # Showing nothing: what a worker copies of its own regardless
+    nothing = SceneGraph([], graph.scenes, graph.module)
+    for name, shown in (("nothing", nothing), ("str objects", graph), ("text store", share(graph))):
+        grown = worker_growth(shown, args.workers)
+        print(f"  {name:<12} {sum(grown) / len(grown) / 1024:8.0f} KB private per worker")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+# Timer Wheel Benchmark
+# Timer operations per second for the pacing waits of 1k and 10k sessions,
+# on the TimerWheel and on a heap (what the event loop keeps its own timers
+# in), first alone in story time and then on a real event loop: every
+# session an asyncio.sleep() per wait against the server's Ticker.
+#
+# Each session types (a wait per frame) and now and then pauses, as the
+# story does.
+#
+# Usage: python benchmarks/bench_timerwheel.py [--sessions 1000 10000] [--seconds 60]
+
+import argparse
+import asyncio
+import heapq
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from server import Ticker
+from timerwheel import TimerWheel
+from typewriter import FRAME
+
+
+def waits(seed):
+    """A session's waits: frames of typing, a pause after each passage."""
+    rng = random.Random(seed)
+    while True:
+        for _ in range(rng.randrange(20, 200)):
+            yield FRAME
+        yield rng.choice((0.3, 0.5, 1.0, 2.0))
+
+
+def run_wheel(sessions, seconds):
+    """(timer operations, wakeups) for sessions waiting on a TimerWheel."""
+    wheel = TimerWheel()
+    streams = [waits(i) for i in range(sessions)]
+    for i, stream in enumerate(streams):
+        wheel.add(next(stream) + i / sessions, i)
+    end = wheel.tick_of(seconds)
+    ops = sessions
+    wakeups = 0
+    while True:
+        tick = wheel.next_tick()
+        if tick > end:
+            break
+        now = tick * wheel.tick
+        expired = wheel.expire(tick)
+        wakeups += 1
+        for i in expired:
+            wheel.add(now + next(streams[i]), i)
+        ops += 2 * len(expired)
+    return ops, wakeups
+
+
+def run_heap(sessions, seconds):
+    """(timer operations, wakeups) for the same on a heap: one each."""
+    streams = [waits(i) for i in range(sessions)]
+    heap = [(next(stream) + i / sessions, i) for i, stream in enumerate(streams)]
+    heapq.heapify(heap)
+    ops = sessions
+    while heap[0][0] <= seconds:
+        now, i = heap[0]
+        heapq.heapreplace(heap, (now + next(streams[i]), i))
+        ops += 2
+    return ops, (ops - sessions) // 2
+
+
+async def on_loop(sessions, seconds, wheel):
+    """Timer operations per CPU second for sessions waiting on the event loop."""
+    ticker = Ticker()
+    done = 0
+
+    async def session(i):
+        nonlocal done
+        deadline = ticker.now() + i / sessions
+        for wait in waits(i):
+            deadline += wait
+            if deadline > end:
+                return
+            wait = deadline - ticker.now()
+            if wait <= 0:
+                continue  # fallen behind: no timer, as in ServerClock
+            if wheel:
+                await ticker.wait_until(deadline)
+            else:
+                await asyncio.sleep(wait)
+            done += 1
+
+    end = ticker.now() + seconds
+    started = time.process_time()
+    await asyncio.gather(*(session(i) for i in range(sessions)))
+    return 2 * done / (time.process_time() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Timer wheel benchmark")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--seconds", type=float, default=60.0,
+                        help="story seconds to run the sessions for")
+    parser.add_argument("--loop-seconds", type=float, default=3.0,
+                        help="real seconds to run them on the event loop")
+    args = parser.parse_args()
+
+    print(f"{'sessions':>8}  {'':<12}{'timer ops/s':>14}{'wakeups/s':>12}{'ops/s on a loop':>18}")
+    for sessions in args.sessions:
+        for name, run, wheel in (("heap", run_heap, False), ("timer wheel", run_wheel, True)):
+            started = time.perf_counter()
+            ops, wakeups = run(sessions, args.seconds)
+            rate = ops / (time.perf_counter() - started)
+            looped = asyncio.run(on_loop(sessions, args.loop_seconds, wheel))
+            print(f"{sessions:>8}  {name:<12}{rate:>14,.0f}{wakeups / args.seconds:>12,.0f}"
+                  f"{looped:>18,.0f}")
+
+
+if __name__ == "__main__":
+    main()
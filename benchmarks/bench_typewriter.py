@@ -0,0 +1,140 @@
+# Typewriter Benchmark
+# Plays the story headless and counts write syscalls and bytes per scene,
+# for the old per-character write+flush loop and for the frame-coalescing
+# Typewriter.
+# At the default 60 Hz frame the two make the same number of writes
+# (no speed in the story types faster than a frame); the sweep at the end
+# shows what longer frames (1_koylynn.py --frame) save.
+#
+# Usage: python benchmarks/bench_typewriter.py [--frame 0.016] [--overshoot 0.001]
+
+import argparse
+import io
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from engine import Session, play
+from headless import ScriptedPlayer
+from pacing import VirtualClock
+from scenegraph import load_story
+from story import game_state
+from typewriter import FRAME, Typewriter
+
+
+class CountingRaw(io.RawIOBase):
+    """Raw stream that counts each write as one syscall."""
+
+    def __init__(self):
+        self.syscalls = 0
+        self.nbytes = 0
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self.syscalls += 1
+        self.nbytes += len(b)
+        return len(b)
+
+
+class SimClock(VirtualClock):
+    """Simulated clock where every sleep overshoots by a fixed amount."""
+
+    def __init__(self, overshoot, relative=False):
+        super().__init__()
+        self.overshoot = overshoot
+        self.relative = relative  # pause like the old bare time.sleep()
+
+    def sleep(self, seconds):
+        self.t += seconds + self.overshoot
+
+    def pause(self, seconds):
+        if self.relative:
+            self.sleep(seconds)
+        else:
+            super().pause(seconds)
+
+
+class PerCharacter:
+    """The original delay_print loop: write, flush and sleep per character."""
+
+    def __init__(self, out, clock):
+        self.out = out
+        self.clock = clock
+
+    def type(self, s, delay):
+        for c in s:
+            self.out.write(c)
+            self.out.flush()
+            self.clock.sleep(delay)
+
+
+def measure(frame, overshoot, coalesce):
+    """Play every scene; return [(scene, syscalls, bytes, seconds), ...].
+
+    Without coalescing this is the original game: per-character writes and
+    relative sleeps.
+    """
+    raw = CountingRaw()
+    # Line buffered, like stdout on a terminal
+    out = io.TextIOWrapper(io.BufferedWriter(raw), encoding="utf-8", line_buffering=True)
+    clock = SimClock(overshoot, relative=not coalesce)
+    player = ScriptedPlayer(["Player 1", "Player 2", "1", "2"])
+    session = Session(game_state, out=out, player=player, clock=clock)
+    if coalesce:
+        session.typewriter = Typewriter(out, frame, clock)
+    else:
+        session.typewriter = PerCharacter(out, clock)
+
+    rows = []
+    marks = []  # (scene, syscalls, bytes, time) where each scene starts
+
+    def scene(title):
+        out.flush()
+        marks.append((title, raw.syscalls, raw.nbytes, clock.t))
+        clock.scene(title)
+
+    session.scene = scene
+    play(session, load_story())
+    scene(None)
+    for (title, calls, nbytes, started), (_, calls_end, nbytes_end, ended) in zip(marks, marks[1:]):
+        rows.append((title, calls_end - calls, nbytes_end - nbytes, ended - started))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Typewriter write-syscall benchmark")
+    parser.add_argument("--frame", type=float, default=FRAME)
+    parser.add_argument("--overshoot", type=float, default=0.001,
+                        help="simulated oversleep per sleep() call, in seconds")
+    args = parser.parse_args()
+
+    print(f"frame={args.frame * 1000:.1f} ms  overshoot={args.overshoot * 1000:.1f} ms\n")
+    print(f"{'scene':<34}{'old writes':>12}{'new writes':>12}"
+          f"{'bytes':>9}{'old secs':>10}{'new secs':>10}")
+    old = measure(args.frame, args.overshoot, False)
+    new = measure(args.frame, args.overshoot, True)
+    totals = [0] * 5
+    for (name, old_w, old_b, old_t), (_, new_w, new_b, new_t) in zip(old, new):
+        assert old_b == new_b
+        row = (old_w, new_w, new_b, old_t, new_t)
+        totals = [a + b for a, b in zip(totals, row)]
+        print(f"{name[:33]:<34}{old_w:>12}{new_w:>12}{new_b:>9}{old_t:>10.1f}{new_t:>10.1f}")
+    old_w, new_w, nbytes, old_t, new_t = totals
+    print(f"{'TOTAL':<34}{old_w:>12}{new_w:>12}{nbytes:>9}{old_t:>10.1f}{new_t:>10.1f}")
+    print(f"\nwrite syscalls: {old_w} -> {new_w} ({old_w / max(new_w, 1):.1f}x fewer)")
+
+    # Characters only share a frame once the frame is longer than their delay
+    print("\nframe sweep (whole script):")
+    for frame in (1 / 60, 0.05, 0.1, 0.2):
+        rows = measure(frame, args.overshoot, True)
+        writes = sum(r[1] for r in rows)
+        secs = sum(r[3] for r in rows)
+        print(f"  {frame * 1000:6.1f} ms  {writes:>7} writes  {old_w / writes:5.1f}x fewer  {secs:7.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+# Checkpoints
+# Before every choice menu the session's position and state are saved, so
+# a crashed or closed game can pick up at its last choice instead of
+# replaying the whole story. Files are written by a background thread;
+# the story only hands over a snapshot and carries on.
+
+import marshal
+import os
+import threading
+
+from scenegraph import CHOICE
+
+# Checkpoint files are MAGIC, FORMAT, then the marshalled snapshot
+MAGIC = b"NSCP"
+FORMAT = 3  # bump when the snapshot layout changes
+
+
+def dumps(snapshot):
+    """Checkpoint bytes for a Session.snapshot()."""
+    index, choices, state, variables, players, chance, choices_made = snapshot
+    # Saved by name, so a checkpoint still loads if game_state gains a key
+    # (not if it loses one: see resume())
+    return MAGIC + bytes([FORMAT]) + marshal.dumps((index, choices, dict(state.items()),
+                                                    variables, players, chance, choices_made))
+
+
+def loads(data):
+    """The snapshot in checkpoint bytes; ValueError if they aren't one."""
+    if len(data) <= len(MAGIC) or data[:len(MAGIC)] != MAGIC or data[len(MAGIC)] != FORMAT:
+        raise ValueError("not a checkpoint this version can read")
+    try:
+        snapshot = marshal.loads(data[len(MAGIC) + 1:])
+    except (EOFError, ValueError, TypeError):
+        raise ValueError("damaged checkpoint") from None
+    if not _well_formed(snapshot):
+        raise ValueError("damaged checkpoint")
+    return snapshot
+
+
+def _well_formed(snapshot):
+    # The shape and types dumps() writes
+    if not isinstance(snapshot, tuple) or len(snapshot) != 7:
+        return False
+    index, choices, state, variables, players, chance, choices_made = snapshot
+    return (type(index) is int and index >= 0 and isinstance(choices, tuple)
+            and isinstance(state, dict) and all(type(key) is str for key in state)
+            and isinstance(variables, dict)
+            and isinstance(players, tuple) and len(players) == 4
+            and isinstance(chance, tuple) and len(chance) == 2
+            and all(type(n) is int for n in chance) and type(choices_made) is int)
+
+
+def load(path):
+    """The snapshot saved at path, or None if there isn't one."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+    return loads(data)
+
+
+def resume(session, graph, snapshot):
+    """Put the session back at a snapshot; returns the node to play from."""
+    index, choices = snapshot[0], snapshot[1]
+    node = graph.nodes[index] if index < len(graph.nodes) else None
+    if node is None or node[0] != CHOICE or node[2] != choices:
+        raise ValueError("checkpoint is from a different version of the story")
+    state = snapshot[2]
+    if isinstance(state, dict):  # from a file; a live snapshot has a GameState
+        unknown = set(state) - set(session.state._fields)
+        if unknown:
+            raise ValueError(f"checkpoint has game state the story no longer does: "
+                             f"{', '.join(sorted(unknown))}")
+    session.restore(snapshot)
+    # Start the scene it was saved in, for the pacing report
+    session.scene(graph.scene_at(index))
+    return index
+
+
+class Checkpointer:
+    """Writes the latest snapshot to a file from a background thread."""
+
+    def __init__(self, path):
+        self.path = path
+        self.pending = None  # snapshot waiting to be written
+        self.closed = False
+        self.changed = threading.Condition()
+        self.thread = None
+
+    def save(self, snapshot):
+        """Queue a snapshot; an older one still queued is dropped."""
+        with self.changed:
+            self.pending = snapshot
+            self.changed.notify()
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, name="checkpoints", daemon=True)
+            self.thread.start()
+
+    def close(self):
+        """Finish writing whatever is queued."""
+        with self.changed:
+            self.closed = True
+            self.changed.notify()
+        if self.thread is not None:
+            self.thread.join()
+
+    def discard(self):
+        """Close and delete the checkpoint: the story is over."""
+        self.close()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def _run(self):
+        while True:
+            with self.changed:
+                while self.pending is None and not self.closed:
+                    self.changed.wait()
+                snapshot, self.pending = self.pending, None
+            if snapshot is None:
+                return
+            self._write(dumps(snapshot))
+
+    def _write(self, data):
+        temp = f"{self.path}.{os.getpid()}"
+        try:
+            with open(temp, "wb") as f:
+                f.write(data)
+            os.replace(temp, self.path)  # never leave half a checkpoint behind
+        except OSError:
+            pass  # losing a checkpoint must not stop the story
@@ -0,0 +1,154 @@
+# Story Client
+# Plays the story hosted by server.py in this terminal, typing it out here:
+# it asks the server for paced text (telnet option PACING), so every run of
+# the story comes whole, with the delay between its characters and the
+# pause after it, and the same Typewriter the console game uses types it.
+# The server sends one packet per run instead of one per frame and keeps
+# no timers for it; the screen ends up byte for byte as telnet's would.
+#
+# Keys go to the server as they are typed; keys typed while the story is
+# being typed out are thrown away, as the console game does (the server
+# is at the next menu already and would take them as picks from it).
+#
+# Unix only (waits on the terminal and the socket together).
+#
+# Usage: python client.py [--host 127.0.0.1] [--port 2323] [--speed 1]
+
+import argparse
+import os
+import selectors
+import socket
+import sys
+
+from pacing import PacingClock
+from telnet import DO, DONT, IAC, PACING, PORT, SB, SE, WILL
+from terminal import TerminalSession
+from typewriter import Typewriter
+
+HELLO = bytes([IAC, DO, PACING])
+
+
+class Stream:
+    """Incremental parser of what the server sends. Telnet commands are
+    dropped; the rest comes out as bytes to show as they are and
+    (text, delay, pause) runs to type out."""
+
+    def __init__(self):
+        self.buf = b""  # the start of a telnet command cut off by a read
+
+    def feed(self, data):
+        """Add bytes and return everything they complete, in order."""
+        data = self.buf + data
+        items = []
+        shown = bytearray()
+        i, n = 0, len(data)
+        while i < n:
+            at = data.find(IAC, i)
+            if at < 0:
+                shown += data[i:]
+                i = n
+                break
+            shown += data[i:at]
+            i = at
+            if i + 1 >= n:
+                break
+            command = data[i + 1]
+            if command == IAC:  # an escaped 255
+                shown.append(IAC)
+                i += 2
+            elif WILL <= command <= DONT:
+                if i + 2 >= n:
+                    break
+                i += 3
+            elif command == SB:
+                end = data.find(bytes([IAC, SE]), i + 2)
+                if end < 0:
+                    break
+                if data[i + 2] == PACING:
+                    if shown:
+                        items.append(bytes(shown))
+                        shown.clear()
+                    items.append(run(data[i + 3:end]))
+                i = end + 2
+            else:
+                i += 2
+        if shown:
+            items.append(bytes(shown))
+        self.buf = data[i:]
+        return items
+
+
+def run(body):
+    """(text, delay, pause) from the body of a PACING subnegotiation."""
+    head, _, text = body.partition(b"\n")
+    delay, pause = head.split()
+    return str(text, "utf-8").replace("\r\n", "\n"), float(delay), float(pause)
+
+
+class Output:
+    """The terminal, written to the way telnet would show the same text."""
+
+    def write(self, text):
+        self.send(text.replace("\n", "\r\n").encode())
+
+    def send(self, data):
+        sys.stdout.buffer.write(data)
+
+    def flush(self):
+        sys.stdout.buffer.flush()
+
+
+def play(sock, terminal, speed=1.0):
+    """Play the story coming in on sock (in a TerminalSession) until the
+    server hangs up."""
+    out = Output()
+    clock = PacingClock()
+    typewriter = Typewriter(out, clock=clock)
+    stream = Stream()
+    stdin = sys.stdin.fileno()
+    selector = selectors.DefaultSelector()
+    selector.register(sock, selectors.EVENT_READ)
+    selector.register(stdin, selectors.EVENT_READ)
+    sock.sendall(HELLO)
+    while True:
+        for key, _ in selector.select():
+            if key.fileobj is sock:
+                data = sock.recv(65536)
+                if not data:
+                    return
+                for item in stream.feed(data):
+                    if isinstance(item, bytes):
+                        out.send(item)
+                        out.flush()
+                    else:
+                        text, delay, pause = item
+                        typewriter.type(text, delay / speed)
+                        clock.pause(pause / speed)
+                        terminal.discard_input()
+            else:
+                keys = os.read(stdin, 1024)
+                if not keys:
+                    return
+                sock.sendall(keys)
+                clock.resync()  # the story waited on the player; no catching up
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play the story from server.py, "
+                                                 "typed out in this terminal")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="type this many times faster (for testing)")
+    args = parser.parse_args()
+
+    with socket.create_connection((args.host, args.port)) as sock:
+        try:
+            with TerminalSession() as terminal:
+                play(sock, terminal, args.speed)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
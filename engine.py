@@ -0,0 +1,307 @@
+# Story Engine
+# A Session is one playthrough: its own players, game state, clock and
+# output. Scenes take the session as their only argument, so any number
+# of playthroughs can run side by side in one process.
+#
+# play() runs the compiled scene graph (scenegraph.py) in one loop.
+#
+# Chance (the grab tie-break) comes from the session's own seed, never the
+# global random module: the same seed and answers replay a session exactly.
+#
+# The last few menus are kept as snapshots, so a player can go back to the
+# previous choice at once. GameState is immutable, so a snapshot shares it
+# with the live session instead of copying it.
+
+import os
+import random
+import sys
+from collections import deque
+from contextlib import nullcontext
+
+from keys import DOWN, ENTER, UP, console_keys
+from menu import MenuRenderer
+from pacing import PacingClock, VirtualClock
+from scenegraph import (ADD, BRANCH, CHOICE, CLEAR, END, JUMP, LET, NATIVE, PAUSE,
+                        PRINT, RANDOM, SCENE, SET, TEXT, evaluate)
+from screen import Screen
+from terminal import TerminalSession
+from typewriter import FRAME, Typewriter
+
+REWIND = -1  # what select() returns when the player goes back a choice
+REWINDS = 10  # menus a session can go back through
+REWIND_KEY = "u"
+
+
+class Session:
+    """One playthrough of the story."""
+
+    def __init__(self, state, out=None, keys=None, player=None, clock=None,
+                 alternate_screen=False, checkpoints=None, seed=None, log=None,
+                 rewinds=REWINDS, frame=FRAME):
+        if seed is None:
+            seed = int.from_bytes(os.urandom(8), "big")
+        self.seed = seed  # print it to replay the session
+        self.draws = 0  # random draws made so far
+        self.state = state  # this playthrough's GameState; immutable, so never copied
+        self.variables = {}  # scene locals the graph keeps, like selected
+        self.checkpoints = checkpoints  # a Checkpointer, saved at every choice
+        self.log = log  # an EventLog of every change to the state
+        self.choices_made = 0  # menus answered so far
+        self.history = deque(maxlen=rewinds)  # snapshots of the last menus answered
+        self.out = out  # None means whatever sys.stdout is at the time
+        self.player = player  # a ScriptedPlayer when running headless
+        if clock is None:
+            clock = VirtualClock() if player else PacingClock()
+        self.clock = clock
+        self.typewriter = Typewriter(out, frame, clock)
+        self.screen = Screen(out, alternate_screen)
+        # Local play reads the console; anything else brings its own keys
+        self.console = keys is None and player is None
+        if self.console:
+            self.keys, self.terminal = console_keys(), TerminalSession()
+        else:
+            self.keys, self.terminal = keys, nullcontext()
+
+        self.player_1 = self.player_2 = None
+        self.player_1_character = self.player_2_character = None
+
+    # Checkpoints
+
+    def snapshot(self, index, choices):
+        """Everything needed to resume this playthrough at the menu at node `index`."""
+        players = (self.player_1, self.player_2, self.player_1_character, self.player_2_character)
+        return (index, choices, self.state, dict(self.variables), players,
+                (self.seed, self.draws), self.choices_made)
+
+    def restore(self, snapshot):
+        """Take back the state and players saved in a snapshot."""
+        _, _, state, variables, players, (self.seed, self.draws), self.choices_made = snapshot
+        if isinstance(state, dict):  # from a checkpoint file
+            state = self.state.replace(**state)
+        self.state = state
+        self.variables.clear()  # in place: play() holds on to it
+        self.variables.update(variables)
+        self.player_1, self.player_2, self.player_1_character, self.player_2_character = players
+
+    def rewind(self, graph, current):
+        """Go back to the menu before the one in snapshot `current` (or stay
+        there if none is kept); returns the node to play from."""
+        snapshot = self.history.pop() if self.history else current
+        self.restore(snapshot)
+        if self.log is not None:
+            self.log.rewind(self.choices_made)
+        index = snapshot[0]
+        if graph.scene_at(index) != graph.scene_at(current[0]):
+            self.scene(graph.scene_at(index))  # for the pacing report
+        return index
+
+    # Chance
+
+    def random_choice(self, options):
+        """random.choice() from this session's own stream."""
+        # Draw n is seeded by (seed, n), so the stream picks up where it was
+        # from just those two numbers, and sessions never share state
+        rng = random.Random(f"{self.seed}:{self.draws}")
+        self.draws += 1
+        return rng.choice(options)
+
+    # Output
+
+    def print(self, *args, **kwargs):
+        """print(), to this session's output."""
+        print(*args, file=self.out or sys.stdout, **kwargs)
+
+    def delay_print(self, s, delay=0.6):
+        """Print text with a delay between characters."""
+        self.typewriter.type(s, delay)
+
+    def delay_print1(self, s, delay=0.1):
+        """Print text with a faster delay."""
+        self.typewriter.type(s, delay)
+
+    def delay_print2(self, s, delay=0.05):
+        """Print text with a very fast delay."""
+        self.typewriter.type(s, delay)
+
+    def delay_print3(self, s, delay=0.025):
+        """Print text with an ultra-fast delay."""
+        self.typewriter.type(s, delay)
+
+    def pause(self, seconds):
+        """Pause the story, keeping to the scripted schedule."""
+        self.clock.pause(seconds)
+
+    def clear(self):
+        """Clear the screen."""
+        self.screen.clear()
+
+    def scene(self, name):
+        """Mark the start of a scene for the pacing report."""
+        self.clock.scene(name)
+
+    # Input
+
+    def ask(self, prompt, player=None):
+        """Read a line of input from the player. `player` (1 or 2) says whose
+        answer it is, for when each has their own connection (server.py)."""
+        with self.clock.hold():  # the player takes as long as they like
+            if self.player:
+                answer = self.player.line(prompt)
+                self.print(f"{prompt}{answer}")  # echo it like a terminal would
+                return answer
+            if self.console:
+                return input(prompt)
+            return self._read_line(prompt)
+
+    def _read_line(self, prompt):
+        """input() for key sources that aren't a terminal in cooked mode."""
+        self.print(prompt, end="", flush=True)
+        chars = []
+        while not self.line_key(chars, self.keys.get_key()):
+            pass
+        return "".join(chars)
+
+    def line_key(self, chars, key):
+        """Apply a key to the line being typed into chars; True once it is entered."""
+        if key == ENTER:
+            self.print()
+            return True
+        elif key in ("\x7f", "\b"):  # Backspace
+            if chars:
+                chars.pop()
+                self.print("\b \b", end="", flush=True)
+        elif len(key) == 1 and key.isprintable():
+            chars.append(key)
+            self.print(key, end="", flush=True)
+        return False
+
+    def arrow_menu(self, options):
+        """Display a menu and allow the player to navigate with arrow keys."""
+        menu = self.open_menu(options)
+        if self.player:
+            # Show the menu as it looks once the choice is made
+            index = self.player.choose(options)
+            menu.draw(index)
+            return index
+        index = 0
+        with self.terminal as terminal:  # one mode switch for the whole menu
+            if terminal is not None:
+                terminal.discard_input()  # nothing typed before the menu picks from it
+            while True:
+                menu.draw(index)  # only the markers that moved are rewritten
+                # Held-down arrows pile up while we draw; apply them all at once
+                index, picked = self.menu_keys(menu, index, self.keys.read_keys())
+                if picked is not None:
+                    return picked
+
+    def open_menu(self, options):
+        """Print a menu's heading; returns the renderer that draws its options."""
+        self.print("\n[PLAYER CHOICE - WHAT DO YOU DO?]\n")  # Add spacing before the menu
+        if self.history and not self.player:
+            self.print(f"({REWIND_KEY.upper()} goes back to your previous choice)")
+        return MenuRenderer(options, self.out)
+
+    def menu_keys(self, menu, index, keys):
+        """Apply keys to a menu highlighting index; returns (index, picked),
+        picked being the chosen index, REWIND, or None if not done yet."""
+        for key in keys:
+            if key == UP:
+                index = (index - 1) % len(menu.options)
+            elif key == DOWN:
+                index = (index + 1) % len(menu.options)
+            elif key == ENTER:
+                menu.draw(index)
+                return index, index
+            elif key.lower() == REWIND_KEY and self.history:
+                return index, REWIND
+        return index, None
+
+    def select(self, choices):
+        """Display a choice menu and return the selected index (or REWIND)."""
+        with self.clock.hold():
+            selected = self.arrow_menu(choices)
+        self.clear()  # Clear the screen after the choice is made
+        if selected == REWIND:
+            return selected
+        self.delay_print1(f"You chose: {choices[selected]}")  # Display the chosen option
+        self.pause(2.5)
+        self.clear()
+        return selected
+
+
+def play(session, graph, start=0):
+    """Play the scene graph in the session, from node `start` to the end."""
+    clock = session.clock
+    story = steps(session, graph, start)
+    answer = None
+    while True:
+        try:
+            node = story.send(answer)
+        except StopIteration:
+            return
+        answer = None
+        kind = node[0]
+        if kind == TEXT:
+            session.typewriter.type(node[1], node[2])
+            if node[3]:
+                clock.pause(node[3])
+        elif kind == PAUSE:
+            clock.pause(node[1])
+        elif kind == PRINT:
+            session.print(node[1], end="")
+        elif kind == CLEAR:
+            session.clear()
+        elif kind == CHOICE:
+            answer = session.select(node[2])
+        elif kind == NATIVE:
+            graph.native(node[1])(session)
+
+
+def steps(session, graph, start=0):
+    """Run the scene graph from node `start`, handing out what needs the
+    player: yields the TEXT, PAUSE, PRINT, CLEAR and NATIVE nodes to show
+    or run, and CHOICE nodes, to be sent back the option picked (or
+    REWIND). play() drives it; so does the server, without blocking."""
+    nodes = graph.nodes
+    variables = session.variables
+    log = session.log
+    i = start
+    while True:
+        node = nodes[i]
+        kind = node[0]
+        i += 1
+        if kind == BRANCH:
+            if not evaluate(node[1], session.state, variables):
+                i = node[2]
+        elif kind == JUMP:
+            i = node[1]
+        elif kind == CHOICE:
+            snapshot = session.snapshot(i - 1, node[2])
+            if session.checkpoints is not None:
+                session.checkpoints.save(snapshot)
+            selected = yield node
+            if selected == REWIND:
+                i = session.rewind(graph, snapshot)
+                continue
+            session.history.append(snapshot)
+            variables[node[1]] = selected
+            session.choices_made += 1
+        elif kind == SET:
+            if log is not None:
+                log.record(session.choices_made, node[1], node[2] - session.state[node[1]])
+            session.state = session.state.set(node[1], node[2])
+        elif kind == ADD:
+            if log is not None:
+                log.record(session.choices_made, node[1], node[2])
+            session.state = session.state.add(node[1], node[2])
+        elif kind == LET:
+            variables[node[1]] = node[2]
+        elif kind == RANDOM:
+            variables[node[1]] = session.random_choice(node[2])
+        elif kind == SCENE:
+            session.scene(node[1])
+            variables.clear()  # locals don't outlive their scene
+        elif kind == END:
+            return
+        else:
+            yield node
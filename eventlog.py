@@ -0,0 +1,167 @@
+# Event Log
+# Every change a session makes to game_state, as a (choice, key, delta)
+# event: choice is how many menus had been answered when it happened, key
+# the game_state key and delta how much it moved. A SET is logged as the
+# delta it amounted to, so resets like the anger counters before SCENE 5C
+# show up too. Folding the events over the starting state rebuilds the
+# state after any choice without replaying the story.
+#
+# Events are kept in memory and written to the log file in batches. The
+# file starts with the session's seed, which with the log's choices replays
+# the session (see 1_koylynn.py --seed).
+#
+# Usage: python eventlog.py LOG [--choice N]
+
+import argparse
+import marshal
+
+from story import game_state
+
+# Log files are MAGIC, FORMAT, then frames: each a size (4 bytes, little
+# endian) and something marshalled. The first frame is the seed, every
+# other one a tuple of events (a batch).
+MAGIC = b"NSEL"
+FORMAT = 2  # bump when the event layout changes
+BATCH = 256  # events per write
+
+
+class EventLog:
+    """A session's events, written to path (if given) a batch at a time."""
+
+    def __init__(self, path=None, batch=BATCH):
+        self.path = path
+        self.batch = batch
+        self.seed = None  # the session's, for the file's header; set before anything is written
+        self.events = []
+        self.written = 0  # events already in the file
+        self.file = None
+
+    def record(self, choice, key, delta):
+        self.events.append((choice, key, delta))
+        if len(self.events) - self.written >= self.batch:
+            self.flush()
+
+    def load(self, upto):
+        """Carry on a resumed session's log: keep its events up to choice
+        `upto` and drop the ones after, which are being played again."""
+        try:
+            self.events = read(self.path)
+        except FileNotFoundError:
+            self.events = []
+        self.rewind(upto)
+        self._rewrite()
+
+    def rewind(self, upto):
+        """Drop the events after choice `upto`: the story went back to it."""
+        kept = len(self.events)
+        while kept and self.events[kept - 1][0] > upto:
+            kept -= 1
+        del self.events[kept:]
+        if self.written > kept:  # some are in the file already
+            self._rewrite()
+
+    def flush(self):
+        """Write the events not written yet."""
+        if self.path is None or self.written == len(self.events):
+            return
+        if self.file is None:
+            self._open()
+        self._frame(tuple(self.events[self.written:]))
+        self.file.flush()
+        self.written = len(self.events)
+
+    def _open(self):
+        self.file = open(self.path, "wb")  # replaces any older log
+        self.file.write(MAGIC + bytes([FORMAT]))
+        self._frame(self.seed)
+        self.file.flush()
+
+    def _frame(self, value):
+        data = marshal.dumps(value)
+        self.file.write(len(data).to_bytes(4, "little") + data)
+
+    def _rewrite(self):
+        if self.path is None:
+            return
+        if self.file is not None:
+            self.file.close()
+        self._open()
+        self.written = 0
+        self.flush()
+
+    def close(self):
+        self.flush()
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+def read(path):
+    """Every event in a log file."""
+    events = []
+    for batch in _frames(path)[1:]:
+        events.extend(batch)
+    return events
+
+
+def read_seed(path):
+    """The seed of the session a log file is of."""
+    frames = _frames(path)
+    if not frames:
+        raise ValueError("event log cut short before its seed")
+    return frames[0]
+
+
+def _frames(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[:len(MAGIC) + 1] != MAGIC + bytes([FORMAT]):
+        raise ValueError("not an event log this version can read")
+    frames = []
+    offset = len(MAGIC) + 1
+    with memoryview(data) as view:
+        while offset + 4 <= len(data):
+            size = int.from_bytes(view[offset:offset + 4], "little")
+            offset += 4
+            if offset + size > len(data):
+                break  # cut short by a crash mid-write
+            frames.append(marshal.loads(view[offset:offset + size]))
+            offset += size
+    return frames
+
+
+def fold(events, state=game_state, upto=None):
+    """The state after the events (up to choice `upto`), from `state`."""
+    moved = {}
+    for choice, key, delta in events:
+        if upto is not None and choice > upto:
+            break
+        moved[key] = moved.get(key, 0) + delta
+    # type() turns a moved flag back into a bool
+    return state.replace(**{key: type(state[key])(state[key] + delta)
+                            for key, delta in moved.items()})
+
+
+# -----------------------------------------------------------------------------
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show a session's event log")
+    parser.add_argument("log")
+    parser.add_argument("--choice", type=int, help="rebuild the state after this many choices")
+    args = parser.parse_args()
+
+    events = read(args.log)
+    print(f"seed {read_seed(args.log)}")
+    for choice, key, delta in events:
+        if args.choice is not None and choice > args.choice:
+            break
+        print(f"  after choice {choice:>3}  {key:<22}{delta:>+4}")
+    state = fold(events, upto=args.choice)
+    print("\nstate:")
+    for key, value in state.items():
+        print(f"  {key:<22}{value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# Branch Explorer
+# Walks every path through the scene graph, through every option of every
+# choice menu and both sides of the grab tie-break, without printing or
+# sleeping. Paths that reach the same node with the same game_state are
+# merged (scenegraph.Paths) and carried on as one, counting how many paths they stand for,
+# so the work grows with the number of distinct states instead of with
+# the number of paths.
+#
+# NATIVE scenes (the intro and character selection) only ask for names,
+# so the explorer steps over them.
+#
+# Usage: python explore.py [--endings 10]
+
+import argparse
+import time
+from collections import Counter
+
+from scenegraph import CHOICE, END, RANDOM, SCENE, Paths, assign, load_story
+from story import game_state
+
+
+class Path:
+    """Every path that has reached a node in the same state."""
+
+    def __init__(self, count, choices):
+        self.count = count  # how many paths were merged into this one
+        self.choices = choices  # one of them: menu indexes and tie-breaks taken
+
+    def merge(self, other):
+        self.count += other.count
+        return self
+
+
+def explore(graph, state=game_state):
+    """Walk every path; returns ({(final state, variables): Path}, states visited)."""
+    nodes = graph.nodes
+    paths = Paths(graph, Path.merge)
+    endings = {}
+    visited = 0
+
+    paths.arrive(0, state, (), Path(1, ()))
+    for i, groups in paths:
+        node = nodes[i]
+        kind = node[0]
+        for (state, variables), path in groups.items():
+            visited += 1
+            if kind == END:
+                endings[(state, variables)] = path
+            elif kind == SCENE:
+                paths.arrive(i + 1, state, (), path)
+            elif kind == CHOICE or kind == RANDOM:
+                options = range(len(node[2])) if kind == CHOICE else node[2]
+                for option in options:
+                    paths.arrive(i + 1, state, assign(variables, node[1], option),
+                                 Path(path.count, path.choices + (option,)))
+            else:
+                paths.follow(i, state, variables, path)
+    return endings, visited
+
+
+# -----------------------------------------------------------------------------
+
+
+def summarize(endings):
+    """Count who is grabbed, who hesitates and the final trust, over all paths."""
+    grabbed, hesitated, trust = Counter(), Counter(), Counter()
+    for (state, variables), path in endings.items():
+        who = dict(variables).get("grabbed")
+        grabbed[who] += path.count
+        # The other one hesitates if they are still angry enough (SCENE 5C)
+        rescuer = "Grayson" if who == "GRAHAM" else "Graham"
+        if state[f"{rescuer}Anger"] >= 3:
+            hesitated[rescuer.upper()] += path.count
+        trust[(state["GraysonTrustInGraham"], state["GrahamTrustInGrayson"])] += path.count
+    return grabbed, hesitated, trust
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Walk every path through the story")
+    parser.add_argument("--endings", type=int, default=10,
+                        help="how many endings to list, most common first (-1 for all)")
+    args = parser.parse_args()
+
+    graph = load_story()
+    started = time.perf_counter()
+    endings, visited = explore(graph)
+    elapsed = time.perf_counter() - started
+    total = sum(path.count for path in endings.values())
+    grabbed, hesitated, trust = summarize(endings)
+
+    print(f"{total} paths (every choice and tie-break), {visited} merged states walked, "
+          f"{len(endings)} distinct endings, {elapsed * 1e3:.0f} ms\n")
+    print("grabbed:")
+    for who, count in grabbed.most_common():
+        print(f"  {who:<10}{count:>10}  {count / total:6.1%}")
+    print("hesitates:")
+    for who, count in hesitated.most_common():
+        print(f"  {who:<10}{count:>10}  {count / total:6.1%}")
+    print("final trust (Grayson in Graham, Graham in Grayson):")
+    for (grayson, graham), count in sorted(trust.items()):
+        print(f"  {grayson:>3} {graham:>3}   {count:>10}  {count / total:6.1%}")
+
+    shown = sorted(endings.items(), key=lambda item: -item[1].count)
+    if args.endings >= 0:
+        shown = shown[:args.endings]
+    print(f"\n{len(shown)} of {len(endings)} endings, with one way to reach each:")
+    for (state, variables), path in shown:
+        changed = {key: value for key, value in state.items() if value != game_state[key]}
+        choices = " ".join(str(choice) for choice in path.choices)
+        print(f"  {path.count:>8}  {dict(variables).get('grabbed')}  {changed}")
+        print(f"            {choices}")
+
+
+if __name__ == "__main__":
+    main()
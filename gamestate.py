@@ -0,0 +1,64 @@
+# Game State
+# game_state as an immutable value instead of a dict: a named tuple with
+# no per-instance __dict__, hashable and compared by value. Changing it
+# gives back a new state, so a snapshot is just a reference, and equal
+# states can be merged in sets and dicts (explore.py) without copying.
+
+from collections import namedtuple
+
+
+class GameState:
+    """Read a state by key like the dict it replaces; change it with set(),
+    add() or replace(), which return a new state."""
+
+    __slots__ = ()
+    INDEX = {}  # key -> its position in the tuple
+
+    def __getitem__(self, key):
+        if type(key) is str:
+            if key in self.INDEX:
+                return getattr(self, key)  # the field's C getter, faster than indexing
+            raise KeyError(key)
+        return tuple.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self.INDEX else default
+
+    def keys(self):
+        return self._fields
+
+    def items(self):
+        return zip(self._fields, self)
+
+    def set(self, key, value):
+        """A copy with key set to value."""
+        values = list(self)
+        values[self.INDEX[key]] = value
+        return tuple.__new__(type(self), values)
+
+    def add(self, key, amount):
+        """A copy with amount added to key."""
+        values = list(self)
+        values[self.INDEX[key]] += amount
+        return tuple.__new__(type(self), values)
+
+    def replace(self, **changes):
+        """A copy with several keys changed."""
+        values = list(self)
+        for key, value in changes.items():
+            values[self.INDEX[key]] = value
+        return tuple.__new__(type(self), values)
+
+
+def state_type(defaults, name="GameState"):
+    """A GameState class with a field for each key of `defaults`, in order."""
+    fields = namedtuple(name, defaults)
+    return type(name, (GameState, fields), {
+        "__slots__": (),
+        "INDEX": {key: n for n, key in enumerate(fields._fields)},
+    })
+
+
+def initial_state(defaults):
+    """The starting GameState for a dict of keys and their starting values."""
+    return state_type(defaults)(*defaults.values())
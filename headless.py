@@ -0,0 +1,28 @@
+# Headless Player
+# Plays the story from a fixed list of answers instead of a keyboard,
+# so whole playthroughs can run in CI on a virtual clock.
+
+from engine import REWIND
+
+
+class ScriptedPlayer:
+    """Answers prompts and choice menus from a script."""
+
+    def __init__(self, lines=(), choices=()):
+        self.lines = list(lines)  # answers to input() prompts, in order
+        self.choices = list(choices)  # menu indexes, in order (REWIND goes back); 0 once used up
+
+    def line(self, prompt):
+        """Answer a text prompt."""
+        if not self.lines:
+            raise EOFError(f"no scripted answer for {prompt!r}")
+        return self.lines.pop(0)
+
+    def choose(self, options):
+        """Pick the next scripted option."""
+        index = self.choices.pop(0) if self.choices else 0
+        if index == REWIND:
+            return index
+        if not 0 <= index < len(options):
+            raise ValueError(f"choice {index} out of range for {options}")
+        return index
@@ -0,0 +1,185 @@
+# Key Decoder
+# Reads everything the terminal (or a socket) has ready in one go and
+# decodes it into key events, without ever blocking in the middle of an
+# escape sequence.
+
+import codecs
+import os
+import selectors
+from collections import deque
+
+if os.name == 'nt':  # Windows
+    import msvcrt
+
+# Key events; anything else comes through as the typed character
+UP = "up"
+DOWN = "down"
+RIGHT = "right"
+LEFT = "left"
+ENTER = "enter"
+ESCAPE = "escape"
+UNKNOWN = "unknown"  # a complete escape sequence we have no name for
+
+# How long a lone ESC waits for the rest of its sequence
+ESCAPE_TIMEOUT = 0.05
+
+ARROWS = {"A": UP, "B": DOWN, "C": RIGHT, "D": LEFT}
+
+
+class KeyParser:
+    """Incremental parser from raw bytes to key events.
+
+    Handles CSI (ESC [ ... final) and SS3 (ESC O x) sequences split across
+    reads. It never blocks; a half-finished sequence waits in the buffer
+    until more bytes arrive or flush() gives up on it.
+    """
+
+    def __init__(self):
+        self.buf = b""
+        self.text = codecs.getincrementaldecoder("utf-8")("replace")
+
+    def feed(self, data):
+        """Add bytes and return every key they complete."""
+        self.buf += data
+        keys = []
+        i, n = 0, len(self.buf)
+        while i < n:
+            byte = self.buf[i]
+            if byte == 0x1b:
+                end, key = self._escape(i)
+                if end is None:
+                    break  # incomplete: keep it for the next read
+                keys.append(key)
+                i = end
+            elif byte in (0x0d, 0x0a):
+                keys.append(ENTER)
+                i += 1
+                # A terminal or telnet client may send CR LF / CR NUL for one Enter
+                if byte == 0x0d and i < n and self.buf[i] in (0x0a, 0x00):
+                    i += 1
+            else:
+                j = i + 1
+                while j < n and self.buf[j] not in (0x1b, 0x0d, 0x0a):
+                    j += 1
+                keys.extend(self.text.decode(self.buf[i:j]))
+                i = j
+        self.buf = self.buf[i:]
+        return keys
+
+    def flush(self):
+        """Give up waiting on a partial sequence: it was a plain Escape."""
+        if not self.buf:
+            return []
+        rest, self.buf = self.buf[1:], b""
+        return [ESCAPE] + self.feed(rest)
+
+    @property
+    def pending(self):
+        """True while a partial escape sequence is buffered."""
+        return bool(self.buf)
+
+    def _escape(self, i):
+        buf, n = self.buf, len(self.buf)
+        if i + 1 >= n:
+            return None, None
+        kind = buf[i + 1]
+        if kind == ord("O"):  # SS3: ESC O x
+            if i + 2 >= n:
+                return None, None
+            return i + 3, ARROWS.get(chr(buf[i + 2]), UNKNOWN)
+        if kind == ord("["):  # CSI: ESC [ params final
+            j = i + 2
+            while j < n and not 0x40 <= buf[j] <= 0x7e:
+                j += 1
+            if j >= n:
+                return None, None
+            return j + 1, ARROWS.get(chr(buf[j]), UNKNOWN)
+        return i + 1, ESCAPE  # ESC followed by something else
+
+
+class KeyDecoder:
+    """Key events from anything with a file descriptor: a TTY, pipe or socket."""
+
+    def __init__(self, source=None, timeout=ESCAPE_TIMEOUT):
+        self.source = source  # None means stdin
+        self.timeout = timeout
+        self.parser = KeyParser()
+        self.keys = deque()
+        self.selector = None
+
+    def fileno(self):
+        if self.source is None:
+            return 0
+        return self.source if isinstance(self.source, int) else self.source.fileno()
+
+    def read_keys(self, timeout=None):
+        """Return every key available, waiting up to timeout (None: forever) for one."""
+        if not self.keys:
+            self._fill(timeout)
+        keys = list(self.keys)
+        self.keys.clear()
+        return keys
+
+    def get_key(self):
+        """Return the next key, waiting for one if needed."""
+        while not self.keys:
+            self._fill(None)
+        return self.keys.popleft()
+
+    def _fill(self, timeout):
+        if self.selector is None:
+            self.selector = selectors.DefaultSelector()
+            self.selector.register(self.fileno(), selectors.EVENT_READ)
+        wait = timeout
+        while True:
+            if not self.selector.select(wait):
+                if self.parser.pending:
+                    # Nothing more came: a lone Escape or a cut-off sequence
+                    self.keys.extend(self.parser.flush())
+                if self.keys or timeout is not None:
+                    return
+                wait = timeout
+                continue
+            data = os.read(self.fileno(), 4096)  # whatever is ready, never blocks
+            if not data:
+                raise EOFError("key source closed")
+            self.keys.extend(self.parser.feed(data))
+            # Drain anything else already waiting, or give a partial
+            # sequence a moment to finish
+            wait = self.timeout if self.parser.pending else 0
+
+    def close(self):
+        if self.selector is not None:
+            self.selector.close()
+            self.selector = None
+
+
+class WindowsKeys:
+    """Key events from the Windows console, with the same interface as KeyDecoder."""
+
+    # Second byte of a special key
+    SPECIAL = {b'H': UP, b'P': DOWN, b'M': RIGHT, b'K': LEFT}
+
+    def get_key(self):
+        """Return the next key, waiting for one if needed."""
+        first_char = msvcrt.getch()  # Read a single character
+        if first_char == b'\xe0' or first_char == b'\x00':  # Arrow keys or special keys
+            return self.SPECIAL.get(msvcrt.getch(), UNKNOWN)
+        elif first_char == b'\r':
+            return ENTER
+        elif first_char == b'\x1b':
+            return ESCAPE
+        else:
+            return first_char.decode(errors="replace")
+
+    def read_keys(self):
+        """Return every key already waiting, blocking until there is one."""
+        keys = [self.get_key()]
+        while msvcrt.kbhit():
+            keys.append(self.get_key())
+        return keys
+
+
+def console_keys():
+    """Key source for whoever is at this machine's keyboard."""
+    return WindowsKeys() if os.name == 'nt' else KeyDecoder()
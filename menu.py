@@ -0,0 +1,43 @@
+# Menu Renderer
+# Remembers what the choice menu looks like on screen, so moving the
+# highlight only rewrites the two "> " markers that changed.
+
+import sys
+
+
+class MenuRenderer:
+    """Draw a choice menu, then repaint only what changed."""
+
+    def __init__(self, options, out=None):
+        self.options = options
+        self.out = out  # None means whatever sys.stdout is at draw time
+        self.shown = None  # highlighted index currently on screen
+
+    def draw(self, index):
+        """Show `index` highlighted, in one write; the cursor ends below the menu."""
+        if index == self.shown:
+            return
+        if self.shown is None:
+            text = "".join(f"{self._prefix(i, index)}{opt}\n"
+                           for i, opt in enumerate(self.options))
+        else:
+            text = self._move(self.shown, index)
+        self.shown = index
+        out = self.out or sys.stdout
+        out.write(text)
+        out.flush()
+
+    def _prefix(self, i, index):
+        return "> " if i == index else "  "
+
+    def _move(self, old, new):
+        # The cursor rests at the start of the line below the last option
+        n = len(self.options)
+        return (f"\033[{n - old}A\r  "  # up to the old line, unmark it
+                f"{self._shift(old, new)}\r> "  # across to the new one, mark it
+                f"\033[{n - new}B\r")  # and back below the menu
+
+    def _shift(self, old, new):
+        if new > old:
+            return f"\033[{new - old}B"
+        return f"\033[{old - new}A"
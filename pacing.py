@@ -0,0 +1,121 @@
+# Pacing Clock
+# Every pause and typewriter delay is scheduled against an absolute
+# deadline, so an oversleep is made up by the next pause instead of
+# piling up over the whole story.
+
+import sys
+import time
+from contextlib import contextmanager
+
+# If we fall this far behind the schedule, start a fresh one instead of
+# rushing through the backlog
+MAX_LAG = 1.0
+
+
+class PacingClock:
+    """Monotonic clock that keeps the story on its scripted schedule."""
+
+    def __init__(self, max_lag=MAX_LAG):
+        self.max_lag = max_lag
+        self.cursor = None  # deadline the scripted schedule has reached
+        self.scenes = []  # [name, scripted, started, blocked, ended]
+
+    def now(self):
+        return time.monotonic()
+
+    def sleep(self, seconds):
+        time.sleep(seconds)
+
+    def sleep_until(self, deadline):
+        """Sleep until the deadline, if it is still ahead of us."""
+        wait = deadline - self.now()
+        if wait > 0:
+            self.sleep(wait)
+
+    def origin(self):
+        """Return the deadline the next scheduled span starts from."""
+        now = self.now()
+        if self.cursor is None or now - self.cursor > self.max_lag:
+            self.cursor = now
+        return self.cursor
+
+    def schedule(self, seconds):
+        """Reserve the next span of the schedule and return (start, end)."""
+        start = self.origin()
+        self.cursor = start + seconds
+        if self.scenes:
+            self.scenes[-1][1] += seconds
+        return start, self.cursor
+
+    def pause(self, seconds):
+        """Wait until the schedule is `seconds` further along."""
+        _, end = self.schedule(seconds)
+        self.sleep_until(end)
+
+    def resync(self):
+        """Drop the current schedule; the next pause starts from now."""
+        self.cursor = None
+
+    @contextmanager
+    def hold(self):
+        """Stop the schedule while blocked on the player."""
+        started = self.now()
+        try:
+            yield
+        finally:
+            if self.scenes:
+                self.scenes[-1][3] += self.now() - started
+            self.resync()
+
+    def scene(self, name):
+        """Close the current scene's timing and start a new one."""
+        now = self.now()
+        if self.scenes:
+            self.scenes[-1][4] = now
+        self.scenes.append([name, 0.0, now, 0.0, None])
+
+    def report(self):
+        """Return [(scene, scripted, actual), ...] for every scene so far."""
+        now = self.now()
+        rows = []
+        for name, scripted, started, blocked, ended in self.scenes:
+            actual = (ended if ended is not None else now) - started - blocked
+            rows.append((name, scripted, actual))
+        return rows
+
+
+class VirtualClock(PacingClock):
+    """Simulated clock for headless runs: sleeping advances time instantly."""
+
+    def __init__(self, max_lag=MAX_LAG):
+        super().__init__(max_lag)
+        self.t = 0.0  # player-perceived seconds so far
+
+    def now(self):
+        return self.t
+
+    def sleep(self, seconds):
+        self.t += seconds
+
+
+def format_report(rows):
+    """Render report() rows as a table of scripted vs actual seconds."""
+    lines = [f"{'scene':<34}{'scripted':>10}{'actual':>10}{'drift':>9}{'drift %':>9}"]
+    total_scripted = total_actual = 0.0
+    for name, scripted, actual in rows:
+        total_scripted += scripted
+        total_actual += actual
+        lines.append(_report_line(name, scripted, actual))
+    lines.append(_report_line("TOTAL", total_scripted, total_actual))
+    return "\n".join(lines)
+
+
+def _report_line(name, scripted, actual):
+    drift = actual - scripted
+    percent = 100 * drift / scripted if scripted else 0.0
+    return f"{name[:33]:<34}{scripted:>10.2f}{actual:>10.2f}{drift:>+9.2f}{percent:>+8.1f}%"
+
+
+def print_report(clock, out=None):
+    """Print the pacing report for a finished (or interrupted) run."""
+    print("\n" + format_report(clock.report()), file=out or sys.stderr)
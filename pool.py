@@ -0,0 +1,179 @@
+# Process Pool
+# Spreads the server's sessions over worker processes, one interpreter per
+# core. The supervisor forks the workers up front, accepts every
+# connection itself and hands the socket to the worker with the fewest
+# sessions (over a Unix socket, with SCM_RIGHTS). From then on the
+# connection is the worker's: every key the player sends goes straight to
+# the process their session lives in. A worker tells the supervisor when a
+# session ends, which is how it knows the load.
+#
+# With pairs, the supervisor holds on to a player until a second one
+# connects and hands the two over together.
+#
+# Linux only: besides fork and passing sockets between processes, the
+# supervisor and its workers talk over SOCK_SEQPACKET Unix sockets, which
+# keep each message whole and say when the other end is gone. macOS has no
+# such sockets (and datagram ones never tell of a dead peer); see supported().
+
+import asyncio
+import gc
+import os
+import selectors
+import signal
+import socket
+import traceback
+
+FINISHED = b"."  # worker -> supervisor: one of my sessions ended
+
+
+def supported():
+    """Whether this system can run the pool."""
+    try:
+        ours, theirs = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+    except (AttributeError, OSError):
+        return False
+    ours.close()
+    theirs.close()
+    return hasattr(os, "fork") and hasattr(socket, "send_fds")
+
+
+class Worker:
+    """The supervisor's end of a worker process."""
+
+    def __init__(self, pid, channel):
+        self.pid = pid
+        self.channel = channel
+        self.sessions = 0
+
+
+def fork_worker(listener, work):
+    """Fork a process that runs work(channel), channel being its end of a
+    Unix socket to the supervisor."""
+    ours, theirs = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+    pid = os.fork()
+    if pid == 0:
+        try:
+            listener.close()
+            ours.close()
+            signal.signal(signal.SIGINT, signal.SIG_IGN)  # the supervisor stops us
+            work(theirs)
+        except BaseException:
+            traceback.print_exc()
+            os._exit(1)
+        os._exit(0)  # not back into the supervisor's loop
+    theirs.close()
+    return Worker(pid, ours)
+
+
+def supervise(host, port, workers, work, waiting=None):
+    """Accept connections on host:port and share them out among `workers`
+    forked processes, each running work(channel) (see Shard). If waiting
+    is given, players go in pairs, and it is sent to each one held for a
+    partner."""
+    listener = socket.create_server((host, port), backlog=4096)
+    # Leave what is loaded by now (the story) out of the workers' garbage
+    # collections: a collection writes to every object it looks at, which
+    # would copy each page of it into every worker
+    gc.collect()
+    gc.freeze()
+    pool = [fork_worker(listener, work) for _ in range(workers)]
+    address, port = listener.getsockname()[:2]
+    print(f"serving the story on {address}:{port} with {workers} workers", flush=True)
+
+    selector = selectors.DefaultSelector()
+    selector.register(listener, selectors.EVENT_READ)
+    for worker in pool:
+        selector.register(worker.channel, selectors.EVENT_READ, worker)
+    held = None  # with pairs, a player waiting for a partner
+    try:
+        while True:
+            for key, _ in selector.select():
+                worker = key.data
+                if worker is None:
+                    conn, _ = listener.accept()
+                    if waiting is None:
+                        conns = [conn]
+                    elif held is None or not connected(held):
+                        if held is not None:
+                            held.close()
+                        held = conn
+                        try:
+                            conn.send(waiting, socket.MSG_DONTWAIT)
+                        except OSError:
+                            pass  # gone already; the next one replaces it
+                        continue
+                    else:
+                        conns, held = [held, conn], None
+                    worker = min(pool, key=lambda w: w.sessions)
+                    try:
+                        socket.send_fds(worker.channel, [b"c"], [c.fileno() for c in conns])
+                        worker.sessions += 1
+                    except OSError:
+                        pass  # a dead worker: its channel says so next
+                    for conn in conns:
+                        conn.close()  # the worker has its own copy now
+                    continue
+                try:
+                    data = worker.channel.recv(4096)
+                except ConnectionError:
+                    data = b""
+                if data:
+                    worker.sessions -= 1
+                    continue
+                # The worker died, and its players with it: start another
+                selector.unregister(worker.channel)
+                worker.channel.close()
+                os.waitpid(worker.pid, 0)
+                pool.remove(worker)
+                print(f"worker {worker.pid} died; starting another", flush=True)
+                worker = fork_worker(listener, work)
+                pool.append(worker)
+                selector.register(worker.channel, selectors.EVENT_READ, worker)
+    finally:
+        for worker in pool:
+            os.kill(worker.pid, signal.SIGTERM)
+        for worker in pool:
+            os.waitpid(worker.pid, 0)
+        listener.close()
+
+
+def connected(sock):
+    """Whether the other end of sock is still there."""
+    try:
+        return sock.recv(1, socket.MSG_PEEK | socket.MSG_DONTWAIT) != b""
+    except BlockingIOError:
+        return True  # nothing sent, but connected
+    except OSError:
+        return False
+
+
+class Shard:
+    """A worker's end: the connections the supervisor hands it, one at a
+    time or (with pairs) two together."""
+
+    def __init__(self, channel):
+        self.channel = channel
+        self.handed = asyncio.Queue()
+        asyncio.get_running_loop().add_reader(channel, self._receive)
+
+    def _receive(self):
+        try:
+            data, fds, _, _ = socket.recv_fds(self.channel, 1024, 64)
+        except ConnectionError:
+            data, fds = b"", []
+        if fds:
+            self.handed.put_nowait([socket.socket(fileno=fd) for fd in fds])
+        if not data:  # the supervisor is gone
+            asyncio.get_running_loop().remove_reader(self.channel)
+            self.handed.put_nowait(None)
+
+    async def accept(self):
+        """The next connections handed to us, or None when the supervisor is gone."""
+        return await self.handed.get()
+
+    def finished(self):
+        """Tell the supervisor a session is over."""
+        try:
+            self.channel.send(FINISHED)
+        except OSError:
+            pass  # it's gone; we are on our way out too
@@ -0,0 +1,282 @@
+# Scene Graph
+# The story as one flat list of nodes: text runs with their pacing,
+# choice menus, game_state effects and the branches between them. The
+# engine plays the graph in a single loop, and tools can walk it without
+# printing or sleeping.
+#
+# storycompiler.py builds the graph from the scene functions in story.py.
+# load_story() keeps the result in a cache next to story.py's own
+# bytecode, keyed by a hash of everything the graph is built from, so a
+# launch only compiles when one of those files has changed.
+#
+# Paths walks every path through the graph without playing it, merging
+# the paths that meet in the same state (explore.py, timing.py and
+# simulate.py are built on it).
+
+import heapq
+import marshal
+import mmap
+import operator
+import os
+import sys
+from importlib.util import source_hash
+
+import story as story_module
+
+
+# -----------------------------------------------------------------------------
+
+
+# Node kinds. Every node is a tuple whose first item is one of these.
+SCENE = 0    # (SCENE, title)                 start of a scene
+TEXT = 1     # (TEXT, text, delay, pause)     typewriter run, then a pause
+PAUSE = 2    # (PAUSE, seconds)
+PRINT = 3    # (PRINT, text)                  printed at once, end included
+CLEAR = 4    # (CLEAR,)
+CHOICE = 5   # (CHOICE, var, choices)         menu; the index goes in var
+SET = 6      # (SET, key, value)              game_state[key] = value
+ADD = 7      # (ADD, key, amount)             game_state[key] += amount
+LET = 8      # (LET, var, value)
+RANDOM = 9   # (RANDOM, var, options)         var = random.choice(options)
+BRANCH = 10  # (BRANCH, cond, target)         jump to target unless cond holds
+JUMP = 11    # (JUMP, target)
+NATIVE = 12  # (NATIVE, name)                 run story.<name>(session)
+END = 13     # (END,)
+
+# Nodes that only show something; tools that follow the state skip them
+OUTPUT = {TEXT, PAUSE, PRINT, CLEAR, NATIVE}
+
+NAMES = ["SCENE", "TEXT", "PAUSE", "PRINT", "CLEAR", "CHOICE", "SET", "ADD",
+         "LET", "RANDOM", "BRANCH", "JUMP", "NATIVE", "END"]
+
+# Conditions are (op, a, b) for comparisons, where a and b are
+# ("state", key), ("var", name) or ("const", value); or ("and"/"or", c, ...)
+# and ("not", c).
+OPERATORS = {
+    "==": operator.eq, "!=": operator.ne, "<": operator.lt,
+    "<=": operator.le, ">": operator.gt, ">=": operator.ge,
+}
+
+# Cache files start with MAGIC, FORMAT and a hash of the sources below
+MAGIC = b"NSVG"
+FORMAT = 1  # bump when the node layout changes
+HERE = os.path.dirname(os.path.abspath(__file__))
+SOURCES = [os.path.join(HERE, name) for name in ("scenegraph.py", "storycompiler.py", "engine.py")]
+
+
+class SceneGraph:
+    """The compiled story: nodes, plus the index where each scene starts."""
+
+    def __init__(self, nodes, scenes, module=story_module):
+        self.nodes = nodes  # list of node tuples
+        self.scenes = scenes  # [(title, index), ...] in playing order
+        self.module = module  # where NATIVE scenes are looked up
+
+    def native(self, name):
+        """The scene function a NATIVE node runs."""
+        return getattr(self.module, name)
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def scene_at(self, i):
+        """The title of the scene node i is in."""
+        return [title for title, start in self.scenes if start <= i][-1]
+
+    def successors(self, i):
+        """Indexes the story can go to after node i (a choice's branches
+        come from the BRANCH nodes that follow it)."""
+        node = self.nodes[i]
+        kind = node[0]
+        if kind == END:
+            return ()
+        if kind == JUMP:
+            return (node[1],)
+        if kind == BRANCH:
+            return (i + 1, node[2])
+        return (i + 1,)
+
+    def skips(self):
+        """For each node, the first node from there on that isn't OUTPUT."""
+        skip = [0] * len(self.nodes)
+        following = len(self.nodes) - 1
+        for i in range(len(self.nodes) - 1, -1, -1):
+            if self.nodes[i][0] not in OUTPUT:
+                following = i
+            skip[i] = following
+        return skip
+
+
+# -----------------------------------------------------------------------------
+
+
+def evaluate(cond, state, variables):
+    """Evaluate a compiled condition against a game_state and variables."""
+    op = cond[0]
+    if op == "and":
+        return all(evaluate(c, state, variables) for c in cond[1:])
+    if op == "or":
+        return any(evaluate(c, state, variables) for c in cond[1:])
+    if op == "not":
+        return not evaluate(cond[1], state, variables)
+    return OPERATORS[op](_operand(cond[1], state, variables),
+                         _operand(cond[2], state, variables))
+
+
+def _operand(operand, state, variables):
+    kind, value = operand
+    if kind == "state":
+        return state[value]
+    if kind == "var":
+        return variables.get(value)
+    return value
+
+
+# -----------------------------------------------------------------------------
+
+
+class Paths:
+    """Every path through a graph, walked without playing it. arrive()
+    sends a group of paths to a node; groups that reach the same node in
+    the same state (game state and scene variables) are merged into one,
+    so the work grows with the number of distinct states instead of with
+    the number of paths. Iterating takes each node's groups in node order.
+
+    A group is whatever the walker keeps of its paths (how many there are,
+    how long they took, ...); merge(group, other) returns the two as one."""
+
+    def __init__(self, graph, merge):
+        self.nodes = graph.nodes
+        self.skip = graph.skips()  # text and the like can't change the state
+        self.merge = merge
+        self.waiting = {}  # node -> {(state, variables): group}
+        self.queue = []  # nodes with groups waiting, lowest first
+        # Menu indexes only matter until the branches after the menu are taken
+        self.menus = {node[1] for node in graph.nodes if node[0] == CHOICE}
+
+    def arrive(self, i, state, variables, group):
+        """Send a group of paths to node i (so to the first node from there
+        that isn't OUTPUT). variables is a tuple from assign()."""
+        i = self.skip[i]
+        node = self.nodes[i]
+        if node[0] in (CHOICE, RANDOM, LET, END):
+            # About to be overwritten (or the story is over): forget it, so
+            # paths that differ only there merge
+            dead = self.menus if node[0] == END else {node[1]}
+            variables = tuple(item for item in variables if item[0] not in dead)
+        at = self.waiting.get(i)
+        if at is None:
+            at = self.waiting[i] = {}
+            heapq.heappush(self.queue, i)
+        key = (state, variables)
+        at[key] = self.merge(at[key], group) if key in at else group
+
+    def __iter__(self):
+        """(node index, {(state, variables): group}) for every node reached."""
+        # Every jump goes forward, so a node's groups have all arrived by its turn
+        while self.queue:
+            i = heapq.heappop(self.queue)
+            yield i, self.waiting.pop(i)
+
+    def follow(self, i, state, variables, group):
+        """Send a group at node i on if the node only changes the state or
+        jumps (LET, SET, ADD, BRANCH, JUMP); returns whether it did."""
+        node = self.nodes[i]
+        kind = node[0]
+        if kind == LET:
+            self.arrive(i + 1, state, assign(variables, node[1], node[2]), group)
+        elif kind == SET:
+            self.arrive(i + 1, state.set(node[1], node[2]), variables, group)
+        elif kind == ADD:
+            self.arrive(i + 1, state.add(node[1], node[2]), variables, group)
+        elif kind == BRANCH:
+            taken = evaluate(node[1], state, dict(variables))
+            self.arrive(i + 1 if taken else node[2], state, variables, group)
+        elif kind == JUMP:
+            self.arrive(node[1], state, variables, group)
+        else:
+            return False
+        return True
+
+
+def assign(variables, name, value):
+    """variables with name set to value, in a fixed order so equal states merge."""
+    return tuple(sorted(dict(variables, **{name: value}).items()))
+
+
+# -----------------------------------------------------------------------------
+
+
+def load_story(module=story_module):
+    """The story's scene graph, from the cache when it is up to date."""
+    header = cache_header(module)
+    path = cache_path(module)
+    graph = _read_cache(path, header, module)
+    if graph is None:
+        from storycompiler import compile_story  # only needed on a cache miss
+        graph = compile_story(module)
+        if not sys.dont_write_bytecode:
+            _write_cache(path, header, graph)
+    return graph
+
+
+def cache_path(module=story_module):
+    """Where the module's graph is cached: beside its .pyc files."""
+    name = f"{module.__name__}.{sys.implementation.cache_tag}.graph"
+    return os.path.join(os.path.dirname(os.path.abspath(module.__file__)), "__pycache__", name)
+
+
+def cache_header(module=story_module):
+    """The header a cache of the module's graph must start with."""
+    sources = []
+    for path in [module.__file__] + SOURCES:
+        with open(path, "rb") as f:
+            sources.append(f.read())
+    # The same hash hash-based .pyc files use; it changes with the Python version too
+    return MAGIC + bytes([FORMAT, marshal.version]) + source_hash(b"\0".join(sources))
+
+
+def _read_cache(path, header, module):
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if data[:len(header)] != header:
+                return None  # another version, or the sources changed
+            with memoryview(data) as view, view[len(header):] as payload:
+                nodes, scenes = marshal.loads(payload)
+    except (OSError, ValueError, EOFError, TypeError):
+        return None  # missing, empty or damaged
+    return SceneGraph(nodes, scenes, module)
+
+
+def _write_cache(path, header, graph):
+    temp = f"{path}.{os.getpid()}"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temp, "wb") as f:
+            f.write(header)
+            marshal.dump((graph.nodes, graph.scenes), f)
+        os.replace(temp, path)  # readers never see half a file
+    except OSError:
+        pass  # can't write next to story.py; compile every launch instead
+
+
+# -----------------------------------------------------------------------------
+
+
+def main():
+    """Print what the story compiles to."""
+    graph = load_story()
+    counts = {}
+    for node in graph.nodes:
+        counts[NAMES[node[0]]] = counts.get(NAMES[node[0]], 0) + 1
+    print(f"{len(graph)} nodes in {len(graph.scenes)} scenes")
+    for name in NAMES:
+        if name in counts:
+            print(f"  {name:<8}{counts[name]:>6}")
+    native = [node[1] for node in graph.nodes if node[0] == NATIVE]
+    if native:
+        print(f"run as code: {', '.join(native)}")
+
+
+if __name__ == "__main__":
+    main()
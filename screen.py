@@ -0,0 +1,63 @@
+# Screen Manager
+# Clears the screen with escape sequences written to the output stream,
+# instead of forking a shell to run `clear`/`cls`.
+
+import os
+import sys
+
+# Home the cursor, clear the screen and its scrollback (what `clear` sends)
+CLEAR = "\033[H\033[2J\033[3J"
+ALT_SCREEN_ON = "\033[?1049h"
+ALT_SCREEN_OFF = "\033[?1049l"
+
+
+class Screen:
+    """Clear and home the screen on any output stream, not just the TTY."""
+
+    def __init__(self, out=None, alternate=False):
+        self.out = out  # None means whatever sys.stdout is at the time
+        self.alternate = alternate  # draw on the alternate screen buffer
+        self.entered = False
+        if os.name == 'nt' and out is None:
+            _enable_windows_ansi()
+
+    def write(self, text):
+        out = self.out or sys.stdout
+        out.write(text)
+        out.flush()
+
+    def clear(self):
+        """Clear the screen and put the cursor top left."""
+        self.write(CLEAR)
+
+    def __enter__(self):
+        self.enter()
+        return self
+
+    def __exit__(self, *exc):
+        self.leave()
+
+    def enter(self):
+        """Switch to the alternate screen buffer, if asked to."""
+        if self.alternate and not self.entered:
+            self.write(ALT_SCREEN_ON)
+            self.entered = True
+
+    def leave(self):
+        """Go back to the normal screen, if we switched away from it."""
+        if self.entered:
+            self.write(ALT_SCREEN_OFF)
+            self.entered = False
+
+
+def _enable_windows_ansi():
+    """Turn on escape sequence handling in the Windows console."""
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            kernel32.SetConsoleMode(handle, mode.value | 0x0004)  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+    except (AttributeError, OSError):
+        pass
@@ -0,0 +1,859 @@
+# Story Server
+# Hosts the story over TCP for many players at once. Every connection is
+# its own Session; all of them share one asyncio event loop and one scene
+# graph. engine.steps() runs the story and this file does the showing and
+# asking without blocking, so a player reading or thinking costs a
+# suspended coroutine instead of a thread or a process.
+#
+# Connect with telnet (or nc). The server asks telnet to send keys as they
+# are typed and to leave echoing to it, so the menus work as in a console.
+#
+# Code written for the blocking Session (the NATIVE scenes, the end of
+# select()) runs against a Recording: what it shows comes back as nodes to
+# play, and when it asks for input the player hasn't sent yet, it is run
+# again from the top once the answer is in.
+#
+# The typing and pauses of every session wait on one timer wheel (see
+# Ticker), so a thousand players typing cost one wakeup per frame instead
+# of a thousand timers.
+#
+# With --pairs, players are paired as they connect and share one Session,
+# each on their own connection (see Table): the POV headers in the story
+# say whose part it is.
+#
+# A player who leaves a menu alone for --idle seconds gets their session
+# hibernated: it is written to a file (a checkpoint of the menu) and all
+# but the connection is let go, until their next key wakes it.
+#
+# A client that asks for it (telnet option PACING; see client.py) is sent
+# each run of text whole, with its pacing, and types it out itself. Nothing
+# it is sent needs to go out at a given time then, so it is all held back
+# until the session waits on the player: a packet or so per menu instead
+# of one per frame, and no waiting on the server. (Not for pairs, whose
+# text is paced here for both.)
+#
+# With --workers N, the sessions are spread over N processes (see pool.py),
+# for as many cores. The story's text is kept once for all of them, in
+# shared memory (see textstore.py).
+#
+# Usage: python server.py [--host 127.0.0.1] [--port 2323] [--speed 1] [--pairs] [--workers 1]
+#                         [--idle 60] [--sleep-dir DIR] [--seed N]
+
+import argparse
+import asyncio
+import itertools
+import marshal
+import os
+import shutil
+import tempfile
+from collections import deque
+from contextlib import nullcontext
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import checkpoint
+from engine import REWIND, REWINDS, Session, steps
+from keys import ESCAPE_TIMEOUT, KeyParser
+from menu import MenuRenderer
+from pacing import PacingClock
+from pool import Shard, supervise, supported
+from scenegraph import CHOICE, CLEAR, NATIVE, PAUSE, PRINT, TEXT, load_story
+from story import game_state, povs
+from telnet import DO, DONT, IAC, PACING, PORT, SB, SE, WILL
+from textstore import StoredText, share
+from timerwheel import TimerWheel
+
+IDLE = 60.0  # seconds at a menu before a session hibernates (see --idle)
+MAX_FILES = 65536  # open sockets to ask the system for (one per player)
+
+WAITING = "Waiting for a second player to join...\n"  # with --pairs
+
+# Numbers the files of hibernated sessions
+SLEEPERS = itertools.count()
+
+# POV header -> the character it belongs to, e.g. "GRAHAM"
+POVS = {header: key.split("_")[0].upper() for key, header in povs.items()}
+
+# Telnet: IAC WILL ECHO, IAC WILL SUPPRESS-GO-AHEAD: character at a time,
+# and the server echoes
+TELNET_HELLO = bytes([IAC, WILL, 1, IAC, WILL, 3])
+
+
+class Connection:
+    """A player's socket, as the output and key source of a Session."""
+
+    def __init__(self, reader, writer, pacing=True):
+        self.reader = reader
+        self.writer = writer
+        self.parser = KeyParser()
+        self.keys = deque()
+        self.arrived = asyncio.Event()  # set when keys come in (or the player leaves)
+        self.closed = False
+        self.telnet = b""  # the start of a telnet command cut off by a read
+        self.listener = None
+        self.done = asyncio.Event()  # set when the story is over for this player
+        self.session = None  # the Session playing to it
+        self.idle = None  # seconds a menu waits for a key before hibernating
+        self.sleeping = None  # wakes the hibernated session (a coroutine function)
+        self.task = None  # the woken session
+        self.finished = None  # called once the story is over for this player
+        self.pacing = pacing  # whether the client may do the pacing
+        self.paced = False  # the client types the text out itself (PACING)
+        self.held = []  # what a paced client is sent, until we wait on it
+        self.owed = 0.0  # seconds of typing sent to a paced client since its last key
+
+    def start(self):
+        """Say hello to telnet and start taking in keys."""
+        self.writer.write(TELNET_HELLO)
+        self.listener = asyncio.ensure_future(self._listen())
+
+    def close(self):
+        self.release()
+        if self.listener is not None:
+            self.listener.cancel()
+        self.writer.close()
+        self.done.set()
+        if self.finished is not None:
+            self.finished()
+            self.finished = None
+
+    # Output: what Session, Screen and MenuRenderer write to
+
+    def write(self, text):
+        self.send(encode(text))
+
+    def send(self, data):
+        if self.closed:
+            # Stop typing to no one (and waiting on the timer wheel for it)
+            raise EOFError("player disconnected")
+        if self.paced:
+            self.held.append(data)
+        else:
+            self.writer.write(data)
+
+    def flush(self):
+        pass  # the event loop sends it; drain() waits for it
+
+    def pace(self, text, delay, pause):
+        """Send a run of text whole, for the client to type out."""
+        self.send(bytes([IAC, SB, PACING]))
+        self.send(f"{delay!r} {pause!r}\n".encode())
+        self.send(wire(text))
+        self.send(bytes([IAC, SE]))
+        self.owed += len(text) * delay + pause
+
+    def release(self):
+        """Send everything held back for a paced client, in one write."""
+        if self.held:
+            data = b"".join(self.held)
+            self.held.clear()
+            if not self.closed:
+                self.writer.write(data)
+
+    async def drain(self):
+        self.release()
+        await self.writer.drain()
+
+    # Hooks for sharing one story between players (Table); one player
+    # sees and answers everything
+
+    def showing(self, node):
+        pass
+
+    def choosing(self, choices):
+        self.discard()  # keys pressed during the story don't pick from an unseen menu
+
+    def chose(self, choices, picked):
+        pass
+
+    def asking(self, prompt, player):
+        pass
+
+    # Input
+
+    async def read_keys(self, timeout=None):
+        """Every key the player has sent, waiting for at least one; none if
+        `timeout` seconds go by first (after a paced client has typed out
+        what it was sent)."""
+        self.release()  # all the player has to see before answering
+        if timeout is not None:
+            timeout += self.owed
+        while not self.keys:
+            if self.closed:
+                raise EOFError("player disconnected")
+            self.arrived.clear()
+            try:
+                await asyncio.wait_for(self.arrived.wait(), timeout)
+            except asyncio.TimeoutError:
+                self.owed = 0.0
+                return []
+        self.owed = 0.0  # the client sends keys once it has typed everything out
+        keys = list(self.keys)
+        self.keys.clear()
+        return keys
+
+    async def get_key(self):
+        """The next key, waiting for one if needed."""
+        if not self.keys:
+            self.keys.extend(await self.read_keys())
+        return self.keys.popleft()
+
+    def discard(self):
+        """Forget keys pressed before now (while it wasn't this player's turn)."""
+        self.keys.clear()
+
+    def hibernate(self, wake):
+        """Hold no session until the player sends a key (or leaves), then
+        start wake(), a coroutine function that takes it up again."""
+        self.session = None
+        self.sleeping = wake
+        if self.keys or self.closed:
+            self._wake()
+
+    def _wake(self):
+        if self.sleeping is not None:
+            wake, self.sleeping = self.sleeping, None
+            self.task = asyncio.ensure_future(wake())
+
+    async def _listen(self):
+        try:
+            while True:
+                wait = ESCAPE_TIMEOUT if self.parser.pending else None
+                try:
+                    data = await asyncio.wait_for(self.reader.read(4096), wait)
+                except asyncio.TimeoutError:
+                    self.keys.extend(self.parser.flush())  # a lone Escape
+                    self.arrived.set()
+                    self._wake()
+                    continue
+                if not data:
+                    break
+                self.keys.extend(self.parser.feed(self._strip_telnet(data)))
+                if self.keys:
+                    self.arrived.set()
+                    self._wake()
+        except ConnectionError:
+            pass
+        finally:  # however it ends, wake whoever waits for keys
+            self.closed = True
+            self.arrived.set()
+            self._wake()  # a hibernated session has to see them go, too
+
+    def _strip_telnet(self, data):
+        """data without the telnet commands in it."""
+        data = self.telnet + data
+        self.telnet = b""
+        if IAC not in data:
+            return data
+        kept = bytearray()
+        i, n = 0, len(data)
+        while i < n:
+            if data[i] != IAC:
+                kept.append(data[i])
+                i += 1
+                continue
+            if i + 1 >= n:
+                break
+            command = data[i + 1]
+            if command == IAC:  # an escaped 255
+                kept.append(IAC)
+                i += 2
+            elif WILL <= command <= DONT:  # WILL/WONT/DO/DONT option
+                if i + 2 >= n:
+                    break
+                if command == DO and data[i + 2] == PACING and self.pacing and not self.paced:
+                    self.send(bytes([IAC, WILL, PACING]))
+                    self.paced = True
+                i += 3
+            elif command == SB:  # subnegotiation, up to IAC SE
+                end = data.find(bytes([IAC, SE]), i + 2)
+                if end < 0:
+                    break
+                i = end + 2
+            else:
+                i += 2
+        self.telnet = data[i:]
+        return bytes(kept)
+
+
+class Table:
+    """Two players' connections as one, for a Session they share. Narration
+    goes to both (encoded once, the same bytes written to each socket); from
+    a POV header on, the story and its menus go only to the player whose
+    character it is, and the other sees a short waiting line instead."""
+
+    def __init__(self, conns):
+        self.conns = conns
+        self.session = None  # the shared Session, for the players' names
+        self.turn = None  # whose POV it is; None while the story is shared
+        self.reading = conns[0]  # whose keys menus and prompts read
+        self.idle = None  # a shared session doesn't hibernate
+        self.paced = False  # the text is paced here, for both players
+
+    def targets(self):
+        return self.conns if self.turn is None else (self.turn,)
+
+    def other(self):
+        return [conn for conn in self.conns if conn is not self.turn]
+
+    def write(self, text):
+        self.send(encode(text))
+
+    def send(self, data):
+        if any(conn.closed for conn in self.conns):
+            raise EOFError("a player left")
+        for conn in self.targets():
+            conn.send(data)
+
+    def flush(self):
+        pass
+
+    async def drain(self):
+        for conn in self.conns:
+            await conn.drain()
+
+    def name(self, conn):
+        session = self.session
+        return session.player_1 if conn is self.conns[0] else session.player_2
+
+    def _wait(self, text):
+        """A line for whoever isn't playing right now."""
+        data = encode(text)
+        for conn in self.other():
+            conn.send(data)
+
+    # Hooks from the server's play()
+
+    def showing(self, node):
+        kind = node[0]
+        if kind != PRINT and kind != TEXT:
+            return
+        character = POVS.get(str(node[1]).rstrip("\n"))
+        if character is not None:
+            self.turn = self.owner(character)
+            if self.turn is not None:
+                self._wait(f"\n[{self.name(self.turn)} is playing {character.title()}; "
+                           "waiting for them...]")
+        elif kind == TEXT and self.turn is not None:
+            self._wait(".")  # the story goes on elsewhere
+
+    def owner(self, character):
+        """The connection of the player who chose `character`, if one did."""
+        session = self.session
+        chosen = (session.player_1_character, session.player_2_character)
+        for conn, name in zip(self.conns, chosen):
+            if name and character in name.upper():
+                return conn
+        return None
+
+    def choosing(self, choices):
+        self.reading = self.turn or self.conns[0]
+        self.reading.discard()
+        if self.turn is not None:
+            self._wait(f"\n[{self.name(self.turn)} is choosing...]")
+
+    def chose(self, choices, picked):
+        if self.turn is not None:
+            self._wait(f"\n[{self.name(self.turn)} chose: {choices[picked]}]")
+
+    def asking(self, prompt, player):
+        self.reading = self.conns[1] if player == 2 else self.conns[0]
+        self.reading.discard()
+
+    # Input, from whoever's turn it is
+
+    async def read_keys(self, timeout=None):
+        return await self.reading.read_keys(timeout)
+
+    async def get_key(self):
+        return await self.reading.get_key()
+
+
+def encode(text):
+    """Text as telnet wants it on the wire."""
+    return text.replace("\n", "\r\n").encode()
+
+
+def wire(text):
+    """The bytes to send for a str, or for the story's text (a StoredText,
+    or a slice of one: encoded already, see textstore.py)."""
+    if isinstance(text, str):
+        return encode(text)
+    if isinstance(text, StoredText):
+        return text[:]
+    return text
+
+
+def write(conn, text):
+    """Send a str or the story's text."""
+    conn.send(wire(text))
+
+
+class Ticker:
+    """The pacing waits of every session, kept on one TimerWheel in story
+    time, with one event loop timer for the next tick anything is due in.
+    Story time runs `speed` times faster than real time (for load tests)."""
+
+    def __init__(self, speed=1.0):
+        self.loop = asyncio.get_running_loop()
+        self.speed = speed
+        self.wheel = TimerWheel(now=self.now())
+        self.timer = None  # the event loop timer
+        self.wake = None  # the tick it goes off at
+
+    def now(self):
+        return self.loop.time() * self.speed
+
+    def wait_until(self, deadline):
+        """A future that is done at the first tick at or after the deadline."""
+        future = self.loop.create_future()
+        self.wheel.add(deadline, future)
+        self._arm()
+        return future
+
+    def _arm(self):
+        tick = self.wheel.next_tick()
+        if tick is None or (self.wake is not None and self.wake <= tick):
+            return
+        if self.timer is not None:
+            self.timer.cancel()
+        self.wake = tick
+        self.timer = self.loop.call_at(tick * self.wheel.tick / self.speed, self._expire)
+
+    def _expire(self):
+        upto = max(self.wheel.tick_of(self.now()), self.wake)
+        self.timer = self.wake = None
+        for future in self.wheel.expire(upto):
+            if not future.done():  # not cancelled by a player leaving
+                future.set_result(None)
+        self._arm()
+
+
+class ServerClock(PacingClock):
+    """The pacing schedule in a Ticker's story time, waited on with await."""
+
+    def __init__(self, ticker):
+        super().__init__()
+        self.ticker = ticker
+
+    def now(self):
+        return self.ticker.now()
+
+    async def wait_until(self, deadline):
+        if deadline > self.now():
+            await self.ticker.wait_until(deadline)
+
+    async def wait(self, seconds):
+        """pause(), awaited."""
+        _, end = self.schedule(seconds)
+        await self.wait_until(end)
+
+
+# -----------------------------------------------------------------------------
+
+
+class NeedInput(Exception):
+    """A Recording was asked for input the player hasn't sent yet; args are
+    the question and the player asked (1, 2 or None)."""
+
+
+class _Nodes:
+    """The typewriter, clock, screen and output of a Recording."""
+
+    def __init__(self):
+        self.nodes = []
+
+    def type(self, s, delay):
+        self.nodes.append((TEXT, s, delay, 0))
+
+    def pause(self, seconds):
+        self.nodes.append((PAUSE, seconds))
+
+    def clear(self):
+        self.nodes.append((CLEAR,))
+
+    def write(self, text):
+        if text:
+            self.nodes.append((PRINT, text))
+
+    def flush(self):
+        pass
+
+    def hold(self):
+        return nullcontext()
+
+
+class Recording(Session):
+    """Stands in for a session while blocking Session code runs: keeps what
+    it shows as nodes, and answers ask() and arrow_menu() from `answers`."""
+
+    def __init__(self, session, answers):
+        self.session = session
+        self.answers = answers
+        self.asked = 0
+        self.typewriter = self.clock = self.screen = self.out = _Nodes()
+        self.state = session.state
+        self.history = session.history
+        self.player = None
+        self.player_1, self.player_2 = session.player_1, session.player_2
+        self.player_1_character = session.player_1_character
+        self.player_2_character = session.player_2_character
+
+    @property
+    def nodes(self):
+        return self.out.nodes
+
+    def ask(self, prompt, player=None):
+        return self._answer(prompt, player)
+
+    def arrow_menu(self, options):
+        return self._answer(options)
+
+    def _answer(self, question, player=None):
+        if self.asked == len(self.answers):
+            raise NeedInput(question, player)
+        self.asked += 1
+        return self.answers[self.asked - 1]
+
+    def finish(self):
+        """Hand the players a scene picked back to the session."""
+        session = self.session
+        session.player_1, session.player_2 = self.player_1, self.player_2
+        session.player_1_character = self.player_1_character
+        session.player_2_character = self.player_2_character
+
+
+# -----------------------------------------------------------------------------
+
+
+async def play(session, graph, conn, start=0, shown=None):
+    """engine.play() over a connection. If the player has a menu on screen
+    already (a woken session), shown is the option highlighted on it."""
+    story = steps(session, graph, start)
+    answer = None
+    while True:
+        try:
+            node = story.send(answer)
+        except StopIteration:
+            return
+        answer = None
+        kind = node[0]
+        if kind == CHOICE:
+            answer = await select(session, conn, node[2], shown)
+            shown = None
+        elif kind == NATIVE:
+            await run_native(session, conn, graph.native(node[1]))
+        else:
+            await show(session, conn, node)
+
+
+async def show(session, conn, node):
+    """Play one TEXT, PAUSE, PRINT or CLEAR node."""
+    conn.showing(node)
+    kind = node[0]
+    if conn.paced and (kind == TEXT or kind == PAUSE):
+        # The client does the typing and the waiting, in real time
+        speed = session.clock.ticker.speed
+        if kind == TEXT:
+            conn.pace(node[1], node[2] / speed, node[3] / speed)
+        else:
+            conn.pace("", 0, node[1] / speed)
+    elif kind == TEXT:
+        await type_text(session, conn, node[1], node[2])
+        if node[3]:
+            await session.clock.wait(node[3])
+    elif kind == PAUSE:
+        await session.clock.wait(node[1])
+    elif kind == PRINT:
+        write(conn, node[1])
+    elif kind == CLEAR:
+        session.clear()
+
+
+async def type_text(session, conn, text, delay):
+    for chunk, due in session.typewriter.frames(text, delay):
+        write(conn, chunk)
+        await conn.drain()
+        await session.clock.wait_until(due)
+
+
+async def select(session, conn, choices, shown=None):
+    """Session.select() over a connection; raises Idle if the player leaves
+    it alone for conn.idle seconds."""
+    if shown is None:  # (a woken menu keeps the key that woke it)
+        conn.choosing(choices)
+    with session.clock.hold():
+        if shown is None:
+            menu = session.open_menu(choices)
+            index = 0
+        else:  # on screen from before the session hibernated
+            menu = MenuRenderer(choices, session.out)
+            menu.shown = index = shown
+        picked = None
+        while picked is None:
+            menu.draw(index)
+            keys = await conn.read_keys(conn.idle)
+            if not keys:
+                raise Idle(index)
+            index, picked = session.menu_keys(menu, index, keys)
+    if picked != REWIND:
+        conn.chose(choices, picked)
+    # The rest of select() (the "You chose" screen) is plain output
+    recording = Recording(session, [picked])
+    recording.select(choices)
+    for node in recording.nodes:
+        await show(session, conn, node)
+    return picked
+
+
+async def run_native(session, conn, scene):
+    """Run a NATIVE scene, reading what it asks for from the connection."""
+    answers = []
+    shown = 0
+    while True:
+        recording = Recording(session, answers)
+        try:
+            scene(recording)
+        except NeedInput as need:
+            for node in recording.nodes[shown:]:
+                await show(session, conn, node)
+            shown = len(recording.nodes)
+            with session.clock.hold():
+                answers.append(await read_line(session, conn, *need.args))
+            continue
+        for node in recording.nodes[shown:]:
+            await show(session, conn, node)
+        recording.finish()
+        return
+
+
+async def read_line(session, conn, prompt, player=None):
+    """Session.ask() over a connection."""
+    conn.asking(prompt, player)
+    session.print(prompt, end="")
+    chars = []
+    while not session.line_key(chars, await conn.get_key()):
+        pass
+    return "".join(chars)
+
+
+# -----------------------------------------------------------------------------
+
+
+class Idle(Exception):
+    """A menu was left alone long enough for its session to hibernate."""
+
+    def __init__(self, highlighted):
+        super().__init__(highlighted)
+        self.highlighted = highlighted  # the option highlighted on screen
+
+
+class Bookmark:
+    """Stands in for a Checkpointer: keeps the snapshot taken at the
+    latest menu, for hibernating there."""
+
+    def __init__(self):
+        self.snapshot = None
+
+    def save(self, snapshot):
+        self.snapshot = snapshot
+
+
+def hibernate(session, highlighted, directory):
+    """Write what it takes to wake the session at its menu (a checkpoint,
+    plus the snapshots kept for going back); returns the file."""
+    record = (highlighted, checkpoint.dumps(session.checkpoints.snapshot),
+              [checkpoint.dumps(snapshot) for snapshot in session.history])
+    path = os.path.join(directory, f"{os.getpid()}-{next(SLEEPERS)}")
+    try:
+        with open(path, "wb") as f:
+            f.write(marshal.dumps(record))
+    except OSError:
+        try:
+            os.remove(path)  # no half-written records
+        except OSError:
+            pass
+        raise
+    return path
+
+
+def wake(session, graph, path):
+    """Load (and delete) a hibernated session's record into session;
+    returns the menu's node and the option highlighted on it."""
+    with open(path, "rb") as f:
+        highlighted, saved, history = marshal.loads(f.read())
+    os.remove(path)
+    session.history.extend(checkpoint.loads(snapshot) for snapshot in history)
+    return checkpoint.resume(session, graph, checkpoint.loads(saved)), highlighted
+
+
+# -----------------------------------------------------------------------------
+
+
+async def handle(reader, writer, graph, options, lobby, ticker):
+    """Play the story to a connection (or, with --pairs, to two)."""
+    conn = Connection(reader, writer, pacing=not options.pairs)
+    conn.start()
+    if not options.pairs:
+        await host(conn, [conn], graph, options, ticker)
+        return
+    while lobby and lobby[0].closed:
+        lobby.pop(0)
+    if not lobby:
+        lobby.append(conn)
+        conn.write(WAITING)
+        # The second player's handler plays for both, unless this one leaves first
+        done = asyncio.ensure_future(conn.done.wait())
+        await asyncio.wait([done, conn.listener], return_when=asyncio.FIRST_COMPLETED)
+        done.cancel()
+        if conn in lobby:
+            lobby.remove(conn)
+            conn.close()
+        return
+    table = Table([lobby.pop(0), conn])
+    await host(table, table.conns, graph, options, ticker)
+
+
+async def seat(conns, graph, options, ticker):
+    """Play the story to the connections a worker is handed: one player,
+    or two paired up by the supervisor."""
+    for conn in conns:
+        conn.start()
+    out = conns[0] if len(conns) == 1 else Table(conns)
+    await host(out, conns, graph, options, ticker)
+
+
+async def host(out, conns, graph, options, ticker, record=None):
+    """Play one session to out (a Connection or a Table) and close conns,
+    unless it hibernates. With a record, it is a hibernated session waking."""
+    # Going back is one player's choice, so pairs can't; and one of them
+    # being away isn't a reason to put the other's game to sleep
+    rewinds = 0 if options.pairs else options.rewinds
+    session = Session(game_state, out=out, keys=out, clock=ServerClock(ticker),
+                      rewinds=rewinds, checkpoints=Bookmark(), seed=options.seed)
+    out.session = session
+    if not options.pairs:
+        out.idle = options.idle
+    how = "finished"
+    try:
+        start, shown = wake(session, graph, record) if record else (0, None)
+        while True:
+            try:
+                await play(session, graph, out, start, shown)
+                break
+            except Idle as idle:
+                try:
+                    record = hibernate(session, idle.highlighted, options.sleep_dir)
+                except OSError as error:
+                    # Nowhere to keep it: stay awake at the menu instead
+                    print(f"can't hibernate a session: {error}", flush=True)
+                    start = checkpoint.resume(session, graph, session.checkpoints.snapshot)
+                    shown = idle.highlighted
+                    continue
+                # Keep only the connection and the record, till the next key
+                how = "asleep"
+                out.hibernate(lambda: host(out, conns, graph, options, ticker, record))
+                return
+        await out.drain()
+    except (EOFError, ConnectionError):
+        how = "left"
+    except OSError as error:  # a hibernated session's record is gone
+        how = f"lost ({error})"
+    finally:
+        if how != "asleep":
+            for conn in conns:
+                conn.close()
+    # The seed replays the session's chance events (see 1_koylynn.py --seed)
+    peers = " & ".join("{}:{}".format(*conn.writer.get_extra_info("peername")[:2])
+                       for conn in conns)
+    print(f"{peers} {how} after {session.choices_made} choices, seed {session.seed}", flush=True)
+
+
+async def serve(options, graph):
+    lobby = []  # with --pairs, a player waiting for a partner
+    ticker = Ticker(options.speed)
+    server = await asyncio.start_server(lambda r, w: handle(r, w, graph, options, lobby, ticker),
+                                        options.host, options.port, backlog=4096)
+    address, port = server.sockets[0].getsockname()[:2]
+    print(f"serving the story on {address}:{port}", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+async def work(channel, options, graph):
+    """A worker process of the pool (see pool.py): play the connections the
+    supervisor hands over."""
+    shard = Shard(channel)
+    ticker = Ticker(options.speed)
+    sessions = set()  # the event loop only keeps weak references to tasks
+    while True:
+        socks = await shard.accept()
+        if socks is None:
+            break
+        conns = [Connection(*await asyncio.open_connection(sock=sock), pacing=len(socks) == 1)
+                 for sock in socks]
+        # One session however many players; over when it closes them, not
+        # when it hibernates
+        conns[0].finished = shard.finished
+        task = asyncio.ensure_future(seat(conns, graph, options, ticker))
+        sessions.add(task)
+        task.add_done_callback(sessions.discard)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Host the story over TCP (telnet)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=PORT, help="0 picks a free port")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="play this many times faster (for testing)")
+    parser.add_argument("--rewinds", type=int, default=REWINDS,
+                        help="how many choices players can go back through")
+    parser.add_argument("--pairs", action="store_true",
+                        help="two players per story, each on their own connection")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="processes to spread the sessions over (one per core; Linux only)")
+    parser.add_argument("--idle", type=float, default=IDLE,
+                        help="seconds a menu waits for a key before its session "
+                             "hibernates (0: never)")
+    parser.add_argument("--sleep-dir", help="where hibernated sessions are kept "
+                                            "(default: a new temporary directory)")
+    parser.add_argument("--seed", type=int,
+                        help="seed every session with this (for testing; see 1_koylynn.py --seed)")
+    options = parser.parse_args()
+    options.idle = options.idle or None
+    if options.workers > 1 and not supported():
+        parser.error("--workers needs Linux (see pool.py); leave it out to serve from one process")
+
+    if resource is not None:
+        # A socket per player: allow as many as the system lets us, up to MAX_FILES
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        # (macOS says the hard limit is infinite, but won't take that for soft)
+        wanted = MAX_FILES if hard == resource.RLIM_INFINITY else min(hard, MAX_FILES)
+        try:
+            if soft != resource.RLIM_INFINITY and soft < wanted:
+                resource.setrlimit(resource.RLIMIT_NOFILE, (wanted, hard))
+        except (ValueError, OSError):
+            pass  # make do with the limit we have
+    graph = share(load_story())  # before forking, so the workers share it
+    made = options.sleep_dir is None
+    if made:
+        options.sleep_dir = tempfile.mkdtemp(prefix="no-svoboda-")
+    try:
+        if options.workers > 1:
+            supervise(options.host, options.port, options.workers,
+                      lambda channel: asyncio.run(work(channel, options, graph)),
+                      encode(WAITING) if options.pairs else None)
+        else:
+            asyncio.run(serve(options, graph))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if made:
+            shutil.rmtree(options.sleep_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
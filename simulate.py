@@ -0,0 +1,233 @@
+# Monte Carlo Simulator
+# Plays millions of playthroughs at once with NumPy: every game_state key
+# is an array with one entry per playthrough, and the scene graph is run
+# node by node on all of them together. Players pick options with the
+# probabilities you give each menu (uniform if you don't), so the output
+# is how often each ending happens under that behaviour.
+#
+# NumPy is only needed for this tool: pip install numpy
+#
+# Usage: python simulate.py [--playthroughs 1000000] [--probabilities FILE]
+#        python simulate.py --menus
+#
+# A probabilities file is JSON mapping menu numbers (see --menus) to one
+# weight per option, e.g. {"0": [0.7, 0.3], "4": [1, 2, 1]}.
+
+import argparse
+import json
+import operator
+import sys
+import time
+from collections import Counter
+
+try:
+    import numpy as np
+except ImportError:  # optional; the game itself doesn't need it
+    np = None
+
+from scenegraph import (ADD, BRANCH, CHOICE, END, JUMP, LET, OPERATORS, RANDOM, SCENE,
+                        SET, Paths, load_story)
+from story import game_state
+
+
+def menus(graph):
+    """[(node index, choices), ...] for every menu, numbered in story order."""
+    return [(i, node[2]) for i, node in enumerate(graph.nodes) if node[0] == CHOICE]
+
+
+class Batch:
+    """n playthroughs of the graph, played together."""
+
+    def __init__(self, graph, n, probabilities=None, rng=None, state=game_state):
+        self.graph = graph
+        self.n = n
+        self.rng = rng if rng is not None else np.random.default_rng()
+        # Each menu's option weights, by node index
+        probabilities = probabilities or {}
+        found = menus(graph)
+        unknown = set(probabilities) - set(range(len(found)))
+        if unknown:
+            raise ValueError(f"no menu numbered {sorted(unknown)}; there are {len(found)}")
+        self.weights = {}
+        for number, (i, choices) in enumerate(found):
+            weights = probabilities.get(number)
+            if weights is None:
+                weights = [1] * len(choices)
+            if len(weights) != len(choices):
+                raise ValueError(f"menu {number} has {len(choices)} options, "
+                                 f"got {len(weights)} weights")
+            weights = np.asarray(weights, dtype=float)
+            self.weights[i] = weights / weights.sum()
+        self.state = {key: np.full(n, value, dtype=np.int16) for key, value in state.items()}
+        # Scene variables hold codes: scene locals can be strings
+        self.codes = {None: 0}
+        self.variables = {}
+
+    def code(self, value):
+        """The integer that stands for a scene variable's value."""
+        return self.codes.setdefault(value, len(self.codes))
+
+    def variable(self, name):
+        if name not in self.variables:
+            self.variables[name] = np.zeros(self.n, dtype=np.int16)
+        return self.variables[name]
+
+    def run(self):
+        """Play every node from start to END; the arrays hold the endings."""
+        nodes = self.graph.nodes
+        # The playthroughs at a node are one mask: their states are in the
+        # arrays, not the walk, so every group that gets there is merged
+        paths = Paths(self.graph, operator.or_)
+
+        def send(i, mask):
+            if mask.any():
+                paths.arrive(i, None, (), mask)
+
+        send(0, np.ones(self.n, dtype=bool))
+        for i, groups in paths:
+            (here,) = groups.values()
+            node = nodes[i]
+            kind = node[0]
+            if kind == SET:
+                np.copyto(self.state[node[1]], int(node[2]), where=here)
+            elif kind == ADD:
+                np.add(self.state[node[1]], node[2], out=self.state[node[1]], where=here)
+            elif kind == BRANCH:
+                holds = self.condition(node[1])
+                send(i + 1, here & holds)
+                send(node[2], here & ~holds)
+                continue
+            elif kind == JUMP:
+                send(node[1], here)
+                continue
+            elif kind == CHOICE:
+                weights = self.weights[i]
+                picked = self.rng.choice(len(weights), size=self.n, p=weights)
+                self.assign(node[1], picked, range(len(weights)), here)
+            elif kind == RANDOM:
+                picked = self.rng.integers(len(node[2]), size=self.n)
+                self.assign(node[1], picked, node[2], here)
+            elif kind == LET:
+                np.copyto(self.variable(node[1]), self.code(node[2]), where=here)
+            elif kind == SCENE:
+                for values in self.variables.values():  # locals end with their scene
+                    np.copyto(values, 0, where=here)
+            elif kind == END:
+                continue
+            send(i + 1, here)
+
+    def assign(self, name, picked, options, where):
+        """Set a variable to options[picked] wherever `where` is set."""
+        lookup = np.array([self.code(option) for option in options], dtype=np.int16)
+        np.copyto(self.variable(name), lookup[picked], where=where)
+
+    def condition(self, cond):
+        """A compiled condition, for every playthrough at once."""
+        op = cond[0]
+        if op == "and":
+            return np.logical_and.reduce([self.condition(c) for c in cond[1:]])
+        if op == "or":
+            return np.logical_or.reduce([self.condition(c) for c in cond[1:]])
+        if op == "not":
+            return ~self.condition(cond[1])
+        coded = cond[1][0] == "var" or cond[2][0] == "var"
+        if coded and op not in ("==", "!="):
+            raise ValueError(f"can't order scene variables: {cond}")
+        return OPERATORS[op](self.operand(cond[1], coded), self.operand(cond[2], coded))
+
+    def operand(self, operand, coded):
+        kind, value = operand
+        if kind == "state":
+            return self.state[value]
+        if kind == "var":
+            return self.variable(value)
+        return self.code(value) if coded else value
+
+
+# -----------------------------------------------------------------------------
+
+
+def tally(batch):
+    """Counters of the outcomes in a played batch."""
+    state = batch.state
+    grabbed = batch.variable("grabbed")
+    graham = grabbed == batch.code("GRAHAM")
+    grayson = grabbed == batch.code("GRAYSON")
+    return {
+        "grabbed": Counter({"GRAHAM": int(graham.sum()), "GRAYSON": int(grayson.sum())}),
+        # The other one hesitates if they are still angry enough (SCENE 5C)
+        "hesitates": Counter({"GRAYSON": int((graham & (state["GraysonAnger"] >= 3)).sum()),
+                              "GRAHAM": int((grayson & (state["GrahamAnger"] >= 3)).sum())}),
+        "GrahamAnger": _counts(state["GrahamAnger"]),
+        "GraysonAnger": _counts(state["GraysonAnger"]),
+        "trust (Grayson in Graham, Graham in Grayson)":
+            _counts(state["GraysonTrustInGraham"], state["GrahamTrustInGrayson"]),
+    }
+
+
+def _counts(*columns):
+    """Counter of each playthrough's value (a tuple, for several columns)."""
+    # The values are small integers: number every combination and count
+    # with bincount, which is much faster than sorting for np.unique
+    lows = [int(column.min()) for column in columns]
+    spans = [int(column.max()) - low + 1 for column, low in zip(columns, lows)]
+    combined = np.zeros(len(columns[0]), dtype=np.int64)
+    for column, low, span in zip(columns, lows, spans):
+        combined = combined * span + (column - low)
+    numbers = np.bincount(combined)
+    counts = Counter()
+    for index in np.flatnonzero(numbers).tolist():
+        value = tuple(int(v) + low for v, low in zip(np.unravel_index(index, spans), lows))
+        counts[value if len(value) > 1 else value[0]] = int(numbers[index])
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo ending distributions")
+    parser.add_argument("--playthroughs", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int, default=1_000_000,
+                        help="playthroughs simulated together (memory use grows with it)")
+    parser.add_argument("--probabilities", metavar="FILE",
+                        help="JSON: menu number -> weight of each option")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--menus", action="store_true", help="list the menus and exit")
+    args = parser.parse_args()
+
+    graph = load_story()
+    if args.menus:
+        for number, (i, choices) in enumerate(menus(graph)):
+            print(f"{number:>3}  {' / '.join(choices)}")
+        return
+    if np is None:
+        sys.exit("simulate.py needs NumPy: pip install numpy")
+
+    probabilities = {}
+    if args.probabilities:
+        with open(args.probabilities) as f:
+            probabilities = {int(number): weights for number, weights in json.load(f).items()}
+
+    # Each batch draws from its own stream spawned from the seed, so batches
+    # are independent and give the same results however they are scheduled
+    streams = np.random.SeedSequence(args.seed)
+    totals = {}
+    started = time.perf_counter()
+    done = 0
+    while done < args.playthroughs:
+        n = min(args.batch, args.playthroughs - done)
+        batch = Batch(graph, n, probabilities, np.random.default_rng(streams.spawn(1)[0]))
+        batch.run()
+        for name, counts in tally(batch).items():
+            totals.setdefault(name, Counter()).update(counts)
+        done += n
+    elapsed = time.perf_counter() - started
+
+    print(f"seed {streams.entropy}")
+    print(f"{done} playthroughs in {elapsed:.2f} s ({done / elapsed / 1e6:.2f} M/s)")
+    for name, counts in totals.items():
+        print(f"\n{name}:")
+        for value, count in sorted(counts.items()):
+            print(f"  {str(value):<12}{count:>10}  {count / done:6.1%}")
+
+
+if __name__ == "__main__":
+    main()
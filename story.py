@@ -0,0 +1,3167 @@
+# No Svoboda: The Story
+# Author: Koy Chen & Lynn Qiao
+# 15 Apr 2025
+#
+# Every scene is a function of the session it plays in: `s` holds the
+# players, their game_state and everything that reads or prints. Scenes
+# are compiled into a scene graph (scenegraph.py) before they are played;
+# game_state is an immutable GameState (gamestate.py), so the graph, not
+# the scene function, is what applies `s.state[...] += ...` lines.
+
+# Imports
+import random
+
+from gamestate import initial_state
+
+
+# -----------------------------------------------------------------------------
+
+
+# Game state each playthrough starts from
+game_state = initial_state({
+    "Late": False,
+    "GrahamAnger": 0,
+    "GraysonAnger": 0,
+    "Composure": 0,  
+    "Dogbrained": False,
+    "Instinct": 0,
+    "Office_Remark": False,
+    "Office_Silent": False,
+    "Office_CallOut": False,
+    "GraysonTrustInGraham": 0,
+    "GrahamTrustInGrayson": 0,
+})
+
+
+def bold_text(text):
+    """Return bolded text."""
+    return f"\033[1m{text}\033[0m"
+
+def italic_text(text):
+    """Return italicized text."""
+    return f"\033[3m{text}\033[0m"
+
+#SPEAKING FUNCTION
+speak = {
+    "graham_speak": bold_text("GRAHAM"),
+    "grayson_speak": bold_text("GRAYSON")
+}
+# POV Function
+povs = {
+    "graham_pov": bold_text("————YOU ARE GRAHAM————"),
+    "grayson_pov": bold_text("————YOU ARE GRAYSON————")
+}
+
+
+# Character Bios
+characters = {
+    "1": {
+        "name": bold_text("Graham Emil Svoboda"),
+        "bio": f"{bold_text('Age:')} 25\n"
+               f"{bold_text('Occupation:')} Junior Field Analyst at the National Incident Intelligence Agency.\n"
+               f"{bold_text('Job:')} Analyzing data, supporting missions, and assisting in operations.\n"
+               "The nine months before you opened your eyes were the only stillness, "
+               "and solace you’d ever know.\n"
+               "Ever since, you’ve spent your waking days bathed in endless sensory hell, "
+               "the world screaming at you for your stolen peace.\n"
+               "Everywhere you go, you’re burdened to see everything, "
+               "everywhere, "
+               "all at once.\n"
+               "The girl in the corner of the coffee shop turns the page of her book every five sips,\n"
+               "the guy at the counter smells of smoke, "
+               "and constantly eyes her.\n"
+               "You never say more than you need to, "
+               "you’ve seen well enough that actions speak for themselves.\n"
+               "You are perceptive, "
+               "cynical, "
+               "intuitive, "
+               "and a little bit mystical.\n"
+    },
+    "2": {
+        "name": bold_text("Grayson Viktor Novák"),
+        "bio": f"{bold_text('Age:')} 28\n"
+               f"{bold_text('Occupation:')} Deputy Director at the National Incident Intelligence Agency.\n"
+               f"{bold_text('Job:')} Overseeing operations, managing teams, and making crucial decisions in high-stake situations.\n"
+           "You’re a man of control——over people, "
+               "over situations, "
+               "over your own mind. "
+               "It’s a skill that’s gotten you this far in life.\n"
+               "You clawed your way up from nothing. "
+               "Now you sit at the top.\n"
+               "You’ve seen things most people can’t even imagine, "
+               "and you’ve learned to survive by being sharp, "
+               "strategic, "
+               "and above all, "
+               "untouchable.\n"
+    }
+}
+
+
+#-----------------------------------------------------------------------------
+
+
+# Intro
+def intro(s):
+    s.delay_print1("Hey there!\n")
+    s.delay_print1("Welcome to our game, No Svoboda.\n")
+    s.pause(1)
+    s.delay_print2("This is a 2 player story game, set in an apocalyptic world. ")
+    s.pause(0.5)
+    s.delay_print2("You will need a friend to play with.")
+    s.pause(3.5)
+    
+    s.clear()
+    s.delay_print("...")
+    s.pause(2)
+
+    s.delay_print3("Your choices will affect how your story plays out throughout the game.")
+    s.pause(4)
+    s.clear()
+
+    # Grab the user's name
+    s.delay_print2("Before we start, I'd like to know your names!\n")
+    s.pause(1)
+    s.player_1 = s.ask("Player 1, please enter your name: ", player=1)
+    s.player_2 = s.ask("Player 2, please enter your name: ", player=2)
+    s.pause(1)
+
+    s.delay_print2(f"Great! ")
+    s.pause(0.5)
+    s.delay_print2(f"{s.player_1}, ")
+    s.pause(0.5)
+    s.delay_print2(f"{s.player_2}, ")
+    s.pause(0.5)
+    s.delay_print2(f" It's a pleasure to meet you both.")
+    s.pause(4)
+    s.clear()
+    s.pause(2)
+
+
+# Character Selection
+def choose_characters(s):
+    # Display characters
+    s.print("Here are the characters you can choose from:\n")
+    s.pause(1)
+    for key, char in characters.items():
+       s.delay_print3(f"{key}. {char['name']}\n")
+       s.delay_print3(f"{char['bio']}\n")
+    s.pause(2)
+
+    # Player 1 chooses a character
+    while True:
+        player_1_choice = s.ask(f"{s.player_1}, please choose your character (1 or 2): ", player=1)
+        if player_1_choice in characters:
+            s.player_1_character = characters[player_1_choice]["name"]
+            break
+        else:
+            s.print("Invalid choice. Please choose 1 or 2.\n")
+
+    # Player 2 chooses a character
+    while True:
+        player_2_choice = s.ask(f"{s.player_2}, please choose your character (1 or 2): ", player=2)
+        if player_2_choice in characters:
+            s.player_2_character = characters[player_2_choice]["name"]
+            if player_2_choice != player_1_choice:
+                break
+            else:
+                s.print("That character is already taken. Please choose a different character.\n")
+                
+
+    # Display chosen characters
+
+    s.clear()
+    s.pause(1)
+    s.delay_print("...")
+    s.pause(1)
+    s.clear()
+
+    s.delay_print2(f"Great! ")
+    s.pause(0.3)
+    s.delay_print2(f"{s.player_1}, ")
+    s.pause(0.3)
+    s.delay_print2(f"you have chosen {s.player_1_character}.")
+    s.pause(1)
+    s.delay_print2(f"\n{s.player_2}, ")
+    s.pause(0.3)
+    s.delay_print2(f"you have chosen {s.player_2_character}.")
+    s.pause(1)
+    s.delay_print2("\nThe game will start in 5 seconds...")
+    s.pause(5)
+
+    s.clear()
+    s.pause(1)
+    s.delay_print("...")
+    s.pause(1)
+    s.clear()
+
+
+# -----------------------------------------------------------------------------
+
+
+# Game Start
+# Scene 0A: Morning Routine
+# Graham's POV
+def scene_0a(s):
+    s.print(povs["graham_pov"])
+    s.delay_print1(italic_text("Somewhere in Prague, May 12, 1997"))
+    s.delay_print2(italic_text("\nThe world hasn't ended yet——"))
+    s.pause(0.2)
+    s.delay_print2(italic_text("but something feels off."))
+    s.print("\n")
+    s.pause(1)
+
+    s.delay_print2("You see the woman next door carefully tending to her plants.")
+    s.pause(0.3)
+    s.delay_print2("\nHer husband hugs her from behind and they laugh together, ")
+    s.pause(0.2)
+    s.delay_print2("the woman tilting her head to look up at him.")
+    s.pause(0.25)
+    s.delay_print2("\nMixed in with the soft song of their love,")
+    s.pause(0.1)
+    s.delay_print2(" are dissonant notes of things unsaid.")
+    s.pause(1.5)
+    s.print("\n")
+
+    s.delay_print2("You can’t tell if you’re imagining it because of what you know——")
+    s.pause(0.35)
+    s.delay_print2("or if it's really hanging there.")
+    s.pause(1)
+    s.delay_print2("\nIt's so revolting,")
+    s.pause(0.3)
+    s.delay_print2(" yet tender.")
+    s.pause(0.5)
+    s.delay_print2("\nIt makes you dizzy and sick trying to rationalize it.")
+    s.pause(1)
+    s.print("\n")
+
+    s.delay_print2("You should look away.")
+    s.pause(0.6)
+    s.delay_print2(" Or you’ll be late.")
+    s.pause(0.8)
+    s.delay_print2("\nOr worse——")
+    s.pause(0.4)
+    s.delay_print2("actually throw up.")
+    s.pause(4)
+    s.print("\n")
+
+    choices = [
+         "LOOK AWAY",
+        "DWELL ON THOUGHT"
+     ]
+    selected = s.select(choices)
+
+    if selected == 0:  # LOOK AWAY
+        s.delay_print2("If you throw up right now, you ")
+        s.delay_print2(italic_text("will "))
+        s.delay_print2("look crazy.")
+        s.pause(0.5)
+        s.delay_print2("\nYou look crazy enough as it is, and you’re not enough of a masochist ")
+        s.pause(0.3)
+        s.delay_print2("yet ")
+        s.pause(0.3)
+        s.delay_print2("to enjoy vomiting")
+        s.pause(0.5)
+        s.delay_print2("——or getting yelled at for being late again.")
+        s.pause(3)
+
+    elif selected == 1:  # DWELL ON THOUGHT
+        s.state["Late"] = True
+        s.delay_print2("It makes you sick because you know in ten minutes, ")
+        s.pause(0.3)
+        s.delay_print2("she’ll kiss her husband goodbye, ")
+        s.pause(0.5)
+        s.delay_print2("and in twenty,")
+        s.pause(0.5)
+        s.delay_print2(" she’ll invite the neighbor guy in.")
+        s.pause(1)
+        s.delay_print2("\nBut more so, it makes you sick how it’s the same everywhere——")
+        s.pause(0.5)
+        s.delay_print2("actors playing roles.")
+        s.pause(1)
+        s.print("\n")
+
+        s.delay_print2("And evidently, ")
+        s.pause(0.4)
+        s.delay_print2("you can’t rip your eyes away from the stage.")
+        s.pause(2)
+        s.print("\n")
+        s.delay_print2("You ")
+        s.delay_print1(italic_text("are "))
+        s.pause(0.1)
+        s.delay_print2("going to be late,")
+        s.pause(0.3)
+        s.delay_print2(" but what matters more is the thrumming ache in your head now.")
+        s.pause(0.5)
+        s.delay_print2("\nThe feeling of fingers digging into your brain, squeezing——")
+        s.pause(0.1)
+        s.delay_print1(italic_text("kneading."))
+        s.pause(0.5)
+        s.delay_print2("\nBut there’s nothing you can do about that.")
+        s.pause(3.5)
+
+    s.clear()
+    s.pause(1)
+    s.delay_print("...")
+    s.pause(1)
+    s.clear()
+
+
+# -----------------------------------------------------------------------------
+
+
+
+# Scene 0B: Morning Routine
+# Grayson's POV
+def scene_0b(s):
+    s.print(povs["grayson_pov"])
+    s.delay_print1(italic_text("Somewhere else in Prague,"))
+    s.delay_print1(italic_text(" May 12,"))
+    s.delay_print1(italic_text(" 1997"))
+    s.print("\n")
+    s.pause(1)
+
+    s.delay_print2("There’s a stain on the collar of your shirt.")
+    s.pause(0.8)
+    s.delay_print2(" You rub at it as an attempt to get it off.")
+    s.pause(0.8)
+    s.print("\n")
+
+    s.delay_print2(" It doesn’t come off.")
+    s.pause(0.6)
+    s.delay_print2(" Figures.")
+    s.pause(1.3)
+    s.print("\n")
+
+    s.delay_print2("You check yourself in the mirror.")
+    s.pause(0.8)
+    s.delay_print2("\nTie, a little off-center.")
+    s.pause(0.4)
+    s.delay_print2(" It's better that way.")
+    s.pause(0.5)
+    s.delay_print2(" Perfect symmetry feels desperate.")
+    s.pause(0.7)
+
+    s.delay_print2("\nHair, ")
+    s.pause(0.3)
+    s.delay_print2("dark and combed back, ")
+    s.pause(0.7)
+    s.delay_print2("neat.")
+    s.pause(0.8)
+    s.delay_print2("\nEyes, ")
+    s.pause(0.3)
+    s.delay_print2("olive, narrow, calculated.")
+    s.pause(0.8)
+    s.delay_print2("\nJaw, ")
+    s.pause(0.4)
+    s.delay_print2("a little overdue for a shave, but it’ll do.")
+    s.pause(2)
+    s.print("\n")
+
+    s.delay_print2("You grab your coat, and your half-empty pack of cigarettes.")
+    s.pause(0.6)
+    s.delay_print2("\nNot for stress.")
+    s.pause(0.4)
+    s.delay_print2(" Just habit.")
+    s.pause(1)
+
+    s.delay_print2("\nThe apartment’s spotless.")
+    s.pause(0.5)
+    s.delay_print2(" Like you never lived in it.")
+    s.pause(1.3)
+    s.print("\n")
+
+    s.delay_print2("The hallway smells like old leather and damp stone.")
+    s.pause(0.6)
+    s.delay_print2(" The fourth-floor neighbor’s dog barks at you as you pass.")
+    s.pause(3)
+    s.print("\n")
+
+    choices = [
+        "IGNORE",
+        "INTIMIDATE"
+    ]
+    selected = s.select(choices)
+
+    if selected == 0:  # IGNORE
+        s.delay_print2("You don’t even spare it a glance——")
+        s.pause(0.5)
+        s.delay_print2("but it stops.")
+        s.pause(0.4)
+        s.delay_print2(" Victory.")
+        s.pause(3)
+
+
+
+    elif selected == 1:  # INTIMIDATE
+        s.delay_print2("You stop, and turn, locking eyes with the dog.")
+        s.pause(0.7)
+        s.delay_print2(" You glare with all the malice you can muster,")
+        s.pause(0.5)
+        s.delay_print2(" waiting for it to submit and shut up.")
+        s.pause(2)
+
+        s.delay_print2("\nIt doesn’t.")
+        s.pause(0.7)
+        s.delay_print2(" The dog just barks louder.")
+        s.pause(1.5)
+        s.delay_print2(" You roll your eyes,")
+        s.pause(0.5)
+        s.delay_print2(" muttering under your breath,")
+        s.pause(0.5)
+        s.delay_print2(" and walk away.")
+        s.pause(3)
+
+    s.clear()
+    s.pause(1)
+    s.delay_print("...")
+    s.pause(1)
+    s.clear()
+
+
+# -----------------------------------------------------------------------------
+
+
+
+
+
+# Scene 1A: Office Arrival
+# Grayson's POV
+def scene_1a(s):
+    s.print(povs["grayson_pov"])
+    s.delay_print2("The streets outside are damp, ")
+    s.pause(0.3)
+    s.delay_print2("grey, ")
+    s.pause(0.3)
+    s.delay_print2("and irritatingly alive. ")
+    s.pause(0.8)
+    s.delay_print2("You light a cigarette and start walking.")
+    s.pause(0.7)
+    s.delay_print2("\nThe sky is that ugly shade of early-morning blue. ")
+    s.pause(1)
+    s.delay_print2("You walk faster, ")
+    s.pause(0.4)
+    s.delay_print2("not rushing——just avoiding thought.")
+    s.pause(2)
+    s.print("\n")
+
+    s.delay_print2("The office looms. ")
+    s.pause(0.9)
+    s.delay_print2("You already know what today is going to be. ")
+    s.pause(0.5)
+    s.delay_print2("Annoying. ")
+    s.pause(0.3)
+    s.delay_print2("Pointless.")
+    s.pause(1)
+
+    s.delay_print2("\nYou shove the door open. ")
+    s.pause(0.5)
+    s.delay_print2("Inside, ")
+    s.pause(0.3)
+    s.delay_print2("you immediately clock the rookie analyst")
+    s.pause(0.5) 
+    s.delay_print2("——dazed, skittish. ")
+    s.pause(0.4)
+    s.delay_print2("Already sick of him.")
+    s.pause(1)
+
+    s.delay_print2("\nYou toss your coat over the chair like it offended you. ")
+    s.pause(0.7)
+    s.delay_print2("This is your kingdom.")
+    s.pause(0.5)
+    s.print("\n")
+
+    s.delay_print2("And he?")
+    s.pause(0.5)
+    s.delay_print2("\nHe’s today’s entertainment.")
+    s.pause(1.2)
+    s.print("\n")
+
+    s.delay_print2("You lean back, your gaze fixed on the rookie.")
+    s.pause(0.5)
+    s.delay_print2("\nHe looks even more pathetic in person——")
+    s.pause(0.3)
+    s.delay_print2("wiry frame, ")
+    s.pause(0.3)
+    s.delay_print2("sleeves too long like he inherited that shirt from a brother he hates.")
+    s.pause(0.7)
+    s.delay_print2("\nHis dark-colored hair curls awkwardly where it’s still damp, ")
+    s.pause(0.3)
+    s.delay_print2("like he showered but didn’t dry it——")
+    s.pause(0.3)
+    s.delay_print2("points for effort?")
+    s.pause(1)
+    s.print("\n")
+
+    s.delay_print2("The poor guy looks lost,")
+    s.pause(0.5)
+    s.delay_print2("like he’s already regretting today.")
+    s.pause(0.5)
+    s.delay_print2("\nHis eyes are shifting between the papers in front of him and the cup of coffee that’s been sitting there for too long.")
+    s.pause(0.7)
+    s.delay_print2("\nThe tension in the air is almost funny——")
+    s.pause(0.5)
+    s.delay_print2("it’s like he’s trying to make himself invisible, ")
+    s.pause(0.5)
+    s.delay_print2("and it’s almost pitiful.")
+    s.pause(4)
+    s.print("\n")
+
+    # Player choice
+    choices = [
+        "REMARK",
+        "STAY SILENT",
+        "CONFRONT"
+    ]
+
+    # Display choice menu and get the player's selection
+    selected = s.select(choices)
+
+    # Handle the player's choice
+    if selected == 0:  # REMARK
+        s.state["Office_Remark"] = True
+        s.delay_print2("You tap your fingers on the desk,")
+        s.pause(0.2)
+        s.delay_print2(" eyes cold.")
+        s.pause(1)
+        s.delay_print2(italic_text('\n"How long do you think you’ll last here before you completely screw up, '))
+        s.pause(0.1)
+        s.delay_print2(italic_text('rookie?"'))
+        s.pause(1)
+        s.delay_print2("\nHis jaw tightens, but he doesn't answer.")
+        s.pause(1)
+        s.delay_print2("\nHe’ll crack, ")
+        s.pause(0.3)
+        s.delay_print2(italic_text("eventually."))
+        s.pause(3.5)
+
+    elif selected == 1:  # STAY SILENT
+        s.state["Office_Silent"] = True
+        s.delay_print2("You lean back in your chair, ")
+        s.pause(0.3)
+        s.delay_print2("arms crossed,")
+        s.pause(0.3)
+        s.delay_print2(" watching the clock tick by.")
+        s.pause(0.8)
+        s.delay_print2("\nThe rookie shifts nervously under your gaze, ")
+        s.pause(0.3)
+        s.delay_print2("and you wait for him to cave.")
+        s.pause(0.8)
+        s.delay_print2("\nThe tension’s thick, ")
+        s.pause(0.3)
+        s.delay_print2("and you’re enjoying every second of it.")
+        s.pause(3.5)
+        s.print("\n")
+
+    elif selected == 2:  # CONFRONT
+        s.state["Office_CallOut"] = True
+        s.delay_print2("You eye the pile of untouched paperwork in front of him.")
+        s.pause(0.8)
+        s.delay_print2(italic_text('\n"Not even trying today, '))
+        s.pause(0.1)
+        s.delay_print2(italic_text('huh? '))
+        s.pause(0.3)
+        s.delay_print2(italic_text('At least pretend to look like you’re being productive."'))
+        s.pause(0.5)
+        s.delay_print2("\nThe rookie shoots you a quick glance, ")
+        s.pause(0.3)
+        s.delay_print2("trying to brush it off, ")
+        s.pause(0.3)
+        s.delay_print2("but you can see him scramble to get to work.")
+        s.pause(3.5)
+        s.print("\n")
+
+    s.clear()
+    s.pause(1)
+    s.delay_print("...")
+    s.pause(1)
+    s.clear()
+
+
+# -----------------------------------------------------------------------------
+
+
+
+# Scene 1B: Office Hell
+# Graham's POV
+def scene_1b(s):
+    s.print(povs["graham_pov"])
+    s.delay_print1(italic_text("National Incident Intelligence Agency, "))
+    s.delay_print1(italic_text("Prague Headquarters,"))
+    s.delay_print1(italic_text(" May 12, 1997"))
+    s.print("\n")
+
+    s.delay_print2("You hate mornings, ")
+    s.pause(.3)
+    s.delay_print2("You hate everything about them,") 
+    s.pause(.3)
+    s.delay_print2(" from the cold to the noise, ")
+    s.pause(.3)
+    s.delay_print2("to the sense of dread that settles in your stomach.")
+    s.pause(.5)
+    s.delay_print2("\nBut the office——")
+    s.pause(0.3)
+    s.delay_print2("you’re more on the fence about it.")
+    s.pause(0.7)
+    s.delay_print2("\nSometimes it's peacefully monotonous,")
+    s.pause(0.3)
+    s.delay_print2(" and other times even a room of papers gets on your nerves.")
+    s.pause(0.5)
+    s.delay_print2("\nYou’re fickle like that.")
+    s.pause(1.5)
+    s.print("\n")
+
+    s.delay_print2("You’re already at your desk when Grayson——")
+    s.pause(0.25)
+    s.delay_print2("the deputy director——walks in.")
+    s.pause(0.25)
+    s.delay_print2("walks in.")
+    s.pause(0.5)
+    s.delay_print2(" You don’t need to look up to know it’s him.")
+    s.pause(0.3)
+    s.delay_print2("\nYou can feel his presence enter a room like a cold wind——")
+    s.pause(0.3)
+    s.delay_print2("tailored coat, ")
+    s.pause(0.3)
+    s.delay_print2(" shiny shoes, ")
+    s.pause(0.3)
+    s.delay_print2("that stupid face carved out of arrogance and expensive aftershave.")
+    s.pause(1)
+    s.delay_print2("\nThe capricious lady that is your brain——")
+    s.pause(0.3)
+    s.delay_print1(italic_text("(Lady? "))
+    s.pause(0.3)
+    s.delay_print1(italic_text("No, "))
+    s.pause(0.3)
+    s.delay_print1(italic_text("don’t question your brain,)——"))
+    s.pause(0.5)
+    s.delay_print2("decides you hate paperwork, ")
+    s.pause(0.2)
+    s.delay_print2(" and ")
+    s.pause(0.075)
+    s.delay_print1(italic_text("that's"))
+    s.pause(0.1)
+    s.delay_print2(" how you know.")
+    s.print("\n")
+
+    s.pause(1.6)
+    s.delay_print2("You look down at yourself")
+    s.pause(0.3)
+    s.delay_print2("creased shirt, ")
+    s.pause(0.3)
+    s.delay_print2("pen ink already smudged on your sleeve.")
+    s.pause(0.5)
+    s.delay_print2("\nThey say dress for the job you want,")
+    s.pause(0.4)
+    s.delay_print2(" You’re dressed like the job is already over.")
+    s.pause(1.4)
+    s.print("\n")
+
+    s.delay_print2("You can feel his eyes on you, ")
+    s.pause(0.3)
+    s.delay_print2("sharp and unrelenting, ")
+    s.pause(0.3)
+    s.delay_print2("piercing through the back of your head.")
+    s.pause(0.5)
+    s.delay_print2("\nIt doesn’t help that every time you glance in his direction, ")
+    s.pause(0.3)
+    s.delay_print2("he’s watching,")
+    s.pause(0.4)
+    s.delay_print2(" waiting for you to screw up.")
+    s.pause(0.8)
+    s.delay_print2("\nYou almost wonder if this is how everyone feels about you.")
+    s.pause(2)
+    s.print("\n")
+
+    s.delay_print2("You don’t see it, but you know.")
+    s.pause(0.5)
+    s.delay_print2(" Something changes in his breathing.")
+    s.pause(0.3)
+    s.delay_print2("\nHe’s going to do something, ")
+    s.pause(0.3)
+    s.delay_print2("because he thinks he’s better than you.")
+    s.pause(0.5)
+    s.delay_print2(" It's a pattern.")
+    s.pause(1)
+    s.delay_print2("\nAnd you know,")
+    s.pause(0.3)
+    s.delay_print2(" but you won't try to stop it.")
+    s.pause(0.5)
+    s.delay_print2(" Not because you’re powerless.")
+    s.pause(0.3)
+    s.delay_print2("\nBut because it’s a spinning, spinning wheel,") 
+    s.pause(0.3)
+    s.delay_print2(" of the same and the same and the same and the——")
+    s.pause(0.1)
+    s.delay_print2("\nYou get it.")
+    s.pause(2)
+    s.print("\n")
+
+    s.delay_print2("Everywhere you’ll find more of the same.")
+    s.pause(0.5)
+    s.delay_print2(" Hollow suits.")
+    s.pause(0.3)
+    s.delay_print2("\nThey think they have you all figured out don’t they?")
+    s.pause(0.5)
+    s.delay_print2(" Aren’t you a lost lamb Graham?")
+    s.pause(3)
+    s.print("\n")
+
+    choices = [
+        "I'M MORE VILE THAN YOU THINK",
+        "NONE OF THIS MATTERS"
+    ]
+    selected = s.select(choices)
+
+    if selected == 0:  # I'M MORE VILE...
+        if s.state["Late"] == True:
+           s.state["GrahamAnger"] += 2
+        else:
+            s.state["GrahamAnger"] += 1
+
+        s.delay_print2("You’d bite too. ")
+        s.pause(0.5)
+        s.delay_print2("You don’t blow off steam on random interns——")
+        s.pause(0.3)
+        s.delay_print2("and that's what makes you worse.")
+        s.pause(.5)
+
+        s.delay_print2("\nYou’re mold in drywall, hiding behind thin wallpaper. ")
+        s.pause(.8)
+        s.delay_print2("He doesn’t know what he’s poking.")
+        s.delay_print("\n...")
+        s.pause(.4)
+        s.print("\n")
+
+        s.delay_print2("God, you need a hobby.")
+        s.pause(3)
+
+
+
+    elif selected == 1:  # NONE OF THIS MATTERS
+        s.state["GrahamAnger"] -= 1
+
+        s.delay_print2("You exist.")
+        s.pause(0.4)
+        s.delay_print2(" He talks.")
+        s.pause(0.4)
+        s.delay_print2(" He jeers.")
+        s.pause(0.4)
+        s.delay_print2(" The world still spins.")
+        s.pause(.7)
+        s.delay_print2("\nYou’re not sure you’re even angry anymore.")
+        s.pause(0.5)
+        s.delay_print2(" He’s a product of many other actors and actions.")
+        s.pause(.5)
+        s.delay_print2(" A predictable line.")
+        s.pause(.3)
+        s.delay_print2("\nHe was hurt, ")
+        s.pause(0.2)
+        s.delay_print2("so now he’ll hurt.")
+        s.pause(.5)
+        s.delay_print("\n...")
+        s.pause(1)
+        s.delay_print2("\nMaybe you’ve been reading too much Camus.")
+        s.pause(3)
+
+    s.clear()
+    s.pause(1)
+    s.delay_print("...")
+    s.pause(1)
+    s.clear()
+
+    # I'll figure out if i want to use this later
+    # def grahmangry():
+    #     s.delay_print2("Oh ")
+    #     s.pause(.5)
+    #     s.delay_print2("my ")
+    #     s.pause(.4)
+    #     s.delay_print2("gosh.\n")
+    #     s.pause(.5)
+    #     s.delay_print2("He thinks he knows you. ")
+    #     s.pause(.3)
+    #     s.delay_print2("Got you figured out, dancing in his palm?\n")
+    #     s.pause(.3)
+    #     s.delay_print2("You could scream right now! ")
+    #     s.pause(.3)
+    #     s.delay_print2("You could throw a chair! ")
+    #     s.pause(.3)
+    #     s.delay_print2("You would do it!\n\n")
+    #     s.pause(.9)
+    #     s.delay_print2("But not right now,")
+    #     s.pause(.3)
+    #     s.delay_print2("let him think he's special, like he's more than a trope you've seen over and over.\n")
+    #     s.pause(.8)
+    #     s.delay_print2("If you do get the opportunity, something ")
+    #     s.delay_print2(italic_text("will "))
+    #     s.delay_print2("happen.")
+    #     s.pause(.5)
+    #     s.delay_print2("It's really just karma at that point, no?")
+
+
+    if s.state["Office_Remark"] == True:
+        s.state["GrahamAnger"] += 1
+
+        s.delay_print2("The boss man taps his fingers on the desk.")
+        s.pause(0.5)
+        s.delay_print2(" You’re almost more interested in the way his fingers probably leave imperceptible smudges on the table than you are in what he’s about to say.\n\n")
+        s.pause(.5)
+        s.delay_print2(italic_text('\n"How long do you think you’ll last here before you completely screw up, '))
+        s.pause(0.1)
+        s.delay_print2(italic_text('rookie?"'))
+        s.pause(1)
+        s.print("\n")
+
+        s.delay_print2("You don’t intend to ignore it——")
+        s.pause(0.3)
+        s.delay_print2("not at first.")
+        s.pause(.5)
+        s.delay_print2(" You really were just awfully entrenched in thinking about table smudges.")
+        s.pause(.5)
+        s.delay_print2("\nBut when it does register, ")
+        s.pause(.3)
+        s.delay_print2(" you don’t lament yourself for staying silent.")
+        s.pause(.5)
+        s.delay_print2(" No, ")
+        s.delay_print2(italic_text("‘good’"))
+        s.delay_print2(", you think.")
+        s.pause(.5)
+        s.delay_print2(" Let him talk.")
+        s.pause(0.5)
+        s.delay_print2(" Let his voice echo off the walls.")
+        s.pause(4)
+
+
+
+    elif s.state["Office_Silent"] == True:
+
+        s.state["GrahamAnger"] -= 1
+        s.delay_print2("Oh.")
+        s.pause(.8)
+        s.delay_print2("\nHe just stays silent.")
+        s.pause(.3)
+        s.delay_print("\n...")
+        s.pause(.5)
+
+        s.delay_print2("\nThank god!")
+        s.pause(.5)
+        s.print("\n")
+
+        s.delay_print2("He’s still staring at you,")
+        s.pause(.3)
+        s.delay_print2(" but one less sensory issue to worry about is bliss to your overfunctioning brain.")
+        s.pause(.5)
+        s.delay_print2("\nIf he wants to be a ghost and haunt the room,")
+        s.pause(.3)
+        s.delay_print2(" let him.")
+        s.pause(1)
+        s.delay_print2("\nMaybe if you will it enough, ")
+        s.pause(0.2)
+        s.delay_print2("he’ll be like this all the time!")
+        s.pause(3)
+
+
+
+    elif s.state["Office_CallOut"] == True:
+        s.state["GrahamAnger"] += 1
+
+        s.delay_print2("When you observe the way someone’s face twitches before they speak, ") 
+        s.pause(.4)
+        s.delay_print2("that’s usually when you can decide if you’ll like what they say or not.")
+        s.pause(.5)
+        s.delay_print2("\nIn the case of the boss man, ")
+        s.delay_print2("you decide before his brain even formulates what he’s going to say.")
+        s.print("\n")
+        s.pause(.8)
+
+        s.delay_print2(italic_text('\n"Not even trying today, '))
+        s.pause(0.1)
+        s.delay_print2(italic_text('huh? '))
+        s.pause(0.3)
+        s.delay_print2(italic_text('At least pretend to look like you’re being productive."'))
+        s.pause(0.5)
+        s.print("\n")
+
+        s.delay_print2("You preemptively frowned for this,")
+        s.pause(.5)
+        s.delay_print2(" and lo and behold you were right in doing so.")
+        s.pause(.8)
+        s.delay_print2("\nAnyhow, it does remind you that you’d much rather be doing something less mentally taxing——")
+        s.pause(.3)
+        s.delay_print2("like the aforementioned paperwork.")
+        s.pause(.8)
+        s.delay_print2("\nEven if it does make it look like you’re hurrying away because of him.")
+        s.pause(3)
+
+    s.clear()
+    s.pause(1)
+    s.delay_print("...")
+    s.pause(1)
+    s.clear()
+
+
+# -----------------------------------------------------------------------------  
+
+        
+
+#Scene 2: The Briefing Room
+#Graham's POV
+def scene_2(s):
+    s.clear()
+    s.pause(1)
+    s.print(povs["graham_pov"])
+    s.delay_print1(italic_text("Meeting Room——National Incident Intelligence Agency, Prague, May 12, 1997"))
+    s.pause(1)
+    s.print("\n")
+
+    s.delay_print2("The fluorescent lights hum overhead, ")
+    s.pause(0.3)
+    s.delay_print2("casting a sterile glow over the room.")
+    s.pause(0.6)
+    s.delay_print2(" You sit at a long table, ")
+    s.pause(0.3)
+    s.delay_print2("cluttered with files and paperwork.")
+    s.pause(0.8)
+    s.delay_print2(" Across the table, ")
+    s.pause(0.3)
+    s.delay_print2("Grayson lounges like he owns the place——")
+    s.pause(0.4)
+    s.delay_print2("which he sort of does.")
+    s.pause(1)
+    s.print("\n")
+
+    s.delay_print2("He’s flipping through a thin manila folder like it personally offended him.")
+    s.pause(1)
+    s.print("\n")
+
+    s.print(speak["grayson_speak"])
+    s.delay_print2(italic_text("(tapping the folder)\n"))
+    s.delay_print2("“Rural disturbance report.")
+    s.pause(0.4)
+    s.delay_print2(" Three dead.")
+    s.pause(0.4)
+    s.delay_print2(" One survivor.")
+    s.pause(0.4)
+    s.delay_print2(" All official accounts redacted.")
+    s.pause(0.7)
+    s.delay_print2(" Ain't that just great?”")
+    s.pause(1.5)
+    s.print("\n")
+
+    s.print(speak["graham_speak"])
+    s.delay_print2(italic_text("(dryly)\n"))
+    s.delay_print2("“I thought redacting things was your department.”")
+    s.pause(1)
+    s.print("\n")
+
+    s.print(speak["grayson_speak"])
+    s.delay_print2(italic_text("(glancing up, unimpressed)\n"))
+    s.delay_print2("“I’m flattered.")
+    s.pause(0.3)
+    s.delay_print2(" But this one’s above even me.")
+    s.pause(1)
+    s.delay_print2(" No names,")
+    s.pause(0.3)
+    s.delay_print2(" no clear timestamp.")
+    s.pause(0.6)
+    s.delay_print2(" Just one line flagged in red——")
+    s.pause(0.5)
+    s.delay_print2("Containment breach suspected.”")
+    s.pause(2)
+    s.print("\n")
+
+    s.print(speak["graham_speak"])
+    s.delay_print2("“Suspected what?")
+    s.pause(0.3)
+    s.delay_print2(" Disease?”")
+    s.pause(1)
+    s.print("\n")
+
+    s.print("Grayson doesn’t smile this time.")
+    s.pause(0.5)
+    s.delay_print2("He tosses the folder across to you.")
+    s.pause(1)
+    s.print("\n")
+
+    s.print(speak["grayson_speak"])
+    s.delay_print2("“Whatever it is, it’s not your everyday case of food poisoning.")
+    s.pause(0.6)
+    s.delay_print2(" Read the medical note on the last page.”")
+    s.pause(1.5)
+    s.print("\n")
+
+    s.delay_print2("You flip it open.")
+    s.pause(0.4)
+    s.delay_print2(" Notes scrawled in black ink:")
+    s.pause(1)
+    s.print("\n")
+
+
+    s.delay_print2(italic_text("“Unresponsive to sedatives.”"))
+    s.pause(0.3)
+    s.delay_print2(italic_text(" Reanimated minutes after death."))
+    s.pause(0.4)
+    s.delay_print2(italic_text(" Aggression level extreme."))
+    s.pause(0.3)
+    s.delay_print2(italic_text(" Protocol failsafe triggered——"))
+    s.pause(0.4)
+    s.delay_print2(italic_text("containment "))
+    s.delay_print2(italic_text(bold_text(" unsuccessful.”")))
+    s.pause(2)
+    s.print("\n")
+
+    s.delay_print2("You freeze.")
+    s.pause(0.4)
+    s.delay_print2(" Slowly, you lower the folder.")
+    s.pause(1)
+    s.print("\n")
+
+    s.print(speak["graham_speak"])
+    s.delay_print2("Your first instinct is: ")
+    s.pause(0.2)
+    s.delay_print2("“This is fake.”")
+    s.pause(1)
+    s.print("\n")
+
+    s.print(speak["grayson_speak"])
+    s.delay_print2("“Sure.")
+    s.pause(0.4)
+    s.delay_print2(" Just like every conspiracy we ignore——")
+    s.pause(0.5)
+    s.delay_print2("until it rips through the city.”")
+    s.pause(1.5)
+    s.print("\n")
+
+    s.delay_print2("A moment of silence stretches between you both, thick with unspoken tension.")
+    s.pause(1)
+    s.print("\n")
+
+    s.print(speak["grayson_speak"])
+    s.delay_print2("“They’re sending us.")
+    s.pause(0.4)
+    s.delay_print2(" You ")
+    s.pause(0.1)
+    s.delay_print2("and me.”")
+    s.pause(1)
+    s.print("\n")
+
+    s.print(speak["graham_speak"])
+    s.delay_print2(italic_text("(scoffing)\n"))
+    s.delay_print2("“Together?”")
+    s.pause(1)
+    s.print("\n")
+
+    s.print(speak["grayson_speak"])
+    s.delay_print2(italic_text("(tone sharpening slightly)\n"))
+    s.delay_print2("“Yeah, together.")
+    s.pause(0.4)
+    s.delay_print2(" I know, ")
+    s.pause(0.3)
+    s.delay_print2("it’s so hard to believe they’d send their Deputy Director with a junior analyst instead of——")
+    s.pause(0.3)
+    s.delay_print2("I don’t know, a fully trained operative.”")
+    s.pause(1.5)
+    s.print("\n")
+
+    s.delay_print2("“Higher-ups think pairing up a pretty analyst with a dangerous bastard is good optics.")
+    s.pause(0.6)
+    s.delay_print2(" We’re leaving for Southern Bohemia——")
+    s.pause(0.2)
+    s.delay_print2("4:00pm, don’t be late.”")
+    s.pause(2)
+    s.print("\n")
+
+
+    s.delay_print2("You want to argue.")
+    s.pause(0.4)
+    s.delay_print2(" Or maybe laugh.")
+    s.pause(0.4)
+    s.delay_print2(" Or question the pretty part.")
+    s.pause(0.4)
+    s.delay_print2(" Can you file a workplace harassment complaint for that?")
+    s.pause(0.6)
+    s.delay_print2("\nBut the word ")
+    s.pause(0.1)
+    s.delay_print2(italic_text("reanimated"))
+    s.pause(0.1)
+    s.delay_print2(" is still buzzing in your head like a warning siren.")
+    s.pause(1.5)
+    s.print("\n")
+
+    s.delay_print2("You close the file.")
+    s.pause(3)
+    s.print("\n")
+
+    choices = [
+        "SARCASM",
+        "CHALLENGE",
+        "SERIOUS"
+    ]
+    selected = s.select(choices)
+
+    # Handle the player's choice
+    if selected == 0:  # SARCASM
+        s.state["GraysonAnger"] += 1
+        s.print(speak["graham_speak"])
+        s.delay_print2("“Oh lovely.")
+        s.pause(0.4)
+        s.delay_print2(" Do I get to carry your cigarettes too, ")
+        s.pause(0.2)
+        s.delay_print2("or is that above my clearance level?”")
+        s.pause(1)
+        s.print("\n")
+
+        s.print(speak["grayson_speak"])
+        s.delay_print2(italic_text("(sharply)\n"))
+        s.delay_print2("“Careful, rookie.")
+        s.pause(0.4)
+        s.delay_print2(" Keep talking like that and I’ll start thinking you enjoy this little dynamic we have.”")
+        s.pause(1.5)
+        s.print("\n")
+
+        s.delay_print2("He leans back with a smug look, ")
+        s.pause(0.3)
+        s.delay_print2("but there’s a flash of something tighter in his jaw—-")
+        s.pause(0.4)
+        s.delay_print2("he didn’t love the tone.")
+        s.pause(0.7)
+        s.delay_print2(" (You want to roll your eyes at that.)")
+        s.pause(0.4)
+        s.delay_print2(" Still, he recovers quick.")
+        s.pause(1)
+        s.print("\n")
+
+        s.delay_print2('“Besides, if you’re going to carry something, make it your weight.”')
+        s.pause(3)
+
+    elif selected == 1:  # CHALLENGE HIM
+        s.state["GraysonAnger"] += 2
+        s.state["GrahamAnger"] += 1
+
+        s.delay_print2("Really, ")
+        s.pause(0.2)
+        s.delay_print2(italic_text("this"))
+        s.pause(0.1)
+        s.delay_print2(" is out of your pay grade. ")
+        s.pause(0.5)
+        s.delay_print2("Maybe you’re just there to babysit? ")
+        s.pause(0.5)
+        s.delay_print2("You’re inclined to entertain that thought with a snicker.")
+        s.pause(0.7)
+
+        s.delay_print2('\n“If you’re so good at this, ')
+        s.pause(0.2)
+        s.delay_print2('how come they stuck you with "someone" ')
+        s.pause(0.1)
+        s.delay_print2('like me? ')
+        s.pause(0.4)
+        s.delay_print2('Doesn’t sound like a vote of confidence.”')
+        s.pause(1)
+        s.print("\n")
+
+        s.print(speak["grayson_speak"])
+        s.delay_print2(italic_text("(pauses, jaw tensing)\n"))
+        s.delay_print2('“They didn’t stick me with you, rookie.')
+        s.pause(0.4)
+        s.delay_print2(italic_text("\n(leans in)"))
+        s.delay_print2('\nThey stuck you with me. ')
+        s.pause(0.3)
+        s.delay_print2('There’s a difference. ')
+        s.pause(0.3)
+        s.delay_print2('And the only vote of confidence you need is whether I let you keep slowing me down.”')
+        s.pause(1.5)
+        s.print("\n")
+
+        s.print(speak["graham_speak"])
+        s.delay_print2("...")
+        s.pause(0.5)
+        s.delay_print2("\nPrick.")
+        s.pause(3)
+
+    elif selected == 2:  # GET SERIOUS
+        s.print(speak["graham_speak"])
+        s.delay_print2("“Reanimated?!")
+        s.pause(0.3)
+        s.delay_print2(" Seriously, what does that even mean?!")
+        s.pause(0.5)
+        s.delay_print2(" If this is real, ")
+        s.pause(0.3)
+        s.delay_print2("we're going to need a lot more than just two people and a folder of redacted crap.”")
+        s.pause(1)
+        s.print("\n")
+
+        s.print(speak["grayson_speak"])
+        s.delay_print2("“Welcome to the party.")
+        s.pause(0.4)
+        s.delay_print2(" That’s what I’ve been saying——")
+        s.pause(0.5)
+        s.delay_print2("no backup, ")
+        s.pause(0.2)
+        s.delay_print2("no prep, ")
+        s.pause(0.2)
+        s.delay_print2("just us and whatever this is.”\n")
+        s.pause(0.4)
+        s.delay_print2(italic_text("(leans forward, voice low)\n"))
+        s.delay_print2("“So unless you’ve got a plan hidden in that clipboard,")
+        s.pause(0.4)
+        s.delay_print2(" get your head on straight.")
+        s.pause(0.4)
+        s.delay_print2(" We move in four hours.”")
+        s.pause(3)
+
+    s.delay_print2("The room falls quiet again.")
+    s.pause(0.5)
+    s.delay_print2(" Outside, the clouds darken.")
+    s.pause(0.5)
+    s.delay_print2(" The day feels heavier than it should.")
+    s.pause(2)
+
+    s.clear()
+    s.pause(1)
+    s.delay_print("...")
+    s.pause(1)
+    s.clear()
+
+
+# -----------------------------------------------------------------------------
+
+
+
+# Scene 3A: The Departure
+# [POV SWITCH - Grayson’s POV]
+def scene_3a(s):
+
+    s.print(povs["grayson_pov"])
+    s.delay_print1(italic_text("Exterior——Ministry of Interior, Prague, May 12, 1997"))
+    s.pause(1.2)
+    s.print("\n")
+
+    s.delay_print2("The air’s thick with anticipation as you stand outside the Ministry’s front doors, ")
+    s.pause(0.1)
+    s.delay_print2("waiting for Graham.")
+    s.pause(1)
+    s.delay_print2("\nYour watch reads 3:50pm——")
+    s.pause(0.2)
+    s.delay_print2("ten minutes before you’re supposed to be on the move.")
+    s.pause(0.9)
+    s.delay_print2(" You’d rather be anywhere else, ")
+    s.pause(0.2)
+    s.delay_print2("but duty calls.")
+    s.pause(1.3)
+    s.print("\n")
+
+    s.delay_print2("You glance at your watch again, ")
+    s.pause(0.3)
+    s.delay_print2("and sure enough, ")
+    s.pause(0.2)
+    s.delay_print2("Graham rounds the corner——")
+    s.pause(0.4)
+    s.delay_print2("he walks like his limbs aren’t sure what order to move in.")
+    s.pause(0.7)
+    s.delay_print2(" Bag slung too low, ")
+    s.pause(0.2)
+    s.delay_print2(" hair trying and failing to lie flat.")
+    s.pause(0.6)
+    s.delay_print2("\nStill, ")
+    s.pause(0.2)
+    s.delay_print2("he cleaned up.")
+    s.pause(0.6)
+    s.delay_print2(" No bloodshot eyes, ")
+    s.pause(0.2)
+    s.delay_print2("no wrinkled shirt.")
+    s.pause(0.6)
+    s.delay_print2(" Improvement.")
+    s.pause(1.2)
+    s.print("\n")
+
+    s.delay_print2("At least Graham seems to have gotten the hint.")
+    s.pause(0.5)
+    s.delay_print2(" His appearance isn’t a ")
+    s.pause(0.05)
+    s.delay_print2("total ")
+    s.pause(0.1)
+    s.delay_print2("disaster.")
+    s.pause(0.4)
+    s.delay_print2(" Well, ")
+    s.pause(0.1)
+    s.delay_print2("for a rookie.")
+    s.pause(0.7)
+    s.delay_print2(" His posture’s still stiff, his expression still annoyed,")
+    s.pause(0.5)
+    s.delay_print2(" but there’s something that feels… right about his silence.")
+    s.pause(0.7)
+    s.delay_print2(" Maybe he’s finally realized this is real.")
+    s.pause(1.2)
+    s.print("\n")
+
+    s.print(speak["grayson_speak"])
+    s.delay_print2(italic_text("(mockingly)\n"))
+    s.delay_print2("“About time, rookie. ")
+    s.pause(0.2)
+    s.delay_print2("I was starting to think I’d have to go without you.”")
+    s.pause(1.3)
+    s.print("\n")
+
+    s.print(speak["graham_speak"])
+    s.delay_print2(italic_text("(grimaces, walking up to you)\n"))
+    s.delay_print2("“Didn’t realise we were in such a hurry. ")
+    s.pause(0.2)
+    s.delay_print2("I was busy packing.”")
+    s.pause(1)
+    s.print("\n")
+
+    s.delay_print2("You tilt your head slightly, narrowing your eyes.")
+    s.pause(0.5)
+    s.print("\n")
+
+    s.print(speak["grayson_speak"])
+    s.delay_print2("“Packing? ")
+    s.pause(0.2)
+    s.delay_print2("For what, ")
+    s.pause(0.1)
+    s.delay_print2("a vacation?”")
+    s.pause(0.5)
+    s.delay_print2(italic_text(" (You wave a hand dismissively)\n"))
+    s.delay_print2("“Forget it. ")
+    s.pause(0.2)
+    s.delay_print2("Let’s get this over with.”")
+    s.pause(1.5)
+    s.print("\n")
+
+    s.delay_print2("Graham hesitates, probably caught between wanting to argue")
+    s.pause(0.2)
+    s.delay_print2(" and realizing it's useless.")
+    s.pause(0.6)
+    s.delay_print2(" Good.")
+    s.pause(0.5)
+    s.delay_print2(" You’ve been in the business long enough to know that hesitation gets people killed.")
+    s.pause(1.5)
+    s.print("\n")
+
+    s.delay_print2("You start walking,")
+    s.pause(0.3)
+    s.delay_print2(" and after a moment, ")
+    s.pause(0.2)
+    s.delay_print2("he falls in line behind you.")
+    s.pause(1)
+    s.print("\n")
+
+    s.delay_print2("As you make your way to the vehicle, the weight of the file you’d been handed earlier presses on your mind.")
+    s.pause(0.8)
+    s.delay_print2("\nReanimated.")
+    s.pause(0.8)
+    s.delay_print2(" Could be some sort of freak case.")
+    s.pause(0.5)
+    s.delay_print2("\nBut with the way things are escalating,")
+    s.pause(0.4)
+    s.delay_print2(" you’ve learned better than to take things at face value.")
+    s.pause(1.8)
+    s.print("\n")
+
+    s.delay_print2("You’re surprised when Graham speaks up, voice low, almost reluctant.")
+    s.pause(1)
+    s.print("\n")
+
+    s.print(speak["graham_speak"])
+    s.delay_print2("“Do you really think it’s… real?")
+    s.pause(0.3)
+    s.delay_print2("What’s in that report?”")
+    s.pause(1.3)
+    s.print("\n")
+
+    s.delay_print2("You don’t look back at him,")
+    s.pause(0.6)
+    s.delay_print2(" but you can feel his eyes boring into your back.")
+    s.pause(3)
+    s.print("\n") 
+
+    # Player Choice - How do you respond?
+    choices = [
+        "DISMISSIVE",
+        "TRUTH",
+        "SARCASM"
+    ]
+    selected = s.select(choices)
+
+    if selected == 0:  # DISMISSIVE
+        s.print(speak["grayson_speak"])
+        s.delay_print2("“Doesn’t matter what I think.")
+        s.pause(0.8)
+        s.delay_print2(" Orders are orders.")
+        s.pause(0.7)
+        s.delay_print2(" You can burn energy on ‘what ifs’ all you want,")
+        s.pause(0.8)
+        s.delay_print2(" but we’ve got a van full of gear, an address, and a deadline.”")
+        s.pause(1.5)
+        s.print("\n")
+
+        s.delay_print2("Your tone is flat, dry——like you’ve had this conversation a hundred times before")
+        s.pause(0.4)
+        s.delay_print2(" with people who didn’t make it to the next one.")
+        s.print("\n")
+        s.pause(1.3)
+
+        s.print(speak["grayson_speak"])
+        s.delay_print2("“Start asking the wrong questions,")
+        s.pause(0.5)
+        s.delay_print2(" and you’ll miss what’s right in front of you.")
+        s.pause(0.7)
+        s.delay_print2(" And out there?”\n")
+        s.delay_print2(italic_text(" (You jerk your chin forwards, towards the edges of the city where everything turns to forest and fog)\n"))
+        s.delay_print2("“That kind of distraction gets people killed.”")
+        s.pause(1.6)
+        s.print("\n")
+
+        s.delay_print2("Graham doesn’t respond.")
+        s.pause(0.6)
+        s.delay_print2(" Not out loud.")
+        s.pause(0.6)
+        s.delay_print2(" But the silence that follows is heavier now.")
+        s.pause(1.2)
+        s.print("\n")
+
+    elif selected == 1:  # HARSH TRUTH
+        s.print(speak["grayson_speak"])
+        s.delay_print2("“Do I think it’s real?")
+        s.pause(0.7)
+        s.delay_print2(" What, like you want me to answer in comforting lies?")
+        s.pause(0.8)
+        s.delay_print2(" Or should I hit you with the cold, hard truth?”")
+        s.print("\n")
+        s.pause(1.5)
+
+        s.delay_print2("Graham doesn’t respond immediately,")
+        s.pause(0.6)
+        s.delay_print2(" and you can hear him swallowing back whatever he was going to say.")
+        s.pause(0.9)
+        s.delay_print2(" He’s thinking too much.")
+        s.pause(0.6)
+        s.delay_print2(" That’s his problem.")
+        s.pause(1.2)
+        s.print("\n")
+
+        s.print(speak["grayson_speak"])
+        s.delay_print2(italic_text("(still moving towards the car)\n"))
+        s.delay_print2("“I’ll tell you what you need to know.")
+        s.pause(0.7)
+        s.delay_print2(" Focus on surviving.")
+        s.pause(0.6)
+        s.delay_print2("\nWhatever this is, we’re walking straight into it——")
+        s.pause(0.6)
+        s.delay_print2("whether it’s a bad batch of food or something worse.")
+        s.pause(0.7)
+        s.delay_print2("\nI’m not here to give you a happy ending.”")
+        s.print("\n")
+        s.pause(1.7)
+
+    elif selected == 2:  # SARCASM
+        s.print(speak["grayson_speak"])
+        s.delay_print2(italic_text("(chuckles dryly)\n"))
+        s.delay_print2("“Real enough that they’re sending us instead of the usual clean-up crew.")
+        s.pause(0.9)
+        s.delay_print2("\nSo either it’s a freak accident with a body count, or….”")
+        s.print("\n")
+        s.pause(1.1)
+
+        s.delay_print2(italic_text("(You gesture vaguely toward the horizon)\n"))
+        s.delay_print2("“…we’re walking into something they don’t want to name out loud.")
+        s.pause(0.9)
+        s.delay_print2(" Which frankly, is my favourite kind of problem.”")
+        s.pause(1.4)
+        s.print("\n")
+
+        s.delay_print2("You glance at Graham, smirking.")
+        s.print("\n")
+        s.pause(1)
+
+        s.print(speak["grayson_speak"])
+        s.delay_print2("“Cheer up.")
+        s.pause(0.6)
+        s.delay_print2("\nWorst case, we die horribly,")
+        s.pause(0.7)
+        s.delay_print2(" and someone else has to do our paperwork.”")
+        s.print("\n")
+        s.pause(1.5)
+
+    # Continue Scene
+    s.delay_print2("You reach the car——the doors are unlocked, and you climb in without another word.")
+    s.print("\n")
+    s.pause(1.3)
+
+    s.delay_print2("Graham follows you, his hesitation lingering for a second before he slides into the passenger seat...")
+    s.pause(0.9)
+    s.delay_print2(" clearly uncomfortable with the tension that settles between you.")
+    s.print("\n")
+    s.pause(1.5)
+
+    s.delay_print2("The engine hums to life, and you glance over at him.")
+    s.pause(0.7)
+    s.delay_print2(" He’s pale, his grip tight on the seatbelt as he stares out the window...")
+    s.pause(0.9)
+    s.delay_print2(" a thousand thoughts whirling behind his eyes.")
+    s.print("\n")
+    s.pause(1.5)
+
+    s.print(speak["grayson_speak"])
+    s.delay_print2(italic_text("(muttering to yourself)\n"))
+    s.delay_print2("“You’ve got the luxury of second-guessing everything, rookie.")
+    s.pause(0.9)
+    s.delay_print2(" Not everyone’s so lucky.”")
+    s.print("\n")
+    s.pause(1.6)
+
+    s.delay_print2("There’s a long pause before Graham speaks again...")
+    s.pause(1.1)
+    s.delay_print2(" quieter this time.")
+    s.print("\n")
+    s.pause(1)
+
+    s.print(speak["graham_speak"])
+    s.delay_print2("“Are you ever going to tell me what this is all about?”")
+    s.print("\n")
+    s.pause(1.2)
+
+    s.delay_print2("You don’t look at him...")
+    s.pause(0.6)
+    s.delay_print2(" but you smirk to yourself.")
+    s.print("\n")
+    s.pause(1.3)
+
+    s.print(speak["grayson_speak"])
+    s.delay_print2("“Maybe you’ll find out.")
+    s.pause(0.7)
+    s.delay_print2(" But for now, focus on the task at hand.”")
+    s.print("\n")
+    s.pause(1.5)
+
+    s.delay_print2("The car speeds towards the edge of the city, ")
+    s.pause(0.3)
+    s.delay_print2(" where the unknown waits.")
+    s.print("\n")
+    s.pause(2)
+
+    s.clear()
+    s.pause(1)
+    s.delay_print("...")
+    s.pause(1)
+    s.clear()
+
+
+# -----------------------------------------------------------------------------
+
+# Scene 3B: En Route
+# [POV SWITCH - Graham’s POV]
+def scene_3b(s):
+
+    s.print(povs["graham_pov"])
+    s.delay_print1(italic_text("Interior——Agency Vehicle, En Route to Site 14, May 12, 1997"))
+    s.pause(1)
+    s.print("\n")
+
+    s.delay_print2("The roads blur past like an old film reel——")
+    s.pause(0.3)
+    s.delay_print2("washed-out greys, ")
+    s.pause(0.3)
+    s.delay_print2("rusting fences, ")
+    s.pause(0.3)
+    s.delay_print2("wilted countryside. \n")
+    s.pause(0.5)
+    s.delay_print2("You’re quiet, ")
+    s.pause(0.3)
+    s.delay_print2("watching buildings shrink behind you in the mirror, ")
+    s.pause(0.3)
+    s.delay_print2("the city exhaling its last breath.\n ")
+    s.pause(0.5)
+    s.delay_print2("At about this time, ")
+    s.pause(0.3)
+    s.delay_print2("the convenience store clerk you see the most would be clocking out. ")
+    s.pause(0.5)
+    s.delay_print2("Good for him.")
+    s.pause(1)
+    s.print("\n")
+
+    s.delay_print2("Grayson sits across from you, ")
+    s.pause(0.3)
+    s.delay_print2("thumbing through another folder. ")
+    s.pause(0.5)
+    s.delay_print2("His legs are crossed like he’s in a lounge, ")
+    s.pause(0.3)
+    s.delay_print2("not a state vehicle headed toward something deeply classified, ")
+    s.pause(0.3)
+    s.delay_print2("and possibly horrifying. ")
+    s.pause(0.5)
+    s.delay_print2("The man’s made of nerves, ")
+    s.pause(0.3)
+    s.delay_print2("and nicotine.")
+    s.pause(1)
+    s.print("\n")
+
+    s.print(speak["grayson_speak"])
+    s.delay_print2(italic_text("(reading aloud, vaguely bored)\n"))
+    s.delay_print2("“Subject One: Male, mid-thirties. ")
+    s.pause(0.3)
+    s.delay_print2("Presented with fever, ")
+    s.pause(0.3)
+    s.delay_print2("incoherence, ")
+    s.pause(0.3)
+    s.delay_print2("and——oh, this is a nice touch——")
+    s.pause(0.3)
+    s.delay_print2("extreme biting compulsion.”\n")
+    s.pause(0.5)
+    s.delay_print2(italic_text("(he raises a brow)\n"))
+    s.delay_print2("“Sounds like half the people I’ve dated.”")
+    s.pause(1.5)
+    s.print("\n")
+
+    s.delay_print2("You don’t laugh. ")
+    s.pause(0.3)
+    s.delay_print2("You don’t speak. ")
+    s.pause(0.5)
+    s.delay_print2("You’re thinking about your other neighbour who got bit by a raccoon once. ")
+    s.pause(0.5)
+    s.delay_print2("He was pretty much okay, ")
+    s.pause(0.3)
+    s.delay_print2("but then again, ")
+    s.pause(0.3)
+    s.delay_print2("he was 300 pounds of muscle, ")
+    s.pause(0.3)
+    s.delay_print2("and you’d be dealing with biting people, ")
+    s.pause(0.1)
+    s.delay_print2("so maybe it’s different.")
+    s.pause(1.5)
+    s.print("\n")
+
+    s.delay_print2("You keep staring at the countryside as it decays into industrial gloom. ")
+    s.pause(0.5)
+    s.delay_print2("The silence stretches.")
+    s.pause(3)
+    s.print("\n")
+
+    # Player Choice - What do you do?
+    choices = [
+        "WHY YOU WERE CHOSEN",
+        "QUESTION INTEL",
+        "STAY SILENT"
+    ]
+    selected = s.select(choices)
+
+    if selected == 0:  # ASK WHY YOU WERE CHOSEN
+        s.print(speak["graham_speak"])
+        s.delay_print2("“You never answered earlier. ")
+        s.pause(0.3)
+        s.delay_print2("Why me?”")
+        s.pause(1)
+        s.print("\n")
+
+        s.delay_print2("Grayson doesn’t look up at first. ")
+        s.pause(0.3)
+        s.delay_print2("When he does, ")
+        s.pause(0.3)
+        s.delay_print2("there’s something like annoyance on his face——")
+        s.pause(0.3)
+        s.delay_print2("but buried deep, ")
+        s.pause(0.3)
+        s.delay_print2("buried under layers of something harder to name.")
+        s.pause(1.5)
+        s.print("\n")
+
+        s.print(speak["grayson_speak"])
+        s.delay_print2("“Because someone up there thinks you’re smarter than you look.”\n")
+        s.pause(0.5)
+        s.delay_print2(italic_text("(pauses)\n"))
+        s.delay_print2("“Or expendable. ")
+        s.pause(0.3)
+        s.delay_print2("Maybe both.”")
+        s.pause(1.5)
+        s.print("\n")
+
+        s.print(speak["graham_speak"])
+        s.delay_print2("“Huh…. ")
+        s.pause(0.3)
+        s.delay_print2("Reassuring.”")
+        s.pause(1)
+        s.print("\n")
+
+        s.delay_print2("Somehow this seems to be the dichotomy you’ve been stuck with your whole life.")
+        s.pause(1)
+        s.print("\n")
+
+        s.print(speak["grayson_speak"])
+        s.delay_print2(italic_text("(shrugs)\n"))
+        s.delay_print2("“You wanted honesty.”")
+        s.pause(3)
+        s.print("\n")
+
+    elif selected == 1:  # QUESTION THE INTEL
+        s.print(speak["graham_speak"])
+        s.delay_print2("“This file’s a mess. ")
+        s.pause(0.3)
+        s.delay_print2("No video, ")
+        s.pause(0.3)
+        s.delay_print2("no timestamps, ")
+        s.pause(0.3)
+        s.delay_print2("just second-hand quotes. ")
+        s.pause(0.3)
+        s.delay_print2("This is a joke.”")
+        s.pause(1)
+        s.print("\n")
+
+        s.print(speak["grayson_speak"])
+        s.delay_print2("“Then laugh.”")
+        s.pause(1)
+        s.print("\n")
+
+        s.print(speak["graham_speak"])
+        s.delay_print2("“I'm serious. ")
+        s.pause(0.3)
+        s.delay_print2("There's nothing verifiable. ")
+        s.pause(0.3)
+        s.delay_print2("We’re going in blind.”")
+        s.pause(1.5)
+        s.print("\n")
+
+        s.print(speak["grayson_speak"])
+        s.delay_print2("“You think I don’t know that? ")
+        s.pause(0.3)
+        s.delay_print2("You think I’d be here if this was anything else?”")
+        s.pause(1.5)
+        s.print("\n")
+
+        s.delay_print2("He shuts the folder, ")
+        s.pause(0.3)
+        s.delay_print2("more forceful than necessary. ")
+        s.pause(0.5)
+        s.delay_print2("It sits between you like an unexploded grenade.")
+        s.pause(3)
+        s.print("\n")
+
+        s.state["GraysonAnger"] += 1
+
+    elif selected == 2:  # STAY SILENT
+        s.delay_print2("The folder stays open, ")
+        s.pause(0.3)
+        s.delay_print2("but neither of you read it anymore. ")
+        s.pause(0.5)
+        s.delay_print2("The silence grows heavy, ")
+        s.pause(0.3)
+        s.delay_print2("oppressive.")
+        s.pause(1.5)
+        s.print("\n")
+
+        s.delay_print2("The engine hums, ")
+        s.pause(0.3)
+        s.delay_print2("and the smell of leather, ")
+        s.pause(0.3)
+        s.delay_print2("old smoke, ")
+        s.pause(0.3)
+        s.delay_print2("and sterile polish fills your lungs.")
+        s.pause(1.5)
+        s.print("\n")
+
+        s.delay_print2("Grayson finally breaks it.")
+        s.pause(1)
+        s.print("\n")
+
+        s.print(speak["grayson_speak"])
+        s.delay_print2("“Whatever’s at Site 14, ")
+        s.pause(0.3)
+        s.delay_print2("it’s not just paperwork. ")
+        s.pause(0.5)
+        s.delay_print2("So get your head on, ")
+        s.pause(0.3)
+        s.delay_print2("Svoboda.”")
+        s.pause(1.5)
+        s.print("\n")
+
+        s.delay_print2("Your name sounds foreign in his mouth. ")
+        s.pause(0.5)
+        s.delay_print2("You don’t respond. ")
+        s.pause(0.3)
+        s.delay_print2("Hah. ")
+        s.pause(0.3)
+        s.delay_print2("You really are petty.")
+        s.pause(3.5)
+        s.print("\n")
+
+    s.clear()
+    s.pause(1)
+    s.delay_print("...")
+    s.pause(1)
+    s.clear()
+
+
+# -----------------------------------------------------------------------------
+
+# SCENE 4: Site 14
+# [POV SWITCH - Grayson’s POV]
+def scene_4(s):
+    s.clear()
+    s.pause(1)
+    s.print(povs["grayson_pov"])
+    s.delay_print1(italic_text("Site 14, Edge of the Forest, Southern Bohemia, May 12, 1997"))
+    s.pause(2)   
+    s.print("\n")
+
+    s.delay_print2("The vehicle stops just off a gravel path."), s.pause(0.4)
+    s.delay_print2(" Woods stretch around the compound like a noose."), s.pause(0.4)
+    s.delay_print2(" Barbed fences twist between trees."), s.pause(0.6)
+    s.delay_print2(" You’ve seen plenty of bleak crap in your time——but this place?"), s.pause(0.6)
+    s.delay_print2(" This place feels off.")
+    s.pause(2)
+    s.print("\n")
+
+    s.delay_print2("No birds."), s.pause(0.4)
+    s.delay_print2(" No insects."), s.pause(0.4)
+    s.delay_print2(" Just the wind and the creak of an unguarded gate.")
+    s.pause(1)
+    s.print("\n")
+
+    s.print(speak["graham_speak"])
+    s.delay_print2("“Doesn’t look very…contained.”")
+    s.print("\n")
+    s.pause(1.5)
+
+    s.delay_print2("You flick your lighter open and closed, once, twice."), s.pause(0.4)
+    s.delay_print2(" Not because you need it——")
+    s.delay_print2("but because it’s the only sound you trust right now.")
+    s.print("\n")
+    s.pause(2)
+
+    s.delay_print2("Your sidearm weighs heavy at your hip."), s.pause(0.4)
+    s.delay_print2(" You check it without looking——just a brief palm press to make sure it’s still there, chambered and ready."), s.pause(0.8)
+    s.delay_print2(" Graham noticed."), s.pause(0.4)
+    s.delay_print2(" His hand flinches toward his own holster, uncertain.")
+    s.pause(1.5)
+    s.print("\n")
+
+    s.print(speak["grayson_speak"])
+    s.delay_print2(italic_text("(low voice)\n"))
+    s.delay_print2("“Stay close."), s.pause(0.4)
+    s.delay_print2(" And if you see anything moving——don’t freeze."), s.pause(0.4)
+    s.delay_print2(" Don't ask questions."), s.pause(0.4)
+    s.delay_print2(" Just put it down.”")
+    s.pause(2)
+    s.print("\n")
+
+    s.delay_print2("He tenses slightly at that,"), s.pause(0.4)
+    s.delay_print2(" You can tell."), s.pause(0.4)
+    s.delay_print2(" He’s not used to guns——not used to you.")
+    s.pause(2)
+    s.print("\n")
+
+    s.delay_print2("That makes two of you.")
+    s.pause(2)
+    s.print("\n")
+
+    s.delay_print2("The trees part to reveal the edge of a courtyard."), s.pause(0.4)
+    s.delay_print2(" Dried blood stains the concrete."), s.pause(0.4)
+    s.delay_print2(" The silence presses against your skin like a too-tight suit.")
+    s.pause(2)
+    s.print("\n")
+
+    s.delay_print2("You look back once at Graham."), s.pause(0.4)
+    s.delay_print2(" He’s trying to mask it, but you see it——his pulse ticking fast,"), s.pause(0.4)
+    s.delay_print2(" his hand flexing at his side like it’s grasping for something that isn’t there.")
+    s.pause(2)
+    s.print("\n")
+
+    s.print(speak["grayson_speak"])
+    s.delay_print2("“Too late to run now, isn’t it?”")
+    s.pause(4)
+    s.print("\n")
+    s.clear()
+    s.pause(3)
+
+    s.clear()
+    s.pause(1)
+    s.delay_print("...")
+    s.pause(1)
+    s.clear()
+
+
+# -----------------------------------------------------------------------------
+
+# SCENE 5A:
+# [POV SWITCH - Graham’s POV]
+def scene_5a(s):
+    s.print(povs["graham_pov"])
+    s.delay_print2("There’s a heavy turning in your stomach,"), s.pause(0.4)
+    s.delay_print2(" it’s a feeling more than faithless dread."), s.pause(0.4)
+    s.delay_print2(" It's a wild beast–its claws digging into your guts and prodding."), s.pause(0.4)
+    s.delay_print2(" It’s the dog barking and scratching at the door before an earthquake.")
+    s.pause(2)
+    s.print("\n")
+
+    s.delay_print2("The animal of your brain has processed something before you,"), s.pause(0.4)
+    s.delay_print2(" the civilized master, could even understand.")
+    s.pause(1.5)
+    s.print("\n")
+
+    s.delay_print2("You must not be doing a very good job at masking your emotions.")
+    s.pause(2)
+    s.print("\n")
+
+    s.print(speak["grayson_speak"])
+    s.delay_print2("“Great job, rookie."), s.pause(0.4)
+    s.delay_print2(" You’re really selling the ‘cool under pressure’ act."), s.pause(0.4)
+    s.delay_print2(" Keep it up, and they’ll make a statue out of you.”")
+    s.pause(2)
+    s.print("\n")
+
+    s.delay_print2("You try to reign yourself in again,"), s.pause(0.4)
+    s.delay_print2(" only to discover your dog brain has undone centuries of evolutions."), s.pause(0.4)
+    s.delay_print2(" From its stable whining, it's now biting at you and screaming——it's a beast undone."), s.pause(0.4)
+    s.delay_print2(" You’re going to go crazy if you don’t do something about that.")
+    s.pause(2)
+    s.print("\n")
+
+    # [PLAYER CHOICE - What do you do?]
+    choices = [
+        "MUZZLE THE DOG",
+        "LET IT SPEAK"
+    ]
+    selected = s.select(choices)
+
+    # Handle the player's choice
+    if selected == 0:  # MUZZLE THE DOG
+        s.state["Composure"] += 1
+        s.state["Instinct"] -= 1
+        s.delay_print2("You’re not reasoning your way out of this one,"), s.pause(0.4)
+        s.delay_print2(" so you speak a language its primal brain understands.\n"), s.pause(2)
+        s.delay_print2("You grit your teeth,"), s.pause(0.4)
+        s.delay_print2(" and you bite your tongue so hard you feel like it might come clean off.\n"), s.pause(0.4)
+        s.delay_print2("The beast whimpers and shies,"), s.pause(0.4)
+        s.delay_print2(" and you’re fine.\n"), s.pause(2)
+        s.delay_print2("You. Are. Fine."), s.pause(0.4)
+        s.delay_print2(" You are not losing your marbles today.")
+        s.pause(2)
+        s.print("\n")
+
+        s.print(speak["graham_speak"])
+        s.delay_print2("So you keep your feet moving, even if you do feel like hurling.\n")
+        s.pause(1.5)
+        s.delay_print2("“I’d prefer to be a painting.”")
+        s.pause(2)
+        s.print("\n")
+
+        s.delay_print2("Your tone is dry and even and it does NOT crack."), s.pause(0.4)
+        s.delay_print2(" You're sure if someone was spectating they’d clap at you for your insurmountable feat of will."), s.pause(0.4)
+        s.delay_print2(" There’s some breath of levity at that.")
+        s.pause(3)
+        s.print("\n")
+
+    elif selected == 1:  # LET IT SPEAK
+        s.state["Composure"] -= 1
+        s.state["Instinct"] += 1
+        s.state["Dogbrained"] = True
+        s.delay_print2("You stop walking."), s.pause(0.4)
+        s.delay_print2(" Your eyes dart around."), s.pause(0.4)
+        s.delay_print2(" Your nose twitches."), s.pause(0.4)
+        s.delay_print2(" The hair on the back of your neck stands on edge and you listen."), s.pause(2)
+        s.delay_print2(" Somewhere between the metallic sting of blood and the echo of silence,"), s.pause(0.4)
+        s.delay_print2(" you feel it.")
+        s.pause(2)
+        s.print("\n")
+
+        s.delay_print2("The air stirs around something,"), s.pause(0.4)
+        s.delay_print2(" about forty six centimetres in width and two meters in height."), s.pause(0.4)
+        s.delay_print2(" It lumbers and drags itself,"), s.pause(0.4)
+        s.delay_print2(" stumbling over vines and debris alike."), s.pause(0.4)
+        s.delay_print2(" It smells putrid.")
+        s.pause(2)
+        s.print("\n")
+
+        s.delay_print2("You’re really off your rockers now.")
+        s.pause(2)
+        s.print("\n")
+
+        s.print(speak["graham_speak"])
+        s.delay_print2("“There’s– There’s something here with us”")
+        s.print("\n")
+        s.pause(2)
+
+        s.print(speak["grayson_speak"])
+        s.delay_print2("He shoots you a concerned look.\n")
+        s.pause(1.5)
+        s.delay_print2("“If something wants us dead,"), s.pause(0.4)
+        s.delay_print2(" it would’ve made a move already."), s.pause(0.4)
+        s.delay_print2(" You’re not that interesting.”")
+        s.pause(2)
+        s.print("\n")
+        s.delay_print(". . .")
+        s.pause(1.5)
+        s.print("\n")
+        s.delay_print2("You’re not sure he actually says the last part,"), s.pause(0.4)
+        s.delay_print2(" your heart is pounding too loud in your ears to hear him,"), s.pause(0.4)
+        s.delay_print2(" or anything for that matter.")
+        s.pause(3)
+        s.print("\n")
+
+    # [BACK TO THE GENERAL PATH]
+
+
+    s.delay_print2("The more you walk, the more your head pounds,")  
+    s.pause(0.8)  
+    s.delay_print2(" it’s like every step just adds another pulse under your head.")  
+    s.pause(1.3)  
+
+    s.delay_print2("The world keeps darting in and out.\n")  
+    s.pause(1.1)  
+    s.delay_print2("For a moment, it’s overwhelming,")  
+    s.pause(0.7)  
+    s.delay_print2(" the clothes grating against your skin like lemon juice on raw nerve endings.\n")  
+    s.pause(1.6)  
+
+    s.delay_print2("Then, the pendulum swings to the other side.")  
+    s.pause(1.1)  
+    s.delay_print2(" You’re enveloped in the never-ending nothingness.")  
+    s.pause(2.2)  
+    s.print("\n")
+
+    s.delay_print2("You watch someone with unkempt hair trailing through a splash of green.\n")  
+    s.pause(1.3)  
+    s.delay_print2(" It looks like you.")  
+    s.pause(1.1)  
+    s.delay_print2(" Even so, it stirs no familiarity.\n")  
+    s.pause(1.5)  
+
+    s.delay_print2("You are detached,")  
+    s.pause(0.7)  
+    s.delay_print2(" and formless for a moment,")  
+    s.pause(0.9)  
+    s.delay_print2(" and then you’re pulled right back into the world,")  
+    s.pause(1.2)  
+    s.delay_print2(" screaming and tearing at your flesh with its sensory phenomena.\n")  
+    s.pause(1.8)  
+
+    s.delay_print2("Your existence swings back and forth like that for what feels like millennia.")  
+    s.pause(1.4)  
+    s.delay_print2(" You don’t even realize it’s stopped at first.")  
+    s.print("\n")
+    s.pause(2)  
+
+    s.delay_print2("Digging at the flesh of your arm,")  
+    s.pause(0.9)  
+    s.delay_print2(" it’s only a few more minutes of trekking before you see the first signs of civilization:\n\n")  
+    s.pause(2.2)  
+
+    s.delay_print2("A grey chain link fence.")  
+    s.pause(1.1)  
+    s.delay_print2(" It's tilted way off its axis,")  
+    s.pause(1.0)  
+    s.delay_print2(" and large segments of it are completely missing.\n")  
+    s.pause(1.3)  
+    s.delay_print2(" It acts as a pitiful attempt of a border between the creeping undergrowth and the overgrown industrial cement.\n")  
+    s.pause(1.6)  
+
+    s.delay_print2("Maybe at some point,")  
+    s.pause(0.4)  
+    s.delay_print2(" it did a worthy job at its purpose,")  
+    s.pause(1.0)  
+    s.delay_print2(" but now it’s just sad.")  
+    s.print("\n")
+    s.pause(2)  
+
+    s.delay_print2("Grayson stops just in front of a hole in the fence,")  
+    s.pause(0.9)  
+    s.delay_print2(" big enough to be easily ducked through.\n")  
+    s.pause(1.2)  
+    s.delay_print2(" You can practically see the neurons firing in his brain.")  
+    s.pause(1.4)  
+    s.delay_print2(" He’s going to do something stupid.")  
+    s.print("\n")
+    s.pause(2)  
+
+    s.print(speak["grayson_speak"])  
+    s.delay_print2("“Ladies first.”")  
+    s.pause(2)  
+    s.print("\n")
+
+    s.delay_print2("He exaggerates a chivalrous bow.")  
+    s.pause(1.1)  
+    s.delay_print2(" You want to laugh,\n")  
+    s.pause(0.8)  
+    s.delay_print2(" but your desire is wiped the moment you remind yourself he’s a bit of a prick.")  
+    s.pause(1.6)  
+    s.delay_print2(" And anyhow,")  
+    s.pause(0.7)  
+    s.delay_print2(" you can do over-the-top roleplay better than that.")  
+    s.pause(4)  
+    # -----------------------------------------------------------------------------
+    # [PLAYER CHOICE - What do you do?]
+    choices = [
+        "PLAY ALONG",
+        "IGNORE"
+    ]
+    selected = s.select(choices)
+
+    # Handle the player's choice
+    if selected == 0:  # GO ALONG WITH IT
+        s.delay_print2("You raise your voice two octaves higher.")  
+        s.pause(1.2)  
+        s.delay_print2(" “Wow! Thank you kind sir!”")  
+        s.pause(1.6)  
+        s.delay_print2(" You consider batting your lashes,")  
+        s.pause(1.0)  
+        s.delay_print2(" but that might be doing too much.")  
+        s.pause(2)  
+        s.print("\n")
+
+        s.delay_print2("You step through the hole in the fence,")  
+        s.pause(0.6)  
+        s.delay_print2(" and imagine he’s stupefied.")  
+        s.pause(1)  
+        s.delay_print2(" Maybe he’s not,")  
+        s.pause(0.6)  
+        s.delay_print2(" but it’s fun to think about.")  
+        s.pause(2)  
+
+    elif selected == 1:  # IGNORE HIM
+        s.delay_print2("You don't even acknowledge his attempt at humor.")  
+        s.pause(0.7)  
+        s.delay_print2(" You’re too far gone for games like that.")  
+        s.pause(1.2)  
+        s.print("\n")
+
+        s.delay_print2("Grayson’s voice fades behind you as you move through the hole in the fence without a word,")  
+        s.pause(.6)  
+        s.delay_print2(" the quiet grind of metal on concrete ringing in your ears as you duck through.")  
+        s.pause(3)
+        s.clear()
+        s.pause(1)
+        s.delay_print("...")
+        s.pause(1)
+        s.clear()
+
+
+# -----------------------------------------------------------------------------
+
+# SCENE 5B:
+# [POV SWITCH - Grayson’s POV]
+def scene_5b(s):
+    s.print(povs["grayson_pov"])
+    s.delay_print2("The chain-link fence rattles behind you as you swing over it, ")
+    s.pause(0.4)
+    s.delay_print2("landing with a muted thud on the pavement, ")
+    s.pause(0.4)
+    s.delay_print2("where tufts of grass have started to seep throigh the cracks——")
+    s.pause(0.7)
+    s.delay_print2("nature reclaiming what bureaucracy forgot.\n")
+    s.pause(1.5)
+    s.delay_print2("You straighten out your coat, ")
+    s.pause(0.4)
+    s.delay_print2("brushing off the flakes of rust that clung to the hem like dead insects.")
+    s.print("\n")
+    s.pause(1.5)
+
+    s.delay_print2("The compound towers ahead——")
+    s.pause(0.4)
+    s.delay_print2("unadorned concrete walls,")
+    s.pause(0.4)
+    s.delay_print2(" stained with time and smoke.")
+    s.pause(1.2)
+    s.delay_print2("Brutalit and blank, ")
+    s.pause(0.4)
+    s.delay_print2(" like a structure meant to outlive people")
+    s.pause(1.2)
+    s.delay_print2("No signage.")
+    s.pause(0.4)
+    s.delay_print2(" No welcome mat.")
+    s.pause(0.6)
+    s.delay_print2(" Just that feeling—there’s something wrong in the geometry of it.")
+    s.pause(0.7)
+    s.delay_print2(" Wrong in the silence.")
+    s.print("\n")
+    s.pause(1.5)
+
+    s.delay_print2("You light another cigarette.")
+    s.pause(0.4)
+    s.delay_print2(" You’ve been chain-smoking since Prague.")
+    s.pause(0.6)
+    s.delay_print2(" You tell yourself it’s the nerves.")
+    s.pause(0.4)
+    s.delay_print2(" But you know it’s not.")
+    s.pause(1.5)
+    s.print("\n")
+
+    s.delay_print2("Graham’s already halfway to the courtyard, scanning, twitchy.")
+    s.pause(0.6)
+    s.delay_print2(" His shoulders tense like he’s wearing someone else’s skin.")
+    s.print("\n")
+    s.pause(2)
+    # -----------------------------------------------------------------------------
+    # [PLAYER CHOICE - What do you do?]
+    choices = [
+        "JOKE",
+        "STAY SILENT"
+    ]
+    selected = s.select(choices)
+
+    # Handle the player's choice
+    if selected == 0:  # BREAK THE SILENCE
+        s.print(speak["grayson_speak"])
+        s.delay_print2("“If something jumps out and eats you, ")
+        s.pause(0.3)
+        s.delay_print2("I’m not filing the paperwork.”")
+        s.pause(1.5)
+        s.print("\n")
+
+        s.print(speak["graham_speak"])
+        s.delay_print2(italic_text("(glancing back, muttering)\n"))
+        s.delay_print2("“Wasn’t expecting you to. ")
+        s.pause(0.5)
+        s.delay_print2("Probably forge my death certificate and go get lunch.”")
+        s.pause(1.5)
+        s.print("\n")
+
+        s.print(speak["grayson_speak"])
+        s.delay_print2(italic_text("(chuckles)\n"))
+        s.delay_print2("“Lunch and a raise. ")
+        s.pause(0.3)
+        s.delay_print2(" Don’t tempt me.”")
+        s.pause(1.5)
+        s.print("\n")
+
+        s.delay_print2("He doesn’t respond, ")
+        s.pause(.4)
+        s.delay_print2("but his pace slows——")
+        s.pause(.4)
+        s.delay_print2("either from nerves or just the weight of your voice pulling at his spine.")
+        s.pause(2)
+        s.print("\n")
+
+    elif selected == 1:  # STAY SILENT
+        s.pause(1.5)
+    # -----------------------------------------------------------------------------
+
+    s.delay_print2("He hovers near the shadow of the main building, where the gray concrete swallows light.")
+    s.pause(1.5)
+    s.print("\n")
+
+    s.delay_print2("You follow.")
+    s.pause(1.5)
+    s.print("\n")
+
+    s.delay_print2("Every step echoes wrong——")
+    s.pause(0.4)
+    s.delay_print2("too loud, ")
+    s.pause(0.3)
+    s.delay_print2("too sharp.")
+    s.pause(0.6)
+    s.delay_print2(" Somewhere, a bird starts to chirp.")
+    s.pause(0.4)
+    s.delay_print2(" Then stops mid-note.")
+    s.pause(1.5)
+    s.print("\n")
+
+    s.delay_print2("There’s a streak of something on the compound wall ahead——dark and old.")
+    s.pause(0.6)
+    s.delay_print2(" Could be blood.")
+    s.pause(0.4)
+    s.delay_print2(" Could be paint.")
+    s.pause(0.4)
+    s.delay_print2(" Could even just be a bad joke.")
+    s.pause(1.5)
+    s.print("\n")
+
+    s.delay_print2("You don’t laugh.")
+    s.pause(1.5)
+    s.print("\n")
+
+    s.print(speak["grayson_speak"])
+    s.delay_print2(italic_text("(muttering to yourself)\n"))
+    s.delay_print2("“Looks like hell built a bunker.”")
+    s.pause(1.5)
+    s.print("\n")
+
+    s.delay_print2("Graham pauses near the main door, ")
+    s.pause(0.4)
+    s.delay_print2("one hand hovering by his belt, ")
+    s.pause(0.3)
+    s.delay_print2("uncertain if he should draw or knock.")
+    s.pause(1.5)
+    s.print("\n")
+
+    s.print(speak["grayson_speak"])
+    s.delay_print2(italic_text("(eyebrow raised)\n"))
+    s.delay_print2("“Well? ")
+    s.pause(0.2)
+    s.delay_print2("You first. ")
+    s.pause(0.3)
+    s.delay_print2("You were so eager to get inside.”")
+    s.pause(1.5)
+    s.print("\n")
+
+    s.print(speak["graham_speak"])
+    s.delay_print2(italic_text("(frowning)\n"))
+    s.delay_print2("“I wasn’t. ")
+    s.pause(0.3)
+    s.delay_print2("You just walk like a crypt keeper.”")
+    s.pause(1.5)
+    s.print("\n")
+
+    s.print(speak["grayson_speak"])
+    s.delay_print2("“Cute. ")
+    s.pause(0.3)
+    s.delay_print2("Let’s see if your sense of humour survives inside the compound.”")
+    s.pause(1.5)
+    s.print("\n")
+
+
+# Scene: Exploring the Building
+def exploring_the_building(s):
+    s.delay_print2("Graham leads the way, opening the door and stepping through.")
+    s.pause(0.6)
+    s.delay_print2("\nThe space beyond swallows light, ")
+    s.pause(0.4)
+    s.delay_print2("as if it doesn’t want to be seen.")
+    s.pause(0.6)
+    s.delay_print2("\nYour boots scrape across the concrete floor, ")
+    s.pause(0.4)
+    s.delay_print2("and the staleness of the air hits you first——")
+    s.pause(0.4)
+    s.delay_print2("a heavy, ")
+    s.pause(0.4)
+    s.delay_print2("oppressive weight, ")
+    s.pause(0.6)
+    s.delay_print2("like the whole place has been holding its breath for years.")
+    s.pause(1.2)
+    s.delay_print2("\nThe faint smell of mold and something else—something metallic, ")
+    s.pause(0.3)
+    s.delay_print2("like the air itself has turned rusty.")
+    s.pause(2)
+
+    s.print("\n")
+    s.delay_print2("Graham freezes, ")
+    s.pause(0.4)
+    s.delay_print2("scanning the empty hallway.")
+    s.pause(0.6)
+    s.delay_print2(" His hand stays near his belt.")
+    s.pause(0.6)
+    s.delay_print2("\nHe’s still acting twitchy.")
+    s.pause(0.6)
+    s.delay_print2("\nYou don’t blame him.")
+    s.pause(0.4)
+    s.delay_print2(" The silence here is different.")
+    s.pause(0.6)
+    s.delay_print2("\nIt’s suffocating, ")
+    s.pause(0.6)
+    s.delay_print2("like the world beyond the door is a distant memory, ")
+    s.pause(0.4)
+    s.delay_print2("and everything inside is just… .")
+    s.pause(0.6)
+    s.delay_print2("waiting.")
+    s.pause(2)
+
+    s.print("\n")
+    s.print(speak["grayson_speak"])
+    s.delay_print2("“Now you’re starting to look like a guy who doesn’t want to be here.”")
+    s.pause(1.5)
+    s.print("\n")
+
+    s.print(speak["graham_speak"])
+    s.delay_print2(italic_text("(eyes darting, hesitant)\n"))
+    s.delay_print2("“I never said I did. ")
+    s.pause(0.4)
+    s.delay_print2("This place feels… ")
+    s.pause(0.3)
+    s.delay_print2(italic_text('wrong."'))
+    s.pause(1.5)
+    s.print("\n")
+
+    s.print(speak["grayson_speak"])
+    s.delay_print2("“You’re paranoid. ")
+    s.pause(0.6)
+    s.delay_print2("But hey, ")
+    s.pause(0.4)
+    s.delay_print2("I’m with you.")
+    s.pause(0.6)
+    s.delay_print2(" This looks like the kind of place where bad decisions get made.”")
+    s.pause(1.5)
+    s.print("\n")
+
+    s.delay_print2("You both move deeper into the building.")
+    s.pause(0.6)
+    s.delay_print2("\nThe dim light filtering through cracked windows doesn’t do much to ease the feeling of claustrophobia building in your chest.")
+    s.pause(0.8)
+    s.delay_print2("\nThe walls here are streaked—worn down by time and neglect.")
+    s.pause(0.6)
+    s.delay_print2("\nSome rooms are half-gutted—furniture upended, ")
+    s.pause(0.4)
+    s.delay_print2("rusted machines, ")
+    s.pause(0.4)
+    s.delay_print2("old papers scattered like someone just… ")
+    s.pause(0.6)
+    s.delay_print2("vanished in the middle of their work.")
+    s.pause(1.2)
+    s.delay_print2("\nNothing seems to have been touched for years.")
+    s.pause(0.6)
+    s.delay_print2(" It’s like everything was frozen in time.")
+    s.print("\n")
+    s.pause(2)
+
+    s.delay_print2("You pass by a metal door with a thick window that’s been shattered, shards of glass still hanging from the frame like a twisted ornament.")
+    s.pause(0.8)
+    s.delay_print2(" Beneath the door, the floor is stained—brown and sticky.")
+    s.pause(0.6)
+    s.delay_print2(" You step over it, trying not to breathe too deeply.")
+    s.pause(0.6)
+    s.delay_print2(" Something about the bloodstains doesn’t sit right with you.")
+    s.print("\n")
+    s.pause(2)
+
+    s.print(speak["graham_speak"])
+    s.delay_print2(italic_text("(tense)\n"))
+    s.delay_print2("“Something happened here. Doesn’t take a genius to see that.”")
+    s.print("\n")
+    s.pause(1.5)
+
+    s.print(speak["grayson_speak"])
+    s.delay_print2(italic_text("(smirking)\n"))
+    s.delay_print2("“Could’ve been a fire drill gone wrong.")
+    s.pause(0.4)
+    s.delay_print2(" Or a bad lunch order.”")
+    s.print("\n")
+    s.pause(1.5)
+
+    s.delay_print2("You turn a corner and find yourself facing a long hallway lined with dark doors.")
+    s.pause(0.6)
+    s.delay_print2(" The place feels like a maze, like it’s designed to confuse or trap.")
+    s.pause(0.6)
+    s.delay_print2(" You can’t help but feel… watched.")
+    s.pause(0.6)
+    s.delay_print2(" There’s an eerie hum in the air, like the building itself is alive, trying to tell you something.\n\n")
+    s.pause(2)
+
+    s.print(speak["grayson_speak"])
+    s.delay_print2(italic_text("(under your breath)\n"))
+    s.delay_print2("“I swear, this place is more unsettling than your personality.”")
+    s.print("\n")
+    s.pause(1.5)
+
+    s.print(speak["graham_speak"])
+    s.delay_print2("Graham’s eyes flick to you, then back to the hallway ahead.")
+    s.pause(0.6)
+    s.delay_print2(" He doesn’t smile.")
+    s.pause(0.4)
+    s.delay_print2(" He doesn’t laugh.")
+    s.print("\n")
+    s.pause(1.5)
+
+    s.print(speak["graham_speak"])
+    s.delay_print2("“I’m not unsettling.")
+    s.pause(0.4)
+    s.delay_print2(" Now shut up and keep moving.”")
+    s.print("\n")
+    s.pause(1.5)
+
+    s.delay_print2("You both keep going.")
+    s.pause(0.6)
+    s.delay_print2(" You can feel the tension building.")
+    s.pause(0.6)
+    s.delay_print2(" The hall seems endless, and every creak, every shift in the air makes your skin crawl.")
+    s.pause(0.8)
+    s.delay_print2(" But you don’t stop.")
+    s.pause(0.4)
+    s.delay_print2(" You won’t.")
+    s.pause(0.4)
+    s.delay_print2(" Not yet.")
+    s.pause(3)
+    s.clear()
+    s.pause(1)
+    s.delay_print("...")
+    s.pause(1)
+    s.clear()
+
+    # Reset anger counts
+    s.state["GrahamAnger"] = 0
+    s.state["GraysonAnger"] = 0
+
+
+# -----------------------------------------------------------------------------
+
+
+
+
+
+# SCENE 5C
+# PO
+def scene_5c(s):
+    s.delay_print2(povs["grayson_pov"])
+    s.delay_print2("The hallway stretches ahead like some twisted game of cat and mouse. ")
+    s.pause(.4)
+    s.delay_print2("The dim light flickers overhead, casting strange shadows that dance and jitter with every step\n")
+    s.pause(.8)
+    s.delay_print2("The air is thick with dust, ")
+    s.pause(.3)
+    s.delay_print2("and  you feel like you're moving through a tomb. ")
+    s.pause(.8)
+    s.delay_print2("There's no noise")
+    s.pause(.4)
+    s.delay_print2("——except for the odd creaks and groans of the building settling around you.\n")
+    s.pause(1.3)
+    s.delay_print2("The silence here is deafening.\n\n")
+
+    s.pause(1.5)
+    s.delay_print2("Graham starts walking faster than before, ")
+    s.pause(.4)
+    s.delay_print2("his steps a little sharper, more anxious. ")
+    s.pause(.8)
+    s.delay_print2("You're not sure if it's the silence or the sense that something is about to go wrong\n\n")
+    s.pause(1.3)
+
+    s.print(speak["graham_speak"])
+    s.delay_print2(italic_text(("(urgently, halting suddenly)\n")))
+    s.pause(.8)
+    s.delay_print2('"Wait——')
+    s.pause(.2)
+    s.delay_print2('did you hear that?!"')
+    s.print("\n")
+
+    s.pause(1.5)
+    s.delay_print2("Your hand instinctively falls to your firearm, ")
+    s.pause(.4)
+    s.delay_print2("immediately aleart. ")
+    s.pause(.8)
+    s.delay_print2("There's no sound.\n")
+    s.pause(.8)
+    s.delay_print2("No movement.\n")
+    s.pause(.8)
+    s.delay_print2("Just the oppresive silence of the compound.")
+    s.pause(.4)
+    s.delay_print2(" For a moment, it felt like the world itself was holding its breath. ")
+    s.pause(.8)
+    s.delay_print2('\n\n')
+    s.print(speak["grayson_speak"])
+    s.delay_print2(italic_text(("(relieved, annoyed)\n")))
+    s.delay_print2('"Seriously,')
+    s.pause(.2)
+    s.delay_print2(" quit that.")
+    s.pause(.4)
+    s.delay_print2("What do you hear?")
+    s.pause(.4)
+    s.delay_print2(" A rat sneezing?")
+    s.pause(.4)
+    s.delay_print2(' You\'re going nuts."')
+    s.print("\n")
+
+    # -----------------------------------------------------------------------------
+
+    s.print(speak["graham_speak"])
+    s.delay_print2(italic_text("(snapping)\n"))
+    s.delay_print2("“I'm serious, Grayson. Something’s out there.”\n\n")
+    s.pause(2.5)
+
+    # Player Choice - How does Grayson respond?
+    choices = [
+        "DISMISSIVE",
+        "REASSURE",
+        "JOKE"
+    ]
+    selected = s.select(choices)
+
+    if selected == 0:  # DISMISSIVE
+        s.state["GrahamAnger"] += 2
+        s.delay_print2("He needs to calm down. You’ve seen it, he’s been walking around, eyes darting like everything’s out to get him.")
+        s.print("\n")
+        s.pause(0.8)
+        s.delay_print2(" Everything, including you.\n")
+        s.pause(1)
+        s.delay_print2("“Uh huh... It's probably just the wind playing tricks on your ears as usual.”\n\n")
+        s.pause(1.5)
+
+        s.print(speak["graham_speak"])
+        s.delay_print2(italic_text("(eyebrows furrowed)\n"))
+        s.delay_print2("“We’re in an abandoned building, investigating a report of something reanimated, whatever that even means, and you want to just be lax about it?”\n\n")
+        s.pause(1.5)
+
+    elif selected == 1:  # REASSURING
+        s.state["GrahamAnger"] -= 1
+        s.delay_print2("You get it, he's nervous, but if he keeps twitching like this at every creak, he’s seriously going to get us into some trouble.\n")
+        s.pause(1)
+        s.delay_print2("“Relax rookie, if something jumps out, I’ll just shoot it.”\n\n")
+        s.pause(1.5)
+
+        s.print(speak["graham_speak"])
+        s.delay_print2(italic_text("(sighs)\n"))
+        s.delay_print2("“I’m not very soothed with how lightly you’re taking this.”\n\n")
+        s.pause(1.5)
+
+    elif selected == 2:  # JOKE IT OFF
+        s.state["GrahamAnger"] += 1
+        s.delay_print2("He’s wound up way too tight. Someone needs to lighten the atmosphere and it doesn’t look like it’s going to be him anytime soon.\n")
+        s.pause(1)
+        s.delay_print2("“Place holder!!!!”\n\n")
+        s.pause(1.5)
+
+        s.print(speak["graham_speak"])
+        s.delay_print2(italic_text("(raising voice)\n"))
+        s.delay_print2("“I’m being serious.”\n\n")
+        s.pause(1.5)
+
+
+    # -----------------------------------------------------------------------------
+
+
+    # Switch to Graham's POV
+    s.print(povs["graham_pov"])
+    s.pause(2)
+
+    # Player Choice - How does Graham respond?
+    choices = [
+        "DEFENSIVE",
+        "CONFRONT",
+        "DROP IT"
+    ]
+    selected = s.select(choices)
+
+    if selected == 0:  # DEFENSIVE
+
+        s.delay_print2("You can see it in his eyes because you’ve seen it so often. He thinks you are crazy and paranoid.\n\n")
+        s.pause(2)
+        s.state["GraysonAnger"] += 1
+        s.print(speak["graham_speak"])
+        s.delay_print2("“Can you just stop dismissing everything I say?”\n\n")
+        s.pause(2.5)
+
+    elif selected == 1:  # CONFRONT
+        s.state["GraysonAnger"] += 2
+        s.print(speak["graham_speak"])
+        s.delay_print2("If he wants to risk his life, so be it, but you’re not letting some self-important man risk yours too.\n")
+        s.pause(0.8)
+        s.delay_print2("“If you keep taking things this lightly, you’re going to get us killed.”\n\n")
+        s.pause(1.5)
+
+    elif selected == 2:  # DROP IT
+        s.state["GraysonAnger"] -= 1
+        s.print(speak["graham_speak"])
+        s.delay_print2("Whatever. If he wants to keep risking things, that's his business.\n")
+        s.pause(0.8)
+        s.delay_print2("You narrow your eyes.\n")
+        s.pause(0.5)
+        s.delay_print2("“You better hope that you’re right.”\n\n")
+        s.pause(1.5)
+
+    # -----------------------------------------------------------------------------
+
+    # Switch to Grayson's POV
+    s.print(povs["grayson_pov"])
+
+    # Grayson's POV - How does Grayson respond?
+    choices = [
+        "BLUNT",
+        "DISMISSIVE",
+        "DROP IT"
+    ]
+    selected = s.select(choices)
+
+    if selected == 0:  # BLUNT
+        s.state["GrahamAnger"] += 2
+        s.print(speak["grayson_speak"])
+        s.delay_print2("He’s been doing nothing but slow you down this whole time, and you’ve been miraculously tolerant.\n")
+        s.pause(0.8)
+        s.delay_print2("Yet he thinks he can look down on and lecture you?\n")
+        s.pause(0.5)
+        s.delay_print2("“Maybe if you weren’t so paranoid all the time, we’d be fine.”\n\n")
+        s.pause(1.5)
+
+    elif selected == 1:  # DISMISSIVE
+        s.state["GrahamAnger"] += 1
+        s.print(speak["grayson_speak"])
+        s.delay_print2("He’s incompetent, paranoid, and whiny. The only thing you want most right now is for him to stop talking.\n")
+        s.pause(0.8)
+        s.delay_print2("“Yeah, yeah, whatever you say, damn rookie.”\n\n")
+        s.pause(1.5)
+
+    elif selected == 2:  # DROP IT
+        s.state["GrahamAnger"] -= 1
+        s.print(speak["grayson_speak"])
+        s.delay_print2("This is getting you nowhere. Every response you grant him is valuable energy you waste.\n")
+        s.pause(0.8)
+        s.delay_print2("Plus, he’s starting to give you a headache.\n")
+        s.pause(0.5)
+        s.delay_print2("“Forget about it rookie, we need to focus on our investigation.”\n\n")
+        s.pause(1.5)
+
+
+    # -----------------------------------------------------------------------------
+
+
+    # Graham's POV - How does Graham respond?
+    s.print(povs["graham_pov"])
+    choices = [
+        "CONFRONT",
+        "MUTTER OUT LOUD",
+        "MUTTER TO YOURSELF"
+    ]
+    selected = s.select(choices)
+
+    if selected == 0:  # CONFRONT
+        s.state["GraysonAnger"] += 2
+        s.print(speak["graham_speak"])
+        s.delay_print2("You don’t know if he has even listened to you once this whole time.\n")
+        s.pause(0.8)
+        s.delay_print2("“Why can’t you just think beyond yourself for once?”\n\n")
+        s.pause(1.5)
+
+    elif selected == 1:  # MUTTER OUT LOUD
+        s.state["GraysonAnger"] += 1
+        s.print(speak["graham_speak"])
+        s.delay_print2("He just won’t listen to you. He hasn’t, ever. You try to stop it but—\n")
+        s.pause(0.8)
+        s.delay_print2("“Pretentious prick.”\n")
+        s.pause(0.5)
+        s.delay_print2("Yup. That was loud.\n\n")
+        s.pause(1.5)
+
+    elif selected == 2:  # MUTTER TO YOURSELF
+        s.state["GraysonAnger"] -= 1
+        s.print(speak["graham_speak"])
+        s.delay_print2("Nothing you say will be productive. Still, you’re petty enough to want to say something, even if it is inaudible.\n")
+        s.pause(0.8)
+        s.delay_print2("“...Prick.”\n\n")
+        s.pause(1.5)
+
+
+    # -----------------------------------------------------------------------------
+
+    # Grayson responds
+    s.print(speak["grayson_speak"])
+    s.delay_print2("“Huh? Wanna repeat that again for me rookie?”\n\n")
+    s.pause(1.5)
+
+    s.print(speak["graham_speak"])
+    s.delay_print2("“You never listen to anyone. It’s always your way or nothing!”\n\n")
+    s.pause(1.5)
+
+    s.print(speak["grayson_speak"])
+    s.delay_print2("“Because hesitation gets people killed.”\n\n")
+    s.pause(1.5)
+
+    s.print(speak["graham_speak"])
+    s.delay_print2("“Sometimes, thinking things through saves lives.”\n\n")
+    s.pause(1.5)
+
+    s.print(speak["grayson_speak"])
+    s.delay_print2("“And sometimes—“")
+    s.print("\n")
+    s.pause(1.5)
+
+    # Sudden interruption
+    s.delay_print2("Suddenly, from the shadows, a grotesque figure lunges forward with a guttural snarl.\n")
+    s.pause(0.8)
+    s.delay_print2("Its pale, mottled skin stretches over a skeletal frame, and its glassy eyes lock onto its target.\n\n")
+    s.pause(2)
+
+    # -----------------------------------------------------------------------------
+    # Determining Who is Grabbed
+
+    if s.state["GrahamAnger"] > s.state["GraysonAnger"]:
+        grabbed = "GRAHAM"
+    elif s.state["GraysonAnger"] > s.state["GrahamAnger"]:
+        grabbed = "GRAYSON"
+    else:
+        grabbed = random.choice(["GRAHAM", "GRAYSON"])
+
+    # -----------------------------------------------------------------------------
+
+    # HANDLE OUTCOME BASED ON WHO IS GRABBED
+    if grabbed == "GRAHAM":
+        # GRAHAM IS GRABBED
+        s.print(povs["grayson_pov"])
+        s.delay_print2("Graham is caught off guard as the creature lunges at him, wrapping its claws around his arms, pulling him towards its gaping maw.\n\n")
+        s.pause(1.5)
+
+        if s.state["GraysonAnger"] >= 3:
+            # GRAYSON HESITATES
+            s.delay_print2("You hesitate.")
+            s.print("\n")
+            s.pause(1.5)
+
+            s.print(speak["graham_speak"])
+            s.delay_print2("“Don’t just stand there, help me!”")
+            s.print("\n")
+            s.pause(1.5)
+
+            s.delay_print2("You quickly snap out of it, and pull Graham to safety. However, Graham is scratched in the process.\n\n")
+            s.pause(1.5)
+            s.state["GrahamTrustInGrayson"] -= 3  # Adjust trust in Grayson's POV
+
+        else:
+            # GRAYSON ACTS IMMEDIATELY
+            s.delay_print2("Without thinking, you grab Graham by the arm and pull him back.\n")
+            s.pause(0.8)
+            s.delay_print2("The creature’s claws scrape the air where Graham was standing a second ago, its breath rancid, filling your nose with the stench of decay.\n\n")
+            s.pause(1.5)
+            s.state["GrahamTrustInGrayson"] += 3  # Adjust trust in Grayson's POV
+
+    # -----------------------------------------------------------------------------
+
+    elif grabbed == "GRAYSON":
+        # GRAYSON IS GRABBED
+        s.print(povs["graham_pov"])
+        s.delay_print2("Grayson is caught off guard as the creature lunges at him, wrapping its claws around his arms, pulling him towards its gaping maw.\n\n")
+        s.pause(1.5)
+
+        if s.state["GrahamAnger"] >= 3:
+            # GRAHAM HESITATES
+            s.delay_print2("You hesitate.\n\n")
+            s.pause(1.5)
+
+            s.print(speak["grayson_speak"])
+            s.delay_print2("“Well shit! Don’t just stand there, help me!”\n\n")
+            s.pause(1.5)
+
+            s.delay_print2("You quickly snap out of it, and pull Grayson to safety. However, Grayson is scratched in the process.\n\n")
+            s.pause(1.5)
+            s.state["GraysonTrustInGraham"] -= 3  # Adjust trust in Graham's POV
+
+        else:
+            # GRAHAM ACTS IMMEDIATELY
+            s.delay_print2("Without thinking, you grab Grayson by the arm and pull him back.\n")
+            s.pause(0.8)
+            s.delay_print2("The creature’s claws scrape the air where Grayson was standing a second ago, ")
+            s.pause(.5)
+            s.delay_print2("its breath rancid, ")
+            s.pause(.5) 
+            s.delay_print2("filling your nose with the stench of decay.")
+            s.print("\n")
+            s.pause(1.5)
+            s.state["GraysonTrustInGraham"] += 3  # Adjust trust in Graham's POV
+
+    # -----------------------------------------------------------------------------
+
+    # RETEAT
+    s.delay_print2("You shove him backwards, the two of you stumbling as you retreat down the hallway.\n")
+    s.pause(0.8)
+    s.delay_print2("The creature snarls again, ")
+    s.pause(.3)
+    s.delay_print2("its growl growing louder, ")
+    s.pause(.6)
+    s.delay_print2("angrier.")
+    s.pause(1.5)
+    s.print("\n")
+
+    s.print(speak["graham_speak"])
+    s.delay_print2(italic_text("(while running)"))
+    s.delay_print2("\n“What the hell was that?!”")
+    s.pause(1.5)
+    s.print("\n")
+
+    s.print(speak["grayson_speak"])
+    s.delay_print2(italic_text("(while running)"))
+    s.delay_print2("\n“Hell do I know, ")
+    s.pause(.3)
+    s.delay_print2("just focus on getting out of here first!”")
+    s.pause(1.5)
+    s.print("\n")
+
+    s.delay_print2("The hallway blurs past in streaks of concrete and rust, ")
+    s.pause(.4)
+    s.delay_print2("your shoes pounding over chipped tile.")
+    s.pause(1.5)
+    s.delay_print2("\nYou hear it before you see it. ")
+    s.pause(.3)
+    s.delay_print2("That gurgling, ")
+    s.pause(.3)
+    s.delay_print2("that wet rasp dragging through the halls.")
+    s.pause(2)
+    s.print("\n")
+
+    s.delay_print2("You and Graham round a corner.")
+    s.pause(1.5)
+    s.print("\n")
+
+    s.delay_print2("Behind you,")
+    s.pause(0.7)
+    s.delay_print2("\nFootsteps stop.")
+    s.pause(2)
+    s.print("\n")
+
+    s.delay_print2("You whip around.")
+    s.pause(2)
+    s.print("\n")
+
+    s.print(speak["grayson_speak"])
+    s.delay_print2("“…Svoboda!”")
+    s.pause(3)
+    s.print("\n")
+
+    s.delay_print2("He’s frozen, halfway down the corridor. Gun drawn. Both hands on it, like he actually knows what he’s doing.")
+    s.pause(2)
+    s.print("\n")
+
+    s.delay_print2("The thing stumbles into view in front of him.")
+    s.pause(1)
+    s.print("\n")
+
+    s.delay_print2("Your blood goes cold.")
+    s.pause(2)
+    s.print("\n")
+
+    s.print(speak["grayson_speak"])
+    s.delay_print2(italic_text("(shouting)"))
+    s.delay_print2("\n“Idiot!")
+    s.pause(.3)
+    s.delay_print2(" Do you even know how to use that?!”")
+    s.pause(1.5)
+    s.print("\n")
+
+    s.delay_print2("Then——")
+    s.pause(0.9)
+    s.print(italic_text("\nClick."))
+    s.pause(2.5)
+    s.print("\n")
+
+    s.delay_print2("Nothing.")
+    s.pause(2)
+    s.print("\n")
+
+    s.delay_print2("Goddammit.")
+    s.pause(1.5)
+    s.delay_print2("\nHis gun jammed.")
+    s.pause(4)
+    s.print("\n")
+
+    # [PLAYER CHOICE - What do you do?]
+    choices = [
+        "SHOOT THE WALKER",
+        "GRAB GRAHAM AND FLEE"
+    ]
+    selected = s.select(choices)
+
+    if selected == 0:  # SHOOT THE WALKER
+        s.delay_print2("There's no time to think. ")
+        s.pause(1)
+        s.delay_print2("You draw your pistol and fire—")
+        s.pause(1)
+        s.delay_print2("\nBang.")
+        s.pause(2)
+        s.print("\n")
+
+        s.delay_print2("The creature jerks back with a guttural screech. ")
+        s.pause(1)
+        s.delay_print2("It stumbles——")
+        s.pause(.7)
+        s.delay_print2("but doesn’t fall.")
+        s.pause(2)
+        s.print("\n")
+
+        s.print(speak["graham_speak"])
+        s.delay_print2("“Did you get it?!”")
+        s.pause(1.5)
+        s.print("\n")
+
+        s.print(speak["grayson_speak"])
+        s.delay_print2(italic_text("(gritted teeth)"))
+        s.delay_print2("\n“Not enough. ")
+        s.pause(.5)
+        s.delay_print2("Move, Svoboda!”")
+        s.pause(1.5)
+        s.print("\n")
+
+        s.delay_print2("It lunges again. ")
+        s.pause(1)
+        s.delay_print2("You fire twice more. ")
+        s.pause(1.5)
+        s.delay_print2("It crashes to the floor, twitching. ")
+        s.pause(2)
+        s.print("\n")
+
+        s.print(speak["graham_speak"])
+        s.delay_print2("“Holy crap, Grayson—”")
+        s.print("\n")
+
+        s.print(speak["grayson_speak"])
+        s.delay_print2("“Save the talk for later, ")
+        s.pause(.3) 
+        s.delay_print2("we need to get out of here first!”")
+        s.pause(1.5)
+        s.print("\n")
+
+    elif selected == 1:  # GRAB GRAHAM AND FLEE
+        s.delay_print2("You don’t think. ")
+        s.pause(.8)
+        s.delay_print2("You lunge forward, ")
+        s.pause(.5)
+        s.delay_print2("grab him by the collar, ")
+        s.pause(.3)
+        s.delay_print2("and pull.")
+        s.pause(1.5)
+        s.print("\n")
+
+        s.print(speak["grayson_speak"])
+        s.delay_print2("“Forget it——run!”")
+        s.pause(1.5)
+        s.print("\n")
+
+        s.delay_print2("The thing screeches. ")
+        s.pause(1)
+        s.delay_print2("You run harder.")
+        s.pause(1.5)
+        s.print("\n")
+
+        s.delay_print2("Graham’s frantic limbs cross over themselves and he nearly falls face first.")
+        s.pause(1.5)
+        s.delay_print2("\nYou throw your arm around him and drag him up to keep him running.")
+        s.pause(2)
+        s.print("\n")
+
+        s.delay_print2("Behind you, ")
+        s.pause(.3)
+        s.delay_print2("the abomination screams and bangs clumsily against walls, ")
+        s.pause(.5)
+        s.delay_print2("causing a constant strobe of sharp clangs like the beating of a drum.")
+        s.pause(2)
+        s.print("\n")
+
+    # Aftermath
+    s.delay_print2("The two of you burst through a half-collapsed doorway, ")
+    s.pause(.3)
+    s.delay_print2("slamming it shut behind you.")
+    s.pause(1.5)
+    s.delay_print2("\nYou can still hear your heartbeat, ")
+    s.pause(1)
+    s.delay_print2("like it's trying to punch its way out of your chest.")
+    s.pause(2)
+    s.print("\n")
+
+    s.delay_print2("Graham slumps to the floor, shaking.")
+    s.pause(1.5)
+    s.delay_print2("\nYou can’t even look at him right away.")
+    s.pause(1)
+    s.delay_print2(" our hands are still shaking.")
+    s.pause(1.5)
+    s.delay_print2("\nHe could’ve died.")
+    s.pause(1)
+    s.delay_print2(" You could’ve died.")
+    s.pause(1.5)
+    s.delay_print2("\nAnd worst of all——")
+    s.pause(0.8)
+    s.delay_print2("\nYou're not sure that next time, ") 
+    s.pause(.3)
+    s.delay_print2("either of you will be as lucky.")
+    s.pause(2)
+    s.print("\n")
+
+    # after the escape
+    s.print(speak["graham_speak"])
+    s.delay_print2(italic_text("(whispers)"))
+    s.pause(0.5)
+    s.delay_print2("\n“It wasn’t human…”")
+    s.pause(2)
+    s.print("\n")
+
+    s.print(speak["grayson_speak"])
+    s.delay_print2(italic_text("(pale, eyes unfocused)"))
+    s.pause(.5)
+    s.delay_print2("\n“No. ")
+    s.pause(.3)
+    s.delay_print2("It wasn’t.”")
+    s.pause(3)
+    s.print("\n")
+
+    s.delay_print2("A long pause. ")
+    s.pause(1.5)
+    s.delay_print2("The silence roars.")
+    s.pause(3)
+    s.print("\n")
+
+    s.print(speak["graham_speak"])
+    s.delay_print2(italic_text("(staring blankly)"))
+    s.pause(.5)
+    s.delay_print2("\n“It looked dead. ")
+    s.pause(1)
+    s.delay_print2("But it moved. ")
+    s.pause(1.5)
+    s.delay_print2("It watched me.”")
+    s.pause(2)
+    s.print("\n")
+
+    s.print(speak["grayson_speak"])
+    s.delay_print2(italic_text("(not denying it)"))
+    (.5)
+    s.delay_print2("\n“It shouldn’t be possible.”")
+    s.pause(3)
+    s.print("\n")
+
+    s.print(speak["graham_speak"])
+    s.delay_print2(italic_text("(voice cracking)"))
+    s.pause(.5)
+    s.delay_print1("\n“It misfired.”")
+    s.pause(2.5)
+    s.print("\n")
+
+    s.print(speak["grayson_speak"])
+    s.delay_print2(italic_text("(quietly)"))
+    s.pause(1)
+    s.delay_print1("\n“I know.”")
+    s.pause(4)
+    s.print("\n")
+
+    # EPILOGUE/ENDING SET UP
+    s.delay_print2("Among the filthy piles of refuse and the putrid smell of decay,")
+    s.pause(.5)
+    s.delay_print2("two men sat, ")
+    s.pause(.3)
+    s.delay_print2("as discarded and isolated as the rotting building around them.")
+
+    s.pause(1)
+    s.delay_print2("\nEach one knew it then, ")
+    s.pause(.5)
+    s.delay_print2("through some illogical stirring in their gut, ")
+    s.pause(.3)
+    s.delay_print2("a shared thought prevailed.")
+    s.print("\n")
+    s.pause(1)
+    s.delay_print2("The reprieve of silence protected their last peace, ")
+    s.pause(.3)
+    s.delay_print2("and the moment it ended,")
+    s.pause(.3)
+    s.delay_print2("the final breath of the life they once knew would fracture irrevocably.")
+    s.pause(1)
+    s.delay_print2("\nSo for fear of abandoning the comfortable and known, ")
+    s.pause(.5)
+    s.delay_print2("neither one spoke.")
+
+    s.pause(1)
+    s.delay_print2("\nBut the silence could not last forever, ")
+    s.pause(.3)
+    s.delay_print2("and eventually, ")
+    s.pause(.3)
+    s.delay_print2("the truth of the situation would need to be confronted.")
+    s.pause(1.5)
+    s.print("\n")
+
+    s.delay_print2('"But not now, ')
+    s.pause(0.3)
+    s.delay_print2('not for a few more minutes,"')
+    s.delay_print2("\nthey both thought.")
+    s.pause(8)
+    s.clear()
+    s.pause(1)
+    s.delay_print("...")
+    s.pause(1)
+    s.clear()
+    s.delay_print1(bold_text("TO BE CONTINUED..."))
+
+
+# -----------------------------------------------------------------------------
+
+
+# Every scene in playing order
+SCENES = [
+    ("Intro", intro),
+    ("Character Selection", choose_characters),
+    ("Scene 0A: Morning Routine", scene_0a),
+    ("Scene 0B: Morning Routine", scene_0b),
+    ("Scene 1A: Office Arrival", scene_1a),
+    ("Scene 1B: Office Hell", scene_1b),
+    ("Scene 2: The Briefing Room", scene_2),
+    ("Scene 3A: The Departure", scene_3a),
+    ("Scene 3B: En Route", scene_3b),
+    ("SCENE 4: Site 14", scene_4),
+    ("SCENE 5A", scene_5a),
+    ("SCENE 5B", scene_5b),
+    ("Scene: Exploring the Building", exploring_the_building),
+    ("SCENE 5C", scene_5c),
+]
@@ -0,0 +1,270 @@
+# Story Compiler
+# Turns the scene functions in story.py into a scene graph by reading
+# their source. Scenes that read input or use loops (the intro and
+# character selection) can't be turned into nodes; they stay as NATIVE
+# nodes that call the scene function itself. A NATIVE scene can't touch
+# the game state (it is immutable) or make choices (the tools that walk
+# the graph only see nodes), so one that does is a build error.
+
+import ast
+import inspect
+
+import story as story_module
+from engine import Session
+from scenegraph import (ADD, BRANCH, CHOICE, CLEAR, END, JUMP, LET, NATIVE, PAUSE,
+                        PRINT, RANDOM, SCENE, SET, TEXT, SceneGraph)
+
+
+# -----------------------------------------------------------------------------
+
+
+COMPARE = {
+    ast.Eq: "==", ast.NotEq: "!=", ast.Lt: "<", ast.LtE: "<=",
+    ast.Gt: ">", ast.GtE: ">=",
+}
+TYPEWRITERS = ("delay_print", "delay_print1", "delay_print2", "delay_print3")
+
+
+class CompileError(Exception):
+    """A scene uses something the graph has no node for."""
+
+
+# -----------------------------------------------------------------------------
+
+
+def compile_story(module=story_module):
+    """Compile module.SCENES into a SceneGraph."""
+    # Default per-character delay of each delay_print variant
+    delays = {name: inspect.signature(getattr(Session, name)).parameters["delay"].default
+              for name in TYPEWRITERS}
+    tree = ast.parse(inspect.getsource(module))
+    functions = {node.name: node for node in tree.body if isinstance(node, ast.FunctionDef)}
+    nodes = []
+    scenes = []
+    for title, function in module.SCENES:
+        scenes.append((title, len(nodes)))
+        nodes.append((SCENE, title))
+        compiler = _SceneCompiler(module, delays)
+        try:
+            compiler.block(functions[function.__name__].body)
+        except CompileError as error:
+            used = _graph_only(functions[function.__name__])
+            if used is not None:
+                line = str(error).splitlines()[0]
+                raise CompileError(f"{function.__name__}: can't compile {line}, and can't "
+                                   f"run it as code either: it uses {used}") from None
+            nodes.append((NATIVE, function.__name__))
+        else:
+            start = len(nodes)
+            # Jump targets are relative to the scene until it is placed
+            nodes.extend(_relocate(node, start) for node in compiler.nodes)
+    nodes.append((END,))
+    return SceneGraph(nodes, scenes, module)
+
+
+def _relocate(node, offset):
+    if node[0] == JUMP:
+        return (JUMP, node[1] + offset)
+    if node[0] == BRANCH:
+        return (BRANCH, node[1], node[2] + offset)
+    return node
+
+
+class _SceneCompiler:
+    """Turns the body of one scene function into nodes."""
+
+    def __init__(self, module, delays):
+        self.module = module
+        self.delays = delays
+        self.nodes = []
+        self.constants = {}  # local names bound to constants, like `choices`
+        self.variables = set()  # local names the graph keeps at run time
+        self.joinable = False  # whether a pause may join the TEXT node before it
+        self.depth = 0  # how many if statements we are inside
+
+    def block(self, statements):
+        """Compile a list of statements."""
+        for statement in statements:
+            self.statement(statement)
+
+    def statement(self, node):
+        if isinstance(node, ast.Pass):
+            return
+        if isinstance(node, ast.Expr):
+            value = node.value
+            if isinstance(value, ast.Tuple):  # s.delay_print2(...), s.pause(...)
+                for item in value.elts:
+                    self.call(item)
+            elif isinstance(value, ast.Constant):  # a stray (.5) does nothing
+                return
+            else:
+                self.call(value)
+        elif isinstance(node, ast.Assign) and len(node.targets) == 1:
+            self.assign(node.targets[0], node.value)
+        elif isinstance(node, ast.AugAssign):
+            self.augassign(node)
+        elif isinstance(node, ast.If):
+            self.conditional(node)
+        else:
+            raise CompileError(ast.unparse(node))
+
+    def call(self, node):
+        name = _session_method(node)
+        if name in self.delays:
+            delay = self.delays[name]
+            if len(node.args) > 1:
+                delay = self.fold(node.args[1])
+            for keyword in node.keywords:
+                if keyword.arg != "delay":
+                    raise CompileError(ast.unparse(node))
+                delay = self.fold(keyword.value)
+            self.nodes.append((TEXT, str(self.fold(node.args[0])), delay, 0))
+        elif name == "pause":
+            seconds = self.fold(node.args[0])
+            last = self.nodes[-1] if self.nodes else None
+            if last is not None and last[0] == TEXT and last[3] == 0 and self.joinable:
+                self.nodes[-1] = last[:3] + (seconds,)
+            else:
+                self.nodes.append((PAUSE, seconds))
+        elif name == "print":
+            options = {keyword.arg: self.fold(keyword.value) for keyword in node.keywords}
+            if set(options) - {"sep", "end"}:
+                raise CompileError(ast.unparse(node))
+            sep, end = options.get("sep", " "), options.get("end", "\n")
+            text = sep.join(str(self.fold(arg)) for arg in node.args)
+            self.nodes.append((PRINT, text + end))
+        elif name == "clear" and not node.args:
+            self.nodes.append((CLEAR,))
+        else:
+            raise CompileError(ast.unparse(node))
+        self.joinable = True
+
+    def assign(self, target, value):
+        key = _state_key(target)
+        if key is not None:
+            self.nodes.append((SET, key, self.fold(value)))
+        elif isinstance(target, ast.Name):
+            name = target.id
+            if _session_method(value) == "select":
+                self.variables.add(name)
+                self.nodes.append((CHOICE, name, tuple(self.fold(value.args[0]))))
+            elif _is_random_choice(value):
+                self.variables.add(name)
+                self.nodes.append((RANDOM, name, tuple(self.fold(value.args[0]))))
+            elif name in self.variables or self.depth:
+                # Set on only some paths, so it has to be looked up at run time
+                self.nodes.append((LET, name, self.fold(value)))
+                self.variables.add(name)
+                self.constants.pop(name, None)
+            else:
+                self.constants[name] = self.fold(value)
+                return
+        else:
+            raise CompileError(ast.unparse(target))
+        self.joinable = False
+
+    def augassign(self, node):
+        key = _state_key(node.target)
+        amount = self.fold(node.value)
+        if key is None or not isinstance(node.op, (ast.Add, ast.Sub)):
+            raise CompileError(ast.unparse(node))
+        self.nodes.append((ADD, key, amount if isinstance(node.op, ast.Add) else -amount))
+        self.joinable = False
+
+    def conditional(self, node):
+        # if/elif/else: each test branches past its body, each body jumps to the end
+        exits = []
+        self.depth += 1
+        while True:
+            branch = len(self.nodes)
+            self.nodes.append(None)  # filled in once the body's length is known
+            self.joinable = False
+            self.block(node.body)
+            self.nodes[branch] = (BRANCH, self.condition(node.test), len(self.nodes) + 1)
+            exits.append(len(self.nodes))
+            self.nodes.append(None)
+            orelse = node.orelse
+            if len(orelse) == 1 and isinstance(orelse[0], ast.If):
+                node = orelse[0]
+                continue
+            self.joinable = False
+            self.block(orelse)
+            break
+        end = len(self.nodes)
+        if not orelse:
+            # Nothing after the last body: its exit jump can go
+            self.nodes.pop()
+            exits.pop()
+            end -= 1
+            last = self.nodes[branch]
+            self.nodes[branch] = last[:2] + (end,)
+        for exit in exits:
+            self.nodes[exit] = (JUMP, end)
+        self.depth -= 1
+        self.joinable = False
+
+    def condition(self, node):
+        """Compile an if test."""
+        if isinstance(node, ast.BoolOp):
+            op = "and" if isinstance(node.op, ast.And) else "or"
+            return (op,) + tuple(self.condition(value) for value in node.values)
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            return ("not", self.condition(node.operand))
+        if (isinstance(node, ast.Compare) and len(node.ops) == 1
+                and type(node.ops[0]) in COMPARE):
+            return (COMPARE[type(node.ops[0])], self.operand(node.left),
+                    self.operand(node.comparators[0]))
+        raise CompileError(ast.unparse(node))
+
+    def operand(self, node):
+        key = _state_key(node)
+        if key is not None:
+            return ("state", key)
+        if isinstance(node, ast.Name) and node.id in self.variables:
+            return ("var", node.id)
+        return ("const", self.fold(node))
+
+    def fold(self, node):
+        """Evaluate an expression that doesn't depend on the session."""
+        for child in ast.walk(node):
+            if isinstance(child, ast.Name):
+                if child.id in self.constants:
+                    continue
+                if child.id == "s" or child.id in self.variables or not hasattr(self.module, child.id):
+                    raise CompileError(ast.unparse(node))
+        namespace = dict(vars(self.module), **self.constants)
+        return eval(compile(ast.Expression(node), "<story>", "eval"), namespace)
+
+
+def _session_method(node):
+    """'delay_print2' for s.delay_print2(...), else None."""
+    if (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+            and isinstance(node.func.value, ast.Name) and node.func.value.id == "s"):
+        return node.func.attr
+    return None
+
+
+def _state_key(node):
+    """'Late' for s.state["Late"], else None."""
+    if (isinstance(node, ast.Subscript) and isinstance(node.value, ast.Attribute)
+            and node.value.attr == "state" and isinstance(node.value.value, ast.Name)
+            and node.value.value.id == "s" and isinstance(node.slice, ast.Constant)):
+        return node.slice.value
+    return None
+
+
+def _graph_only(function):
+    """The first thing in a scene function that only works as nodes
+    (s.state, s.select, random.choice), as source; None if there is none."""
+    for node in ast.walk(function):
+        state = (isinstance(node, ast.Attribute) and node.attr == "state"
+                 and isinstance(node.value, ast.Name) and node.value.id == "s")
+        if state or _session_method(node) == "select" or _is_random_choice(node):
+            return ast.unparse(node)
+    return None
+
+
+def _is_random_choice(node):
+    return (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+            and isinstance(node.func.value, ast.Name) and node.func.value.id == "random"
+            and node.func.attr == "choice")
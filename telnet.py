@@ -0,0 +1,14 @@
+# Telnet
+# The telnet commands server.py and client.py speak, and our own option.
+
+PORT = 2323  # where server.py listens unless told otherwise
+
+IAC, SB, SE, WILL, DO, DONT = 255, 250, 240, 251, 253, 254
+
+# Our own telnet option (an unassigned number). After IAC DO PACING from
+# the client, a run of text is sent as
+#     IAC SB PACING <delay> <pause> LF <text> IAC SE
+# delay (between characters) and pause (after the run) being seconds in
+# ASCII, and text the run as it would be typed out. It can't hold an IAC:
+# 255 never occurs in UTF-8.
+PACING = 200
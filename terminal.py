@@ -0,0 +1,98 @@
+# Terminal Session
+# Puts the terminal into cbreak mode once for a whole menu (or game) instead
+# of around every keypress, and always puts it back, even on a signal.
+
+import atexit
+import os
+import signal
+import sys
+
+if os.name == 'nt':  # Windows consoles need no mode switch for msvcrt
+    termios = tty = None
+else:
+    import termios
+    import tty
+
+# Sessions currently holding the terminal, restored on exit or signal
+_active = set()
+_handlers_installed = False
+
+
+class TerminalSession:
+    """Hold a terminal in cbreak mode while the session is entered.
+
+    Sessions nest: only the outermost enter/exit touches the terminal.
+    On anything that is not a TTY (pipes, files, Windows) it does nothing.
+    """
+
+    def __init__(self, fd=None):
+        self.fd = fd
+        self.depth = 0
+        self.saved = None  # termios attributes to restore
+
+    def __enter__(self):
+        self.depth += 1
+        if self.depth == 1:
+            self.enter()
+        return self
+
+    def __exit__(self, *exc):
+        self.depth -= 1
+        if self.depth == 0:
+            self.restore()
+
+    def enter(self):
+        """Switch to cbreak mode: keys arrive unbuffered, output unchanged."""
+        if termios is None:
+            return
+        fd = sys.stdin.fileno() if self.fd is None else self.fd
+        if not os.isatty(fd):
+            return
+        _install_handlers()
+        self.fd = fd
+        self.saved = termios.tcgetattr(fd)
+        # TCSANOW: don't wait for pending typewriter output to drain
+        tty.setcbreak(fd, termios.TCSANOW)
+        _active.add(self)
+
+    def discard_input(self):
+        """Throw away keys typed before now (while the story was typing),
+        as the switch to raw mode used to."""
+        if self.saved is not None:
+            termios.tcflush(self.fd, termios.TCIFLUSH)
+
+    def restore(self):
+        """Put the terminal back the way we found it."""
+        if self.saved is None:
+            return
+        termios.tcsetattr(self.fd, termios.TCSANOW, self.saved)
+        self.saved = None
+        _active.discard(self)
+
+
+def restore_all():
+    """Restore every terminal a session still holds."""
+    for session in list(_active):
+        session.restore()
+
+
+def _on_signal(signum, frame):
+    restore_all()
+    # Fall back to the default action so the process still dies as asked
+    signal.signal(signum, signal.SIG_DFL)
+    os.kill(os.getpid(), signum)
+
+
+def _install_handlers():
+    global _handlers_installed
+    if _handlers_installed:
+        return
+    _handlers_installed = True
+    atexit.register(restore_all)
+    for name in ("SIGTERM", "SIGHUP"):
+        signum = getattr(signal, name, None)
+        if signum is not None and signal.getsignal(signum) == signal.SIG_DFL:
+            try:
+                signal.signal(signum, _on_signal)
+            except ValueError:  # not the main thread
+                pass
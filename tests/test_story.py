@@ -0,0 +1,160 @@
+# Story Tests
+# A fixed seed and fixed answers must play the story out exactly as the
+# stored transcript, and going back a choice or resuming a checkpoint
+# must end in the same state as playing straight through. Plus the
+# pieces those rest on: key parsing, the timer wheel and the graph cache.
+#
+# The transcript is what the headless game prints; after a change to the
+# story's text, write it again with
+#   python 1_koylynn.py --headless --seed 7 --names Ada Bo --characters 2 1 \
+#       --choices 0 1 0 1 0 1 0 0 1 1 0 1 0 0 1 > tests/transcript.txt
+#
+# Usage: python -m unittest discover tests   (or pytest)
+
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import checkpoint
+import scenegraph
+from engine import REWIND, Session, play
+from headless import ScriptedPlayer
+from keys import DOWN, ENTER, ESCAPE, UP, KeyParser
+from scenegraph import load_story
+from story import game_state
+from storycompiler import compile_story
+from timerwheel import TimerWheel
+
+SEED = 7
+LINES = ["Ada", "Bo", "2", "1"]  # names, then characters
+CHOICES = [0, 1, 0, 1, 0, 1, 0, 0, 1, 1, 0, 1, 0, 0, 1]  # takes the grab tie-break
+TRANSCRIPT = os.path.join(ROOT, "tests", "transcript.txt")
+
+
+class Recorder:
+    """Stands in for a Checkpointer; keeps every snapshot it is given."""
+
+    def __init__(self):
+        self.snapshots = []
+
+    def save(self, snapshot):
+        self.snapshots.append(snapshot)
+
+
+def playthrough(choices=CHOICES, seed=SEED, checkpoints=None):
+    """A headless session played to the end, and what it printed."""
+    out = io.StringIO()
+    session = Session(game_state, out=out, player=ScriptedPlayer(LINES, choices),
+                      seed=seed, checkpoints=checkpoints)
+    play(session, load_story())
+    return session, out.getvalue()
+
+
+class StoryTest(unittest.TestCase):
+
+    def test_transcript(self):
+        session, printed = playthrough()
+        with open(TRANSCRIPT) as f:
+            self.assertEqual(printed, f.read())
+        self.assertEqual(session.choices_made, len(CHOICES))
+        self.assertEqual(session.draws, 1)
+
+    def test_rewind(self):
+        straight, _ = playthrough()
+        # Third menu: go back to the second and answer it the same way again
+        rewound, _ = playthrough(CHOICES[:2] + [REWIND] + CHOICES[1:])
+        self.assertEqual(rewound.state, straight.state)
+        self.assertEqual(rewound.choices_made, straight.choices_made)
+        self.assertEqual(rewound.draws, straight.draws)
+
+    def test_checkpoint(self):
+        recorder = Recorder()
+        straight, _ = playthrough(checkpoints=recorder)
+        for menu in (0, 7, len(CHOICES) - 1):
+            snapshot = recorder.snapshots[menu]
+            saved = checkpoint.loads(checkpoint.dumps(snapshot))
+            self.assertEqual(saved[2], dict(snapshot[2].items()))
+            # Resumed in a fresh session with another seed: the saved one wins
+            session = Session(game_state, out=io.StringIO(), seed=SEED + 1,
+                              player=ScriptedPlayer(choices=CHOICES[menu:]))
+            graph = load_story()
+            play(session, graph, checkpoint.resume(session, graph, saved))
+            self.assertEqual(session.state, straight.state)
+            self.assertEqual(session.choices_made, straight.choices_made)
+            self.assertEqual((session.seed, session.draws), (straight.seed, straight.draws))
+
+    def test_bad_checkpoint(self):
+        recorder = Recorder()
+        playthrough(checkpoints=recorder)
+        data = checkpoint.dumps(recorder.snapshots[0])
+        for bad in (b"", b"NSCP", data[:-3], b"XXXX" + data[4:]):
+            with self.assertRaises(ValueError):
+                checkpoint.loads(bad)
+        saved = checkpoint.loads(data)
+        saved[2]["NoSuchKey"] = 1  # game state the story no longer has
+        session = Session(game_state, out=io.StringIO(), player=ScriptedPlayer())
+        with self.assertRaises(ValueError):
+            checkpoint.resume(session, load_story(), saved)
+
+
+class KeyParserTest(unittest.TestCase):
+
+    def test_keys(self):
+        parser = KeyParser()
+        self.assertEqual(parser.feed(b"a\x1b[Bb\r\n"), ["a", DOWN, "b", ENTER])
+        self.assertEqual(parser.feed(b"\x1bOA\r"), [UP, ENTER])
+
+    def test_split(self):
+        parser = KeyParser()
+        self.assertEqual(parser.feed(b"\x1b["), [])
+        self.assertTrue(parser.pending)
+        self.assertEqual(parser.feed(b"A\xc3"), [UP])
+        self.assertEqual(parser.feed(b"\xa9"), ["é"])
+        self.assertFalse(parser.pending)
+
+    def test_lone_escape(self):
+        parser = KeyParser()
+        self.assertEqual(parser.feed(b"\x1b"), [])
+        self.assertEqual(parser.flush(), [ESCAPE])
+
+
+class TimerWheelTest(unittest.TestCase):
+
+    def test_order(self):
+        wheel = TimerWheel(tick=0.25)  # exact in binary, so the ticks are too
+        for when, item in ((0.5, "b"), (0.1, "a"), (100.0, "d"), (2.0, "c")):
+            wheel.add(when, item)
+        self.assertEqual(len(wheel), 4)
+        self.assertEqual(wheel.expire(wheel.tick_of(0.5)), ["a", "b"])
+        self.assertEqual(wheel.expire(wheel.tick_of(1.9)), [])  # never early
+        self.assertEqual(wheel.expire(wheel.next_tick()), ["c"])
+        expired = []
+        while not expired:  # far ahead: it cascades down the levels on the way
+            tick = wheel.next_tick()
+            expired = wheel.expire(tick)
+        self.assertEqual((expired, tick), (["d"], 400))
+        self.assertIsNone(wheel.next_tick())
+
+
+class GraphCacheTest(unittest.TestCase):
+
+    def test_cache(self):
+        graph = compile_story()
+        self.assertEqual(load_story().nodes, graph.nodes)
+        header = scenegraph.cache_header()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "story.graph")
+            scenegraph._write_cache(path, header, graph)
+            cached = scenegraph._read_cache(path, header, graph.module)
+            self.assertEqual((cached.nodes, cached.scenes), (graph.nodes, graph.scenes))
+            # Another version's cache (or changed sources) is compiled again
+            self.assertIsNone(scenegraph._read_cache(path, header[:-1] + b"?", graph.module))
+
+
+if __name__ == "__main__":
+    unittest.main()
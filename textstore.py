@@ -0,0 +1,88 @@
+# Text Store
+# The story's text, kept once for all of the server's worker processes.
+# Every TEXT and PRINT string in the scene graph is encoded the way the
+# server sends it (UTF-8, CRLF line ends) into one block of shared memory,
+# with an index of the byte each character starts at. The server plays a
+# copy of the graph that holds StoredText handles in place of the strings
+# and sends memoryviews of the block.
+#
+# The block is mapped before the workers are forked and never written
+# after, so they all read the same pages. Text kept as str objects would
+# be copied into each worker bit by bit instead, as showing it touches the
+# objects' reference counts.
+
+import mmap
+from array import array
+
+from scenegraph import PRINT, TEXT, SceneGraph
+
+
+class TextStore:
+    """Texts encoded into one shared block."""
+
+    def __init__(self, texts):
+        starts = array("I")  # per text, where its characters start in bounds
+        bounds = array("I")  # per character, its first byte in the wire text
+        wire = bytearray()
+        for text in texts:
+            starts.append(len(bounds))
+            for ch in text:
+                bounds.append(len(wire))
+                wire += b"\r\n" if ch == "\n" else ch.encode()
+            bounds.append(len(wire))  # where the text ends
+        starts.append(len(bounds))
+
+        # One anonymous mapping: shared with the processes forked after this
+        self.block = mmap.mmap(-1, (len(starts) + len(bounds)) * 4 + len(wire))
+        self.block.write(starts.tobytes() + bounds.tobytes() + wire)
+        view = memoryview(self.block).toreadonly()
+        middle = len(starts) * 4
+        end = middle + len(bounds) * 4
+        self.starts = view[:middle].cast("I")
+        self.bounds = view[middle:end].cast("I")
+        self.wire = view[end:]
+
+    def __len__(self):
+        return len(self.starts) - 1
+
+
+class StoredText:
+    """A text in a TextStore, standing in for a str in the server's graph.
+    Its length is in characters, as for the str; a slice of it is the
+    encoded bytes of those characters, ready to send."""
+
+    __slots__ = ("store", "index")
+
+    def __init__(self, store, index):
+        self.store = store
+        self.index = index
+
+    def __len__(self):
+        starts = self.store.starts
+        return starts[self.index + 1] - starts[self.index] - 1
+
+    def __getitem__(self, span):
+        i, j, _ = span.indices(len(self))
+        store = self.store
+        first = store.starts[self.index]
+        return store.wire[store.bounds[first + i]:store.bounds[first + j]]
+
+    def __str__(self):
+        return str(self[:], "utf-8").replace("\r\n", "\n")
+
+
+def share(graph):
+    """A copy of graph whose TEXT and PRINT nodes hold StoredTexts, all in
+    one new TextStore."""
+    texts = {}  # text -> its index; a text that comes up twice is stored once
+    for node in graph.nodes:
+        if node[0] == TEXT or node[0] == PRINT:
+            texts.setdefault(node[1], len(texts))
+    store = TextStore(texts)
+    handles = {text: StoredText(store, index) for text, index in texts.items()}
+    # Every node is made anew, as close together as the allocator puts
+    # them, so playing the graph touches fewer pages than the old nodes
+    # were spread over
+    nodes = [(node[0], handles[node[1]]) + node[2:] if node[0] == TEXT or node[0] == PRINT
+             else (node[0],) + node[1:] for node in graph.nodes]
+    return SceneGraph(nodes, graph.scenes, graph.module)
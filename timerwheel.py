@@ -0,0 +1,128 @@
+# Timer Wheel
+# Keeps the pacing waits of every session on the server: each typewriter
+# frame and scripted pause is a timer. A timer goes into the slot of the
+# tick it is due in, so adding one is O(1), and everything due in a tick
+# comes out of its slot at once: one wakeup for all the sessions whose
+# frames end in it, however many there are.
+#
+# The wheel is hierarchical: level 0 has a slot per tick, and each level
+# above covers SLOTS times the span of the one below. Timers due further
+# ahead wait in a coarse slot and move down ("cascade") when the ticks
+# reach it. Timers are never early and at most one tick late.
+
+TICK = 1 / 60  # seconds; a typewriter frame (see typewriter.FRAME)
+SLOT_BITS = 6
+SLOTS = 1 << SLOT_BITS  # slots per level
+MASK = SLOTS - 1
+LEVELS = 4  # SLOTS ** LEVELS ticks ahead: over three days at 60 Hz
+
+
+class TimerWheel:
+    """Items waiting for a time, taken out a tick at a time."""
+
+    def __init__(self, tick=TICK, now=0.0):
+        self.tick = tick
+        self.current = self.tick_of(now)  # the next tick to expire
+        self.levels = [[[] for _ in range(SLOTS)] for _ in range(LEVELS)]
+        self.occupied = [0] * LEVELS  # per level, bit i set: slot i has timers
+        self.later = []  # due beyond the top level; placed again as it turns
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def tick_of(self, t):
+        """The tick running at time t."""
+        return int(t / self.tick)
+
+    def add(self, when, item):
+        """Expire item at the first tick at or after time `when`."""
+        due = -int(-when // self.tick)  # rounded up: never early
+        self._place(max(due, self.current), item)
+        self.count += 1
+
+    def _place(self, due, item):
+        # The lowest level whose slots tell due from the current tick: the
+        # one holding the highest bit they differ in
+        level = (((due ^ self.current) | 1).bit_length() - 1) // SLOT_BITS
+        if level >= LEVELS:
+            self.later.append((due, item))
+            return
+        shift = SLOT_BITS * level
+        index = (due >> shift) & MASK
+        self.levels[level][index].append((due, item))
+        self.occupied[level] |= 1 << index
+
+    def expire(self, upto):
+        """Take out every item due by tick `upto`, in the order they fall due."""
+        expired = []
+        while self.count:
+            tick = self._next(self.current)
+            if tick > upto:
+                break
+            self.current = tick
+            if not tick & MASK:
+                self._cascade(tick)
+            index = tick & MASK
+            if self.occupied[0] >> index & 1:
+                slot = self.levels[0][index]
+                expired.extend(item for _, item in slot)
+                self.count -= len(slot)
+                slot.clear()
+                self.occupied[0] &= ~(1 << index)
+            self.current = tick + 1
+        self.current = max(self.current, upto + 1)
+        return expired
+
+    def _cascade(self, tick):
+        # At the start of a level's span, its timers move to the levels below;
+        # the top level's turn picks up the ones waiting beyond it
+        if not tick & ((1 << (SLOT_BITS * LEVELS)) - 1):
+            later, self.later = self.later, []
+            for due, item in later:
+                self._place(due, item)
+        for level in range(LEVELS - 1, 0, -1):
+            shift = SLOT_BITS * level
+            if tick & ((1 << shift) - 1):
+                continue  # not the start of this level's span
+            index = (tick >> shift) & MASK
+            if self.occupied[level] >> index & 1:
+                slot = self.levels[level][index]
+                moving = slot[:]
+                slot.clear()
+                self.occupied[level] &= ~(1 << index)
+                for due, item in moving:
+                    self._place(due, item)
+
+    def _cascades(self, tick):
+        # Whether _cascade(tick) has timers to move
+        for level in range(1, LEVELS):
+            shift = SLOT_BITS * level
+            if tick & ((1 << shift) - 1):
+                return False
+            if self.occupied[level] >> ((tick >> shift) & MASK) & 1:
+                return True
+        return bool(self.later) and not tick & ((1 << (SLOT_BITS * LEVELS)) - 1)
+
+    def _next(self, tick):
+        # The first tick from `tick` on with timers to expire or move down
+        if not tick & MASK and self._cascades(tick):
+            return tick
+        ahead = self.occupied[0] >> (tick & MASK)
+        if ahead:
+            return tick + (ahead & -ahead).bit_length() - 1
+        for level in range(1, LEVELS):
+            shift = SLOT_BITS * level
+            index = (tick >> shift) & MASK
+            if tick & ((1 << shift) - 1):
+                index += 1  # this slot has moved down already
+            ahead = self.occupied[level] >> index
+            if ahead:
+                index += (ahead & -ahead).bit_length() - 1
+                return (tick >> (shift + SLOT_BITS) << (shift + SLOT_BITS)) | (index << shift)
+        span = SLOT_BITS * LEVELS
+        return ((tick >> span) + 1) << span  # the top level's turn
+
+    def next_tick(self):
+        """The next tick expire() has work at, or None when the wheel is empty."""
+        return self._next(self.current) if self.count else None
@@ -0,0 +1,192 @@
+# Reading Time
+# The scripted length of every scene and of the whole story over every
+# path, worked out from the scene graph without playing it: a typewriter
+# run takes its length times its per-character delay, then its pause;
+# pauses take their seconds; a menu adds the "You chose" screen after it.
+# Time spent waiting on the players isn't scripted, so it isn't counted.
+#
+# Paths are merged as in explore.py (scenegraph.Paths). How long a path
+# took never changes where it can go next, so merged paths keep just the
+# count, sum, shortest and longest of their times.
+#
+# The NATIVE scenes (intro, character selection) and the menus' closing
+# screen are timed by running them once on a virtual clock with scripted
+# answers, so the player names change the result a little.
+#
+# Usage: python timing.py [--names A B] [--characters 1 2]
+
+import argparse
+import os
+import time
+
+from engine import Session
+from headless import ScriptedPlayer
+from scenegraph import CHOICE, END, NATIVE, PAUSE, RANDOM, SCENE, TEXT, Paths, assign, load_story
+from story import game_state
+
+
+class Span:
+    """Scripted seconds over a group of merged paths."""
+
+    def __init__(self, count, total, shortest, longest, fastest=(), slowest=()):
+        self.count = count  # paths in the group
+        self.total = total  # their seconds added up
+        self.shortest = shortest
+        self.longest = longest
+        self.fastest = fastest  # choices of one shortest path
+        self.slowest = slowest  # and one longest
+
+    def later(self, seconds, choice=None):
+        """The same paths, seconds on (after taking choice, if given)."""
+        taken = () if choice is None else (choice,)
+        return Span(self.count, self.total + self.count * seconds, self.shortest + seconds,
+                    self.longest + seconds, self.fastest + taken, self.slowest + taken)
+
+    def merge(self, other):
+        """Take in another group's paths."""
+        self.count += other.count
+        self.total += other.total
+        if other.shortest < self.shortest:
+            self.shortest, self.fastest = other.shortest, other.fastest
+        if other.longest > self.longest:
+            self.longest, self.slowest = other.longest, other.slowest
+
+    @property
+    def mean(self):
+        return self.total / self.count
+
+
+class TimedPaths(Paths):
+    """Paths whose groups are [story Span, scene Span], moved on by the
+    seconds of the output nodes they pass on the way to a node."""
+
+    def __init__(self, graph, runs):
+        super().__init__(graph, _merge_spans)
+        self.runs = runs  # seconds from node i up to skip[i]
+
+    def arrive(self, i, state, variables, spans):
+        run = self.runs[i]
+        super().arrive(i, state, variables, [spans[0].later(run), spans[1].later(run)])
+
+
+def _merge_spans(spans, other):
+    spans[0].merge(other[0])
+    spans[1].merge(other[1])
+    return spans
+
+
+def measure(graph, names=("Player 1", "Player 2"), characters=("1", "2")):
+    """Seconds of every node that doesn't depend on the path taken, and of
+    the closing screen of each menu option, by (node index, option)."""
+    seconds = [0.0] * len(graph.nodes)
+    chosen = {}
+    with open(os.devnull, "w") as out:
+        player = ScriptedPlayer(list(names) + list(characters))
+        session = Session(game_state, out=out, player=player, seed=0)
+        clock = session.clock
+        for i, node in enumerate(graph.nodes):
+            kind = node[0]
+            if kind == TEXT:
+                seconds[i] = len(node[1]) * node[2] + node[3]
+            elif kind == PAUSE:
+                seconds[i] = node[1]
+            elif kind == NATIVE:
+                started = clock.t
+                graph.native(node[1])(session)
+                seconds[i] = clock.t - started
+            elif kind == CHOICE:
+                for option in range(len(node[2])):
+                    player.choices = [option]
+                    started = clock.t
+                    session.select(node[2])
+                    chosen[(i, option)] = clock.t - started
+    return seconds, chosen
+
+
+def analyze(graph, seconds, chosen, state=game_state):
+    """Walk every path; returns (Span of the whole story, {scene title: Span})."""
+    nodes = graph.nodes
+    skip = graph.skips()
+    # Seconds of the output nodes from i up to skip[i], passed on arrival
+    before = [0.0]
+    for s in seconds:
+        before.append(before[-1] + s)
+    runs = [before[skip[i]] - before[i] for i in range(len(nodes))]
+    titles = {start: title for title, start in graph.scenes}
+    scenes = {}
+    story = None
+
+    def close(title, span):
+        if title in scenes:
+            scenes[title].merge(span)
+        else:
+            scenes[title] = span
+
+    paths = TimedPaths(graph, runs)
+    paths.arrive(0, state, (), [Span(1, 0.0, 0.0, 0.0), Span(1, 0.0, 0.0, 0.0)])
+    title = None
+    for i, groups in paths:
+        node = nodes[i]
+        kind = node[0]
+        for (state, variables), (whole, scene) in groups.items():
+            if kind == END or kind == SCENE:
+                if title is not None:
+                    close(title, scene)
+                if kind == END:
+                    if story is None:
+                        story = whole
+                    else:
+                        story.merge(whole)
+                    continue
+                fresh = Span(scene.count, 0.0, 0.0, 0.0)
+                paths.arrive(i + 1, state, (), [whole, fresh])
+            elif kind == CHOICE:
+                for option in range(len(node[2])):
+                    extra = chosen[(i, option)]
+                    paths.arrive(i + 1, state, assign(variables, node[1], option),
+                                 [whole.later(extra, option), scene.later(extra)])
+            elif kind == RANDOM:
+                for option in node[2]:
+                    paths.arrive(i + 1, state, assign(variables, node[1], option),
+                                 [whole.later(0.0, option), scene])
+            else:
+                paths.follow(i, state, variables, [whole, scene])
+        if kind == SCENE:
+            title = titles[i]
+    return story, scenes
+
+
+# -----------------------------------------------------------------------------
+
+
+def _minutes(seconds):
+    return f"{int(seconds // 60)}:{seconds % 60:04.1f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scripted reading time of every path")
+    parser.add_argument("--names", nargs=2, default=["Player 1", "Player 2"],
+                        help="player names, which the intro types out")
+    parser.add_argument("--characters", nargs=2, default=["1", "2"])
+    args = parser.parse_args()
+
+    graph = load_story()
+    started = time.perf_counter()
+    seconds, chosen = measure(graph, args.names, args.characters)
+    story, scenes = analyze(graph, seconds, chosen)
+    elapsed = time.perf_counter() - started
+
+    print(f"{story.count} paths, timed in {elapsed * 1e3:.0f} ms (minutes:seconds)\n")
+    print(f"  shortest  {_minutes(story.shortest):>9}   choices {' '.join(map(str, story.fastest))}")
+    print(f"  mean      {_minutes(story.mean):>9}")
+    print(f"  longest   {_minutes(story.longest):>9}   choices {' '.join(map(str, story.slowest))}")
+
+    print("\nscenes, slowest first:")
+    print(f"  {'scene':<34}{'shortest':>10}{'mean':>10}{'longest':>10}")
+    for title, span in sorted(scenes.items(), key=lambda item: -item[1].longest):
+        print(f"  {title[:33]:<34}{_minutes(span.shortest):>10}{_minutes(span.mean):>10}"
+              f"{_minutes(span.longest):>10}")
+
+
+if __name__ == "__main__":
+    main()
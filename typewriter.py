@@ -0,0 +1,51 @@
+# Typewriter Renderer
+# Drives every delay_print speed from one deadline schedule and batches
+# all characters that fall due in the same frame into a single write.
+#
+# At the default 60 Hz frame this saves nothing: the story's fastest speed
+# is 25 ms a character, longer than a frame, so every character is still
+# its own write. Fewer writes take a longer frame (--frame), worth it where
+# each write costs a packet, as over ssh; see benchmarks/bench_typewriter.py.
+
+import sys
+
+from pacing import PacingClock
+
+# One frame at 60 Hz: as smooth as the screen, but no batching at the
+# story's speeds
+FRAME = 1 / 60
+
+
+class Typewriter:
+    """Print text character by character, one write + flush per frame."""
+
+    def __init__(self, out=None, frame=FRAME, clock=None):
+        self.out = out  # None means whatever sys.stdout is at print time
+        self.frame = frame
+        self.clock = clock or PacingClock()
+
+    def type(self, s, delay):
+        """Type out s, character k being due at start + k * delay."""
+        out = self.out or sys.stdout
+        clock = self.clock
+        for text, due in self.frames(s, delay):
+            out.write(text)
+            out.flush()
+            clock.sleep_until(due)
+
+    def frames(self, s, delay):
+        """Yield (text, deadline) per frame of typing s: write the text, then
+        wait for the deadline before asking for the next frame. Lets callers
+        that can't block (the server) do the waiting their own way."""
+        clock = self.clock
+        start, end = clock.schedule(len(s) * delay)
+        i, n = 0, len(s)
+        while i < n:
+            if delay > 0:
+                # Everything due before the end of this frame goes out now
+                ahead = clock.now() - start + self.frame
+                j = min(n, max(i + 1, int(ahead / delay) + 1))
+            else:
+                j = n
+            yield s[i:j], start + j * delay
+            i = j